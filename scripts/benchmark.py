@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the build engine.
+
+Generates synthetic portfolios (projects, skills with aliases, PyPI packages)
+at configurable scales, times the main build stages and appends the results
+to a JSON-lines file so runs can be compared across commits.
+
+    python -m scripts.benchmark --scale small medium
+    python -m scripts.benchmark --scale large --repeat 1 --compare
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import tomli_w
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_DIR = REPO_ROOT / "src" / "github_is_my_cms"
+SAMPLE_DIR = REPO_ROOT / "data_sample"
+DEFAULT_RESULTS = REPO_ROOT / ".benchmarks" / "results.jsonl"
+
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from github_is_my_cms import cli  # noqa: E402
+from github_is_my_cms.build_context import BuildContext  # noqa: E402
+from github_is_my_cms.builder import SiteBuilder  # noqa: E402
+from github_is_my_cms.builder_api import SiteBuilderAPI  # noqa: E402
+from github_is_my_cms.config import ConfigLoader  # noqa: E402
+
+
+@dataclass(frozen=True)
+class Scale:
+    projects: int
+    skills: int
+    packages: int
+
+
+SCALES = {
+    "small": Scale(projects=100, skills=50, packages=200),
+    "medium": Scale(projects=1_000, skills=200, packages=1_000),
+    "large": Scale(projects=10_000, skills=500, packages=2_000),
+}
+
+LANGUAGES = ["Python", "Go", "Rust", "TypeScript", "Shell", "Java", "C#", "Ruby"]
+
+
+def generate_portfolio(root: Path, scale: Scale, seed: int = 0) -> None:
+    """Writes a synthetic data/ tree plus the theme it builds with under root."""
+    rng = random.Random(seed)
+    data_dir = root / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    # Real identity, mode and experience data; synthetic bulk collections
+    shutil.copy(SAMPLE_DIR / "readme_cms.toml", root / "readme_cms.toml")
+    for name in ("identity.toml", "work_experience.toml", "resumes.toml"):
+        shutil.copy(SAMPLE_DIR / name, data_dir / name)
+    shutil.copytree(
+        PACKAGE_DIR / "templates", root / "src" / "github_is_my_cms" / "templates"
+    )
+    content_dir = REPO_ROOT / "src" / "content"
+    if content_dir.exists():
+        shutil.copytree(content_dir, root / "src" / "content")
+
+    skill_names = [f"skill-{i:04}" for i in range(scale.skills)]
+    # Each skill has two aliases, so tag matching goes through the alias index
+    tags_pool = skill_names + [f"{s}-alias-{n}" for s in skill_names for n in (1, 2)]
+    tags_pool += [f"misc-{i}" for i in range(scale.skills)]
+
+    categories = max(1, scale.skills // 25)
+    skills = [
+        {
+            "category": f"Category {c}",
+            "skills": [
+                {
+                    "name": name,
+                    "aliases": [f"{name}-alias-1", f"{name}-alias-2"],
+                    "featured": rng.random() < 0.1,
+                }
+                for name in skill_names[c::categories]
+            ],
+        }
+        for c in range(categories)
+    ]
+    _write_toml(data_dir / "skills.toml", {"skills": skills})
+
+    projects = []
+    for i in range(scale.projects):
+        slug = f"project-{i:05}"
+        projects.append(
+            {
+                "slug": slug,
+                "name": slug.replace("-", " ").title(),
+                "description": f"Synthetic project number {i}",
+                "url": f"https://github.com/bench/{slug}",
+                "repository_url": f"https://github.com/bench/{slug}",
+                "tags": rng.sample(tags_pool, k=min(5, len(tags_pool))),
+                "status": rng.choice(["active", "active", "active", "archived"]),
+                "primary_language": rng.choice(LANGUAGES),
+                "cms": {"suppress": False, "package_links": []},
+            }
+        )
+    _write_toml(data_dir / "projects.toml", {"projects": projects})
+
+    packages = [
+        {
+            "package_name": f"bench-package-{i:05}",
+            "version": f"1.{i % 10}.{i % 7}",
+            "summary": f"Synthetic package number {i}",
+            "downloads_monthly": rng.randint(0, 100_000),
+            "last_updated": "2025-01-01",
+            "github_repo": f"bench/project-{rng.randrange(scale.projects):05}",
+            "tags": rng.sample(tags_pool, k=min(3, len(tags_pool))),
+        }
+        for i in range(scale.packages)
+    ]
+    _write_toml(data_dir / "pypi_projects.toml", {"packages": packages})
+
+
+def _write_toml(path: Path, payload: Dict[str, Any]) -> None:
+    path.write_text(tomli_w.dumps(payload), encoding="utf-8")
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        # The builder and the CLI print progress; keep it out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return {"min_ms": min(samples), "median_ms": statistics.median(samples)}
+
+
+def run_scale(name: str, scale: Scale, repeat: int, jobs: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix=f"gimc-bench-{name}-") as tmp:
+        root = Path(tmp)
+        generate_portfolio(root, scale)
+        config = ConfigLoader(root, use_snapshot=False).load()
+        # Writes the snapshot, so config_load_snapshot measures a hit
+        ConfigLoader(root).load()
+
+        def map_relationships() -> None:
+            SiteBuilder(
+                context=BuildContext(str(root), config=config)
+            )._map_relationships()
+
+        api_builder = SiteBuilderAPI(context=BuildContext(str(root), config=config))
+        build_args = [
+            "--root",
+            str(root),
+            "--log-level",
+            "ERROR",
+            "build",
+            "--jobs",
+            str(jobs),
+        ]
+
+        timings = {
+            "config_load": _time(ConfigLoader(root, use_snapshot=False).load, repeat),
+            "config_load_snapshot": _time(ConfigLoader(root).load, repeat),
+            "map_relationships": _time(map_relationships, repeat),
+            "build_static_api": _time(api_builder.build_static_api, repeat),
+            "cmd_build": _time(lambda: cli.main(build_args), repeat),
+            "cmd_build_incremental_noop": _time(
+                lambda: cli.main(build_args + ["--incremental"]), repeat
+            ),
+        }
+    return {"scale": name, "sizes": scale.__dict__, "jobs": jobs, "timings": timings}
+
+
+def _git(*args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=False
+    )
+    return result.stdout.strip()
+
+
+def _previous(results_file: Path, scale: str, jobs: int) -> Optional[Dict[str, Any]]:
+    if not results_file.exists():
+        return None
+    previous = None
+    for line in results_file.read_text(encoding="utf-8").splitlines():
+        record = json.loads(line)
+        if record["scale"] == scale and record["jobs"] == jobs:
+            previous = record
+    return previous
+
+
+def _report(record: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> str:
+    header = f"{record['scale']} {record['sizes']} @ {record['commit'][:10]}"
+    if previous:
+        header += f" (vs {previous['commit'][:10]})"
+    lines = [header]
+    for stage, timing in record["timings"].items():
+        line = f"  {stage:<28} {timing['min_ms']:>10.1f} ms"
+        before = (previous or {}).get("timings", {}).get(stage)
+        if before:
+            change = (timing["min_ms"] - before["min_ms"]) / before["min_ms"] * 100
+            line += f"   {before['min_ms']:>10.1f} ms  {change:+6.1f}%"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", nargs="+", choices=sorted(SCALES), default=["small"])
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per stage (best is kept)."
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Render processes for cmd_build."
+    )
+    parser.add_argument("--results", type=Path, default=DEFAULT_RESULTS)
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Show the change against the last stored run.",
+    )
+    parser.add_argument("--no-save", action="store_true", help="Do not store this run.")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    for name in args.scale:
+        record = run_scale(name, SCALES[name], args.repeat, args.jobs)
+        record.update(
+            {
+                "commit": _git("rev-parse", "HEAD") or "unknown",
+                "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+            }
+        )
+        previous = _previous(args.results, name, args.jobs) if args.compare else None
+        print(_report(record, previous))
+
+        if not args.no_save:
+            args.results.parent.mkdir(parents=True, exist_ok=True)
+            with open(args.results, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
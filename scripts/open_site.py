@@ -18,8 +18,34 @@ def pick_port(host: str) -> int:
         return int(s.getsockname()[1])
 
 
+class PrecompressedHandler(http.server.SimpleHTTPRequestHandler):
+    """Serves the build's <file>.br / <file>.gz in place of <file> when the client accepts it."""
+
+    encodings = (("br", ".br"), ("gzip", ".gz"))
+
+    def send_head(self):
+        path = Path(self.translate_path(self.path))
+        if path.is_dir() and self.path.endswith("/"):
+            path = path / "index.html"
+        accepted = {e.split(";")[0].strip() for e in self.headers.get("Accept-Encoding", "").split(",")}
+        for encoding, suffix in self.encodings:
+            variant = path.with_name(path.name + suffix)
+            if encoding in accepted and path.is_file() and variant.is_file():
+                f = open(variant, "rb")
+                fs = os.fstat(f.fileno())
+                self.send_response(200)
+                self.send_header("Content-Type", self.guess_type(str(path)))
+                self.send_header("Content-Encoding", encoding)
+                self.send_header("Content-Length", str(fs.st_size))
+                self.send_header("Vary", "Accept-Encoding")
+                self.send_header("Last-Modified", self.date_time_string(fs.st_mtime))
+                self.end_headers()
+                return f
+        return super().send_head()
+
+
 def serve_directory(directory: Path, host: str, port: int) -> socketserver.TCPServer:
-    handler = http.server.SimpleHTTPRequestHandler
+    handler = PrecompressedHandler
     # Python 3.7+: handler supports `directory=` to avoid chdir
     httpd = socketserver.TCPServer((host, port), lambda *a, **kw: handler(*a, directory=str(directory), **kw))
     return httpd
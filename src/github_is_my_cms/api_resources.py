@@ -0,0 +1,196 @@
+# src/github_is_my_cms/api_resources.py
+"""
+Declarative registry of the static API collections.
+
+Each collection under docs/apis/ is one ApiResource: where its items come
+from, which field names their file, how they sort, which fields go into the
+lightweight refs and how they relate to other collections. SiteBuilderAPI
+generates every collection from these declarations with the same engine
+(by-key files, index, pages, facet indexes and HATEOAS links), so adding a
+collection is one entry in API_RESOURCES.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .models import CMSConfig, Project
+from .skill_index import SkillIndex
+
+Item = Dict[str, Any]
+
+# Facet values an item falls under, e.g. its tags
+FacetFn = Callable[[Item, "ApiRelations"], Iterable[Optional[str]]]
+
+
+@dataclass(frozen=True)
+class ApiResource:
+    """One collection of the static API."""
+
+    name: str  # URL segment and meta.type, e.g. "projects"
+    lookup: str  # URL segment of the per-item files, e.g. "by-slug"
+    key: str  # item field that names its file
+    source: Callable[[CMSConfig], Iterable[Any]]  # the models to publish
+    sort_key: Callable[[Item], Any]
+    reverse: bool = False
+    hints: Tuple[str, ...] = ()  # item fields copied into each ref
+    relations: Optional[Callable[[Item, "ApiRelations"], Dict[str, List[Item]]]] = None
+    # facet path segment (e.g. "by-tag") -> values of an item
+    facets: Dict[str, FacetFn] = field(default_factory=dict)
+
+    @property
+    def index_href(self) -> str:
+        return f"/apis/{self.name}/index.json"
+
+    def page_href(self, page: int) -> str:
+        return f"/apis/{self.name}/pages/{page}.json"
+
+    def item_href(self, key: str) -> str:
+        return f"/apis/{self.name}/{self.lookup}/{key}.json"
+
+    @property
+    def facets_href(self) -> str:
+        return f"/apis/{self.name}/facets.json"
+
+    def facet_href(self, facet: str, slug: str) -> str:
+        return f"/apis/{self.name}/{facet}/{slug}.json"
+
+    def load(self, config: CMSConfig) -> List[Item]:
+        """The items as plain dicts, in published order."""
+        items = [model.model_dump() for model in self.source(config)]
+        return sorted(items, key=self.sort_key, reverse=self.reverse)
+
+    def ref(self, item: Item) -> Item:
+        return {
+            "ref": self.item_href(item[self.key]),
+            "rel": "item",
+            **{field: item.get(field) for field in self.hints},
+        }
+
+
+def parse_owner_repo(repo_url: Optional[str]) -> Optional[str]:
+    """
+    "owner/repo" (lowercased) from a GitHub URL, best effort. Only used for
+    lightweight relationships; if parsing fails, relationships are omitted.
+    """
+    if not repo_url:
+        return None
+    s = str(repo_url).strip()
+    # Accept https://github.com/owner/repo or http://...; ignore extra segments.
+    marker = "github.com/"
+    idx = s.lower().find(marker)
+    if idx == -1:
+        return None
+    tail = s[idx + len(marker) :]
+    parts = [p for p in tail.split("/") if p]
+    if len(parts) < 2:
+        return None
+    return f"{parts[0]}/{parts[1]}".lower()
+
+
+class ApiRelations:
+    """Cross-collection lookups, built once from the loaded (sorted) items."""
+
+    def __init__(
+        self, items: Dict[str, List[Item]], skill_index: Optional[SkillIndex] = None
+    ):
+        # github_repo ("owner/repo") -> [package_name]
+        self.repo_to_packages: Dict[str, List[str]] = {}
+        for pkg in items.get("pypi", []):
+            gr = (pkg.get("github_repo") or "").strip()
+            if gr:
+                self.repo_to_packages.setdefault(gr.lower(), []).append(
+                    pkg["package_name"]
+                )
+
+        # owner/repo -> project slug; if several, the first stays (stable)
+        self.repo_to_project_slug: Dict[str, str] = {}
+        for p in items.get("projects", []):
+            repo_key = parse_owner_repo(p.get("repository_url"))
+            if repo_key and repo_key not in self.repo_to_project_slug:
+                self.repo_to_project_slug[repo_key] = p["slug"]
+
+        # project slug -> names of the skills it matched (tags, aliases, language)
+        self.project_skills: Dict[str, List[str]] = {}
+        if skill_index is not None:
+            for skill_name, matches in skill_index.projects_by_skill.items():
+                for match in matches:
+                    if isinstance(match, Project):
+                        self.project_skills.setdefault(match.slug, []).append(
+                            skill_name
+                        )
+
+    @staticmethod
+    def ref(resource_name: str, key: str) -> Item:
+        return {
+            "ref": RESOURCES_BY_NAME[resource_name].item_href(key),
+            "rel": "related",
+        }
+
+
+def _project_relations(project: Item, relations: ApiRelations) -> Dict[str, List[Item]]:
+    repo_key = parse_owner_repo(project.get("repository_url"))
+    related_pypi = relations.repo_to_packages.get(repo_key, []) if repo_key else []
+    return {"pypi_packages": [relations.ref("pypi", name) for name in related_pypi]}
+
+
+def _package_relations(package: Item, relations: ApiRelations) -> Dict[str, List[Item]]:
+    repo_key = (package.get("github_repo") or "").strip().lower() or None
+    slug = relations.repo_to_project_slug.get(repo_key) if repo_key else None
+    return {"github_project": [relations.ref("projects", slug)] if slug else []}
+
+
+API_RESOURCES: List[ApiResource] = [
+    ApiResource(
+        name="projects",
+        lookup="by-slug",
+        key="slug",
+        source=lambda config: config.projects,
+        sort_key=lambda p: (p.get("slug") or "").lower(),
+        hints=("name", "status"),
+        relations=_project_relations,
+        facets={
+            "by-tag": lambda p, _: p.get("tags") or [],
+            "by-language": lambda p, _: [p.get("primary_language")],
+            "by-status": lambda p, _: [p.get("status")],
+            "by-group": lambda p, _: [p.get("group")],
+            "by-skill": lambda p, relations: relations.project_skills.get(
+                p["slug"], []
+            ),
+        },
+    ),
+    ApiResource(
+        name="pypi",
+        lookup="by-name",
+        key="package_name",
+        source=lambda config: config.pypi_packages,
+        sort_key=lambda p: (p.get("package_name") or "").lower(),
+        hints=("package_name", "version"),
+        relations=_package_relations,
+    ),
+    ApiResource(
+        name="experience",
+        lookup="by-id",
+        key="id",
+        source=lambda config: config.work_experience,
+        sort_key=lambda e: (e.get("start_date") or "", e.get("id") or ""),
+        reverse=True,
+        hints=("organization", "title", "end_date"),
+    ),
+    ApiResource(
+        name="resumes",
+        lookup="by-id",
+        key="id",
+        source=lambda config: config.resumes,
+        sort_key=lambda r: (
+            r.get("status") != "active",
+            r.get("valid_from") or "",
+            r.get("id") or "",
+        ),
+        reverse=True,
+        hints=("label", "status", "format"),
+    ),
+]
+
+RESOURCES_BY_NAME: Dict[str, ApiResource] = {r.name: r for r in API_RESOURCES}
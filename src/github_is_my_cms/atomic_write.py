@@ -0,0 +1,139 @@
+# src/github_is_my_cms/atomic_write.py
+"""
+Crash-safe file writes.
+
+Data is written to a temp file in the target's directory, flushed and
+fsynced, then renamed over the target. Readers (and concurrent writers, e.g.
+parallel CI jobs) see either the old file or the new one, never a truncated
+mix. Optionally the previous version is kept as <name>.bak.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional
+
+BACKUP_SUFFIX = ".bak"
+
+# mkstemp creates files as 0600; new files get the conventional rw-r--r--.
+# A fixed mode, because reading the umask means briefly changing it for the
+# whole process, and files other threads create in that window would be 0666.
+NEW_FILE_MODE = 0o644
+
+
+def backup_path(path: Path) -> Path:
+    return path.with_name(path.name + BACKUP_SUFFIX)
+
+
+def atomic_write_bytes(
+    path: Path, data: bytes, backup: bool = False, fsync: bool = True
+) -> None:
+    """
+    Atomically replaces `path` with `data`.
+
+    Args:
+        path: The file to write.
+        data: The complete new content.
+        backup: Keep the current file (if any) as <name>.bak first.
+        fsync: Flush the data and the rename to disk. Regenerable outputs
+            can skip this; hand-curated data should not.
+    """
+    atomic_write_chunks(path, (data,), backup=backup, fsync=fsync)
+
+
+def atomic_write_chunks(
+    path: Path,
+    chunks: Iterable[bytes],
+    backup: bool = False,
+    fsync: bool = True,
+    skip_unchanged: bool = False,
+) -> int:
+    """
+    Atomically replaces `path` with the concatenated `chunks`, holding only
+    one chunk in memory at a time.
+
+    With skip_unchanged, the current file is compared chunk by chunk as the
+    new content streams past; if they turn out identical the temp file is
+    dropped and `path` is left untouched.
+
+    Returns:
+        The number of bytes written, or -1 if skipped as unchanged.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = NEW_FILE_MODE
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    current = _open_existing(path) if skip_unchanged else None
+    same = current is not None
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                size += len(chunk)
+                if same:
+                    same = current.read(len(chunk)) == chunk
+            if same:
+                same = current.read(1) == b""
+            if not same and fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        if same:
+            Path(tmp_name).unlink()
+            return -1
+        if backup and path.exists():
+            _copy_atomically(path, backup_path(path))
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    finally:
+        if current is not None:
+            current.close()
+
+    if fsync:
+        _fsync_directory(path.parent)
+    return size
+
+
+def atomic_write_text(
+    path: Path, text: str, backup: bool = False, fsync: bool = True
+) -> None:
+    atomic_write_bytes(path, text.encode("utf-8"), backup=backup, fsync=fsync)
+
+
+def _open_existing(path: Path) -> Optional[BinaryIO]:
+    try:
+        return open(path, "rb")
+    except FileNotFoundError:
+        return None
+
+
+def _copy_atomically(source: Path, target: Path) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    os.close(fd)
+    try:
+        shutil.copy2(source, tmp_name)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persists the rename itself (POSIX only; Windows cannot open directories)."""
+    if os.name != "posix":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,225 @@
+# src/github_is_my_cms/build_context.py
+"""
+Shared state for one build of the README CMS.
+Loads and validates the CMSConfig once and owns the objects derived from it
+(paths, the pre-processed project lists and the Jinja environment), so the
+Markdown, HTML, skill-page and static-API stages all work from one instance.
+"""
+
+from __future__ import annotations
+
+import datetime
+import logging
+import os
+import re
+from collections import defaultdict
+from functools import cached_property
+from pathlib import Path
+from typing import Optional
+
+from jinja2 import Environment, select_autoescape
+
+from .config import load_config
+from .models import CMSConfig
+from .output_writer import OutputWriter
+from .profiling import stage
+from .skill_index import SkillIndex
+from .template_cache import bytecode_cache, compile_theme, theme_loader
+
+logger = logging.getLogger(__name__)
+
+
+def _generation_time() -> datetime.datetime:
+    """
+    The build timestamp shown on pages. Honours SOURCE_DATE_EPOCH so repeated
+    builds of the same inputs produce byte-identical (and so unwritten) pages.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        return datetime.datetime.fromtimestamp(int(epoch))
+    return datetime.datetime.now()
+
+
+class BuildContext:
+    """
+    The single config load and object graph handed to every build stage.
+    """
+
+    def __init__(
+        self,
+        root_dir: str = ".",
+        config: Optional[CMSConfig] = None,
+        writer: Optional[OutputWriter] = None,
+    ):
+        self.root = Path(root_dir)
+
+        # Load Configuration (Data Layer) - once per build
+        with stage("config load"):
+            self.config: CMSConfig = (
+                config if config is not None else load_config(str(self.root))
+            )
+
+        # TODO: this is messed up. It should be from editable installation or package.
+        self.src = self.root / "src"
+        self.content_dir = self.src / "content"
+        self.templates_dir = (
+            self.src / "github_is_my_cms" / "templates" / self.config.theme
+        )
+
+        # Output directories
+        self.docs_dir = self.root / "docs"
+        self.md_out = self.docs_dir / "md"
+        self.api_out = self.docs_dir / "apis"
+        self.html_out = self.docs_dir  # HTML sits in root of docs/ for GitHub Pages
+
+        # Every stage writes through here so unchanged files are left alone
+        self.writer = writer if writer is not None else OutputWriter()
+
+        # Setup Jinja2 Environment
+        # (precompiled theme if available, compiled bytecode cached in .cache/jinja)
+        self.env = Environment(
+            loader=theme_loader(self.root, self.config.theme, self.templates_dir),
+            bytecode_cache=bytecode_cache(self.root),
+            autoescape=select_autoescape(["html", "xml"]),
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+
+        self._prepare()
+
+    def _prepare(self) -> None:
+        """
+        Pre-processing that every stage relies on: featured flags, archive
+        filtering, sorting, grouping and the Jinja globals.
+        """
+        # APPLY FEATURED LOGIC (NEW)
+        with stage("_apply_featured_status"):
+            self._apply_featured_status()
+
+        # Filter based on "Hide Archived" config
+        raw_projects = self.config.projects
+        should_hide_archived = getattr(
+            self.config.current_mode_settings, "hide_archived", False
+        )
+
+        if should_hide_archived:
+            logger.info("Mode setting 'hide_archived' is ON. Filtering list.")
+            visible_projects = [p for p in raw_projects if p.status != "archived"]
+        else:
+            visible_projects = raw_projects
+
+        # Sort projects (Featured first, then Alphabetical)
+        visible_projects.sort(key=lambda x: (not x.featured, x.name.lower()))
+
+        # Extract Featured Projects
+        featured_projects = [p for p in visible_projects if p.featured]
+
+        # Create Groups
+        # Structure: { "Group Name": [Project, Project], ... }
+        projects_by_group = defaultdict(list)
+        for p in visible_projects:
+            # Fallback if group is missing in data (though model defaults to 'Other')
+            g = p.group if p.group else "Other"
+            projects_by_group[g].append(p)
+
+        # Inject Globals and Helpers
+        # Overwrite the raw list with the filtered list
+        self.env.globals["projects"] = visible_projects
+
+        # Add new convenience lists
+        self.env.globals["featured_projects"] = featured_projects
+        self.env.globals["projects_by_group"] = dict(
+            projects_by_group
+        )  # convert to standard dict
+
+        self.refresh_generation()
+
+        self.env.globals["config"] = self.config
+        self.env.globals["identity"] = self.config.identity
+        self.env.globals["mode"] = self.config.current_mode_settings
+        self.env.globals["pypi"] = self.config.pypi_packages
+
+        self.env.globals["work_experience"] = self.config.work_experience
+        self.env.globals["resumes"] = self.config.resumes
+
+        # Helper to include raw markdown content from src/content/
+        self.env.globals["include_content"] = self._read_content_file
+
+    def refresh_generation(self) -> None:
+        """Stamps pages rendered from now on with the current build time."""
+        self.env.globals["generation"] = {"generated_at": _generation_time()}
+
+    def compile_theme(self) -> Path:
+        """Precompiles the active theme; later builds load it as Python modules."""
+        return compile_theme(self.env, self.root, self.config.theme, self.templates_dir)
+
+    @cached_property
+    def skill_index(self) -> SkillIndex:
+        """The skill/tag inverted index, built on first use and reused by every stage."""
+        with stage("skill index"):
+            return SkillIndex(self.config)
+
+    def _read_content_file(self, filename: str) -> str:
+        """
+        Helper for Jinja templates to pull in raw content.
+        Example usage in template: {{ include_content('pages/about.md') }}
+        """
+        file_path = self.content_dir / filename
+        if not file_path.exists():
+            return ""
+        return file_path.read_text(encoding="utf-8")
+
+    def _normalize_name_match(self, name: str) -> str:
+        """
+        Normalizes a project name for comparison.
+        Case insensitive, treats '-' and '_' as identical.
+        Example: "Bash2Gitlab" -> "bash2gitlab", "naive_linkbacks" -> "naivelinkbacks"
+        """
+        if not name:
+            return ""
+        # Remove both - and _ to make them strictly equivalent
+        return re.sub(r"[-_]", "", name.lower())
+
+    def _apply_featured_status(self):
+        """
+        Updates the .featured boolean on all Projects and PyPI packages
+        based on the list defined in identity.toml for the CURRENT mode.
+        """
+        mode = self.config.modes.current
+        identity = self.config.identity
+
+        # Determine which list of strings to use
+        target_list = []
+        if mode == "job_hunting":
+            target_list = identity.job_hunting_projects
+        elif mode == "project_promotion":
+            target_list = identity.project_promotion
+        elif mode == "self_promotion":
+            # If self_promotion logic isn't strictly defined, fallback or use identity_projects
+            target_list = identity.identity_projects
+        else:
+            # Fallback
+            target_list = identity.project_promotion
+
+        # Create a set of normalized names for O(1) lookup
+        featured_slugs = {self._normalize_name_match(name) for name in target_list}
+
+        logger.info(
+            f"Applying featured status for mode '{mode}'. {len(featured_slugs)} targets found."
+        )
+
+        # Apply to GitHub Projects
+        for proj in self.config.projects:
+            norm_name = self._normalize_name_match(proj.name)
+            if norm_name in featured_slugs:
+                proj.featured = True
+            else:
+                # IMPORTANT: Reset to False if not in the list, so mode switches work cleanly
+                proj.featured = False
+
+        # Apply to PyPI Packages (if you want stars there too)
+        # Note: PyPIPackage model doesn't explicitly have 'featured',
+        # but Python allows setting dynamic attributes or you can add it to the model.
+        for pkg in self.config.pypi_packages:
+            norm_name = self._normalize_name_match(pkg.package_name)
+            # Dynamically set attribute for template usage
@@ -4,177 +4,174 @@ The core build engine for the README CMS.
 Compiles Jinja templates + TOML data + Markdown content into final artifacts.
 """
 
-import datetime
 import logging
-import math
-import re
-import shutil
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-import orjson
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from pydantic import HttpUrl
-
-from .config import load_config
+from .build_context import BuildContext
+from .compression import ENCODINGS
 from .models import CMSConfig
+from .precompress import Precompressor
+from .profiling import stage
 
 logger = logging.getLogger(__name__)
 
+# (template name, template variables, target path)
+RenderJob = Tuple[str, Dict[str, Any], Path]
 
-class SiteBuilder:
-    """
-    Orchestrates the generation of Markdown, HTML, and Static API files.
-    """
+# Per-process state of render pool workers
+_worker_context: Optional[BuildContext] = None
 
-    def __init__(self, root_dir: str = "."):
-        self.root = Path(root_dir)
 
-        self.projects_by_skill = {}
+def _init_render_worker(
+    root_dir: str, config: CMSConfig, shared_globals: Dict[str, Any]
+) -> None:
+    global _worker_context
+    _worker_context = BuildContext(root_dir, config=config)
+    _worker_context.env.globals.update(shared_globals)
 
-        # Load Configuration (Data Layer)
-        self.config: CMSConfig = load_config(str(self.root))
 
-        # TODO: this is messed up. It should be from editable installation or package.
-        self.src = self.root / "src"
-        self.content_dir = self.src / "content"
-        self.templates_dir = (
-            self.src / "github_is_my_cms" / "templates" / self.config.theme
-        )
+def _render_in_worker(template_name: str, variables: Dict[str, Any]) -> str:
+    assert _worker_context is not None, "render worker was not initialized"
+    return _worker_context.env.get_template(template_name).render(**variables)
 
-        # Output directories
-        self.docs_dir = self.root / "docs"
-        self.md_out = self.docs_dir / "md"
-        self.api_out = self.docs_dir / "apis"
-        self.html_out = self.docs_dir  # HTML sits in root of docs/ for GitHub Pages
-
-        # Setup Jinja2 Environment
-        self.env = Environment(
-            loader=FileSystemLoader(self.templates_dir),
-            autoescape=select_autoescape(["html", "xml"]),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
 
-        # --- PRE-PROCESSING LOGIC ---
+class SiteBuilder:
+    """
+    Orchestrates the generation of Markdown, HTML, and Static API files.
+    """
 
-        # APPLY FEATURED LOGIC (NEW)
-        self._apply_featured_status()
+    def __init__(
+        self,
+        root_dir: str = ".",
+        context: Optional[BuildContext] = None,
+        jobs: int = 1,
+    ):
+        # Share one config load and Jinja environment across all build stages
+        self.context = context if context is not None else BuildContext(root_dir)
+        self.root = self.context.root
 
-        # Filter based on "Hide Archived" config
-        raw_projects = self.config.projects
-        should_hide_archived = getattr(
-            self.config.current_mode_settings, "hide_archived", False
-        )
+        # Number of worker processes for template rendering (1 = in-process)
+        self.jobs = max(1, jobs)
+        self._pool: Optional[ProcessPoolExecutor] = None
 
-        if should_hide_archived:
-            logger.info("Mode setting 'hide_archived' is ON. Filtering list.")
-            visible_projects = [p for p in raw_projects if p.status != "archived"]
-        else:
-            visible_projects = raw_projects
+        self.projects_by_skill = {}
+
+        # Every file written by this builder, in write order.
+        # Used by the incremental build to record the outputs of each build unit.
+        self.written_files: list[Path] = []
+        # Template name -> the outputs rendered from it
+        self.written_by_template: Dict[str, List[Path]] = {}
 
-        # Sort projects (Featured first, then Alphabetical)
-        visible_projects.sort(key=lambda x: (not x.featured, x.name.lower()))
+        self.config: CMSConfig = self.context.config
 
-        # Extract Featured Projects
-        featured_projects = [p for p in visible_projects if p.featured]
+        self.src = self.context.src
+        self.content_dir = self.context.content_dir
+        self.templates_dir = self.context.templates_dir
 
-        # Create Groups
-        # Structure: { "Group Name": [Project, Project], ... }
-        projects_by_group = defaultdict(list)
-        for p in visible_projects:
-            # Fallback if group is missing in data (though model defaults to 'Other')
-            g = p.group if p.group else "Other"
-            projects_by_group[g].append(p)
+        # Output directories
+        self.docs_dir = self.context.docs_dir
+        self.md_out = self.context.md_out
+        self.api_out = self.context.api_out
+        self.html_out = self.context.html_out
 
-        # Inject Globals and Helpers
-        # Overwrite the raw list with the filtered list
-        self.env.globals["projects"] = visible_projects
+        self.env = self.context.env
 
-        # Add new convenience lists
-        self.env.globals["featured_projects"] = featured_projects
-        self.env.globals["projects_by_group"] = dict(
-            projects_by_group
-        )  # convert to standard dict
+    def _write_output(self, path: Path, content: str) -> None:
+        """
+        Writes a generated artifact (skipped if the file already has this content)
+        and records it as a build output.
+        """
+        self._write_output_bytes(path, content.encode("utf-8"))
 
-        self.env.globals["generation"] = {"generated_at": datetime.datetime.now()}
+    def _write_output_bytes(self, path: Path, data: bytes) -> None:
+        self.context.writer.write_bytes(path, data)
+        self.written_files.append(path)
 
-        self.env.globals["config"] = self.config
-        self.env.globals["identity"] = self.config.identity
-        self.env.globals["mode"] = self.config.current_mode_settings
-        self.env.globals["pypi"] = self.config.pypi_packages
+    def _write_output_chunks(self, path: Path, chunks: Iterable[bytes]) -> None:
+        self.context.writer.write_chunks(path, chunks)
+        self.written_files.append(path)
 
-        self.env.globals["work_experience"] = self.config.work_experience
-        self.env.globals["resumes"] = self.config.resumes
+    def _render_many(self, jobs: List[RenderJob]) -> None:
+        """
+        Renders (template name, variables, target path) jobs and writes the results.
+        With jobs > 1, renders run in a process pool and writes in a thread pool.
+        A target claimed by an earlier job is skipped: written twice, its content
+        would depend on write order.
+        """
+        targets: Set[Path] = set()
+        unique_jobs: List[RenderJob] = []
+        for job in jobs:
+            if job[2] in targets:
+                logger.warning(f"Skipping duplicate render target {job[2]}")
+                continue
+            targets.add(job[2])
+            unique_jobs.append(job)
+        jobs = unique_jobs
+
+        for template_name, _, target in jobs:
+            self.written_by_template.setdefault(template_name, []).append(target)
+
+        if self.jobs <= 1 or len(jobs) < 2:
+            for template_name, variables, target in jobs:
+                with stage(f"render {template_name}", "template"):
+                    template = self.env.get_template(template_name)
+                    self._write_output(target, template.render(**variables))
+            return
 
-        # Helper to include raw markdown content from src/content/
-        self.env.globals["include_content"] = self._read_content_file
+        with stage(f"render pool ({len(jobs)} pages)", "template"):
+            self._render_in_pool(jobs)
+
+    def _render_in_pool(self, jobs: List[RenderJob]) -> None:
+        pool = self._render_pool()
+        chunksize = max(1, len(jobs) // (self.jobs * 4))
+        rendered = pool.map(
+            _render_in_worker,
+            [template_name for template_name, _, _ in jobs],
+            [variables for _, variables, _ in jobs],
+            chunksize=chunksize,
+        )
+        with ThreadPoolExecutor(max_workers=self.jobs) as io_pool:
+            list(io_pool.map(self._write_output, [t for _, _, t in jobs], rendered))
+
+    def _render_pool(self) -> ProcessPoolExecutor:
+        """Lazily starts worker processes, each holding a snapshot of the config."""
+        if self._pool is None:
+            # Globals a fresh BuildContext would not reproduce on its own
+            shared_globals = {
+                key: self.env.globals[key]
+                for key in ("generation", "skill_lookup_map")
+                if key in self.env.globals
+            }
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.jobs,
+                initializer=_init_render_worker,
+                initargs=(str(self.root), self.config, shared_globals),
+            )
+        return self._pool
 
-    # Add this helper method
-    def _slugify(self, text: str) -> str:
-        return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+    def close(self) -> None:
+        """Shuts down the render pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
 
     def _map_relationships(self):
         """
         Matches Skills to Projects using Name + Aliases.
+        Lookups come from the inverted SkillIndex, built once per config.
         """
         logger.info("-> Mapping Data Relationships...")
 
-        self.projects_by_skill = {}
-
-        # 1. Create a "Lookup Map" for resume linking later
-        # Maps "alias" -> "canonical_skill_slug"
-        # e.g. {"psql": "postgres", "postgresql": "postgres"}
-        self.skill_lookup_map = {}
-
-        # Combine all searchable items
-        all_content_items = self.config.projects + self.config.pypi_packages
-
-        for group in self.config.identity.skills:
-            for skill in group.skills:
-                skill_slug = self._slugify(skill.name)
-                skill.page_slug = skill_slug
-
-                # 2. Build the Search Set for this skill
-                # Normalize to lowercase for case-insensitive matching
-                search_terms = {skill.name.lower()}
-                if skill.aliases:
-                    search_terms.update(t.lower() for t in skill.aliases)
-
-                # Populate the lookup map for Work Experience linking
-                for term in search_terms:
-                    self.skill_lookup_map[term] = skill_slug
-
-                matching_items = []
-
-                for item in all_content_items:
-                    # 3. Gather all "tags" from the item
-                    item_tags = set()
+        index = self.context.skill_index
 
-                    # Add Explicit Tags
-                    if hasattr(item, "tags") and item.tags:
-                        item_tags.update(t.lower() for t in item.tags)
+        self.projects_by_skill = index.projects_by_skill
+        # Skill name -> page slug, unique, so no two skills share a page
+        self.skill_slugs = index.skill_slugs
 
-                    # Add Primary Language (for GitHub)
-                    if hasattr(item, "primary_language") and item.primary_language:
-                        item_tags.add(item.primary_language.lower())
-
-                    # Add Implicit Python for PyPI
-                    if hasattr(item, "package_name"):  # It's a PyPI package
-                        item_tags.add("python")
-
-                    # 4. INTERSECTION: Do any search terms exist in item tags?
-                    if not search_terms.isdisjoint(item_tags):
-                        matching_items.append(item)
-
-                    # 5. Check Manual Overrides (related_skills)
-                    if hasattr(item, "related_skills") and item.related_skills:
-                        if skill.name in item.related_skills:
-                            if item not in matching_items:
-                                matching_items.append(item)
-
-                if matching_items:
-                    self.projects_by_skill[skill.name] = matching_items
+        # "Lookup Map" for resume linking: "alias" -> "canonical_skill_slug"
+        self.skill_lookup_map = index.skill_lookup_map
 
         # Inject the lookup map into Jinja globals for use in templates
         self.env.globals["skill_lookup_map"] = self.skill_lookup_map
@@ -190,8 +187,6 @@ class SiteBuilder:
             logger.warning(f"Template {template_name} not found, skipping skill pages.")
             raise Exception()
 
-        template = self.env.get_template(template_name)
-
         # Output directory: docs/skills/
         skills_out = self.html_out / "skills"
         skills_out.mkdir(parents=True, exist_ok=True)
@@ -201,40 +196,81 @@ class SiteBuilder:
         else:
             logger.info(f"Processing {len(self.projects_by_skill)}")
 
+        jobs = []
         for skill_name, specific_projects in self.projects_by_skill.items():
             print(skill_name, len(specific_projects))
-            skill_slug = self._slugify(skill_name)
+            skill_slug = self.skill_slugs[skill_name]
 
             # KEY FIX: passing 'skill_projects' (unique name), not 'projects'
-            rendered = template.render(
-                skill_name=skill_name, skill_projects=specific_projects
-            )
+            variables = {"skill_name": skill_name, "skill_projects": specific_projects}
+            jobs.append((template_name, variables, skills_out / f"{skill_slug}.html"))
 
-            (skills_out / f"{skill_slug}.html").write_text(rendered, encoding="utf-8")
+        self._render_many(jobs)
 
-    def _read_content_file(self, filename: str) -> str:
-        """
-        Helper for Jinja templates to pull in raw content.
-        Example usage in template: {{ include_content('pages/about.md') }}
+    @property
+    def owned_output_dirs(self) -> List[Path]:
+        """Output directories whose every file is produced by the build."""
+        return [self.md_out, self.api_out, self.html_out / "skills"]
+
+    def remove_orphans(
+        self, produced: Iterable[Path], previous: Iterable[Path] = ()
+    ) -> List[Path]:
         """
-        file_path = self.content_dir / filename
-        if not file_path.exists():
-            return ""
-        return file_path.read_text(encoding="utf-8")
+        Deletes outputs that this build no longer produces, leaving the rest in place.
 
-    def clean(self):
+        Files under the owned output dirs are removed unless produced. The docs/
+        root also holds hand-maintained files (resumes/, swagger/, site
+        verification pages), so there only `previous` outputs are candidates.
+        """
+        produced = {p.resolve() for p in produced}
+        # Precompressed siblings live and die with their source
+        produced |= {p.with_name(p.name + s) for p in produced for s in ENCODINGS}
+        candidates = [p.resolve() for p in previous]
+        for directory in self.owned_output_dirs:
+            if directory.exists():
+                candidates.extend(p.resolve() for p in directory.rglob("*"))
+
+        removed = []
+        for path in sorted(set(candidates) - produced):
+            if path.is_file() and self.context.writer.delete(path):
+                logger.info(f"Removed orphaned output {path}")
+                removed.append(path)
+
+        for directory in self.owned_output_dirs:
+            self._prune_empty_dirs(directory)
+        return removed
+
+    def precompress(self, produced: Iterable[Path]) -> None:
         """
-        Cleans output directories to ensure a fresh build.
+        Brings the .gz/.br siblings under docs/ up to date, or removes them
+        when [build] precompress is off.
         """
-        logger.info(f"Cleaning paths: {[self.md_out, self.api_out]}")
-        for path in [self.md_out, self.api_out]:
-            if path.exists():
-                shutil.rmtree(path)
-            path.mkdir(parents=True, exist_ok=True)
+        precompressor = Precompressor(
+            self.docs_dir, self.context.writer, self.jobs, produced
+        )
+        if self.config.build.precompress:
+            precompressor.run()
+        else:
+            precompressor.clear()
 
-    def build_markdown_pages(self):
+    @staticmethod
+    def _prune_empty_dirs(root: Path) -> None:
+        if not root.exists():
+            return
+        # Deepest first, so parents emptied by their children go too
+        for directory in sorted(
+            (p for p in root.rglob("*") if p.is_dir()),
+            key=lambda p: len(p.parts),
+            reverse=True,
+        ):
+            if not any(directory.iterdir()):
+                directory.rmdir()
+
+    def build_markdown_pages(self, only: set[str] | None = None):
         """
         Compiles templates/pages/*.md.j2 into docs/md/*.md
+
+        If `only` is given, just those template names are rendered.
         """
         self._map_relationships()
         logger.info(
@@ -246,32 +282,32 @@ class SiteBuilder:
             logger.warning("Warning: No pages templates found.")
             return
 
-        count = 0
+        jobs = []
         for template_path in pages_dir.glob("*.md.j2"):
             template_name = template_path.name
+            if only is not None and template_name not in only:
+                continue
             target_name = template_name.replace(".j2", "")
 
-            # Render template
-            template = self.env.get_template(f"pages/{template_name}")
-            rendered = template.render()
-
             # Write to docs/md/
             # Exception: Special handling for the Root README (language agnostic entry)
             if target_name == "ROOT_README.md":
                 # Writes to repository root
-                (self.root / "README.md").write_text(rendered, encoding="utf-8")
-                count += 1
+                target = self.root / "README.md"
             else:
                 # Writes to docs/md/ (e.g., README.en.md, about.md)
-                (self.md_out / target_name).write_text(rendered, encoding="utf-8")
-                logger.info(self.md_out / target_name)
-                count += 1
-        if not count:
+                target = self.md_out / target_name
+                logger.info(target)
+            jobs.append((f"pages/{template_name}", {}, target))
+        if not jobs and only is None:
             raise TypeError("No md pages built")
+        self._render_many(jobs)
 
-    def build_html_pages(self):
+    def build_html_pages(self, only: set[str] | None = None):
         """
         Compiles templates/pages/*.html.j2 into docs/*.html for GitHub Pages.
+
+        If `only` is given, just those template names are rendered.
         """
         self._map_relationships()
         logger.info("-> Building HTML Pages...")
@@ -280,87 +316,32 @@ class SiteBuilder:
 
         pages_dir = self.templates_dir / "pages"
         logger.info(f"Templates from {pages_dir}")
-        count = 0
+        jobs = []
         for template_path in pages_dir.glob("*.html.j2"):
             template_name = template_path.name
             # --- Skip the specialized skill template ---
             if template_name == "skill_detail.html.j2":
                 continue
+            if only is not None and template_name not in only:
+                continue
             target_name = template_name.replace(".j2", "")
-
-            template = self.env.get_template(f"pages/{template_name}")
-            rendered = template.render()
-
-            (self.html_out / target_name).write_text(rendered, encoding="utf-8")
-            count += 1
-        if not count:
+            jobs.append((f"pages/{template_name}", {}, self.html_out / target_name))
+        if not jobs and only is None:
             raise TypeError("No html pages build")
-
-    def _normalize_name_match(self, name: str) -> str:
-        """
-        Normalizes a project name for comparison.
-        Case insensitive, treats '-' and '_' as identical.
-        Example: "Bash2Gitlab" -> "bash2gitlab", "naive_linkbacks" -> "naivelinkbacks"
-        """
-        if not name:
-            return ""
-        # Remove both - and _ to make them strictly equivalent
-        return re.sub(r"[-_]", "", name.lower())
-
-    def _apply_featured_status(self):
-        """
-        Updates the .featured boolean on all Projects and PyPI packages
-        based on the list defined in identity.toml for the CURRENT mode.
-        """
-        mode = self.config.modes.current
-        identity = self.config.identity
-
-        # Determine which list of strings to use
-        target_list = []
-        if mode == "job_hunting":
-            target_list = identity.job_hunting_projects
-        elif mode == "project_promotion":
-            target_list = identity.project_promotion
-        elif mode == "self_promotion":
-            # If self_promotion logic isn't strictly defined, fallback or use identity_projects
-            target_list = identity.identity_projects
-        else:
-            # Fallback
-            target_list = identity.project_promotion
-
-        # Create a set of normalized names for O(1) lookup
-        featured_slugs = {self._normalize_name_match(name) for name in target_list}
-
-        logger.info(
-            f"Applying featured status for mode '{mode}'. {len(featured_slugs)} targets found."
-        )
-
-        # Apply to GitHub Projects
-        for proj in self.config.projects:
-            norm_name = self._normalize_name_match(proj.name)
-            if norm_name in featured_slugs:
-                proj.featured = True
-            else:
-                # IMPORTANT: Reset to False if not in the list, so mode switches work cleanly
-                proj.featured = False
-
-        # Apply to PyPI Packages (if you want stars there too)
-        # Note: PyPIPackage model doesn't explicitly have 'featured',
-        # but Python allows setting dynamic attributes or you can add it to the model.
-        for pkg in self.config.pypi_packages:
-            norm_name = self._normalize_name_match(pkg.package_name)
-            # Dynamically set attribute for template usage
+        self._render_many(jobs)
 
     def build(self):
         """
         Main entry point for the build process.
         """
-        self.clean()
         self._map_relationships()
         self.build_static_api()
         self.build_markdown_pages()
         self.build_html_pages()
         self.build_skill_pages()
+        self.close()
+        self.remove_orphans(self.written_files)
+        self.precompress(self.written_files)
 
         logger.info("Build complete.")
 
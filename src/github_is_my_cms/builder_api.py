@@ -1,492 +1,383 @@
-import datetime
+import hashlib
 import logging
 import math
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import orjson
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 from pydantic import HttpUrl
 
+from .api_resources import API_RESOURCES, ApiRelations, ApiResource
+from .build_context import BuildContext
 from .builder import SiteBuilder
-from .config import load_config
-from .models import CMSConfig
+from .compression import SUFFIXES, compressed_variants
+from .json_stream import JsonArray, iter_json
+from .profiling import stage
+from .search_index import (
+    DOC_SHARD_SIZE,
+    LOADER_SOURCE,
+    SEARCH_VERSION,
+    STOPWORDS,
+    TERM_SHARD_PREFIX,
+    WEIGHTS,
+    build_postings,
+    collect_documents,
+)
+from .skill_index import slugify
 
 logger = logging.getLogger(__name__)
 
+PAGE_SIZE = 50
 
-class SiteBuilderAPI(SiteBuilder):
-    def __init__(self, root_dir: str = "."):
-        super().__init__(root_dir)
+# Hex digits of the content hash in bundle filenames
+BUNDLE_HASH_LENGTH = 12
 
-    def build_static_api(self):
-        logger.info("-> Building Static API...")
+DESCRIBED_BY = "/apis/openapi.yaml"
 
-        def default(obj):
-            if isinstance(obj, HttpUrl):
-                return str(obj)
-            raise TypeError
 
-        def write_json(path: Path, payload) -> None:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(
-                orjson.dumps(payload, default=default).decode(),
-                encoding="utf-8",
-            )
+def _default(obj):
+    if isinstance(obj, HttpUrl):
+        return str(obj)
+    raise TypeError
 
-        def paginate(items, page_size: int):
-            total = len(items)
-            pages = max(1, math.ceil(total / page_size))
-            for page in range(1, pages + 1):
-                start = (page - 1) * page_size
-                end = start + page_size
-                yield page, pages, total, items[start:end]
 
-        PAGE_SIZE = 50
+# -------- link helpers (HATEOAS) --------
 
-        # -------- link helpers (HATEOAS) --------
 
-        def link(href: str, rel: str = "self", type_: str = "application/json"):
-            return {"rel": rel, "href": href, "type": type_}
+def link(href: str, rel: str = "self", type_: str = "application/json"):
+    return {"rel": rel, "href": href, "type": type_}
 
-        def links(*items):
-            # keep list to preserve order & allow repeated rels
-            return [i for i in items if i is not None]
 
-        def ref_item(href: str, rel: str = "item"):
-            # minimal ref object used in refs[] and rel arrays
-            return {"ref": href, "rel": rel}
+def links(*items):
+    # keep list to preserve order & allow repeated rels
+    return [i for i in items if i is not None]
 
-        # -------- base docs/apis endpoints --------
-        identity_href = "/apis/identity.json"
-        config_href = "/apis/config.json"
 
-        # 1) Identity (add _links)
-        identity_obj = self.config.identity.model_dump()
-        identity_payload = {
-            **identity_obj,
-            "_links": links(
-                link(identity_href, "self"),
-                link("/apis/openapi.yaml", "describedby", "text/yaml"),
-            ),
-        }
-        write_json(self.api_out / "identity.json", identity_payload)
+def described_by():
+    return link(DESCRIBED_BY, "describedby", "text/yaml")
 
-        # 2) Config (add _links)
-        config_obj = self.config.modes.model_dump()
-        config_payload = {
-            **config_obj,
-            "_links": links(
-                link(config_href, "self"),
-                link("/apis/openapi.yaml", "describedby", "text/yaml"),
-            ),
-        }
-        write_json(self.api_out / "config.json", config_payload)
 
-        # -------- Projects + PyPI relationship indexing --------
-        projects = [p.model_dump() for p in self.config.projects]
-        projects_sorted = sorted(projects, key=lambda p: (p.get("slug") or "").lower())
+def paginate(items, page_size: int):
+    total = len(items)
+    pages = max(1, math.ceil(total / page_size))
+    for page in range(1, pages + 1):
+        start = (page - 1) * page_size
+        end = start + page_size
+        yield page, pages, total, items[start:end]
 
-        packages = [p.model_dump() for p in self.config.pypi_packages]
-        packages_sorted = sorted(
-            packages, key=lambda p: (p.get("package_name") or "").lower()
-        )
-
-        # Build mapping: github_repo ("owner/repo") -> [package_name]
-        repo_to_packages = {}
-        for pkg in packages_sorted:
-            gr = (pkg.get("github_repo") or "").strip()
-            if gr:
-                repo_to_packages.setdefault(gr.lower(), []).append(pkg["package_name"])
-
-        # Build mapping: project slug -> owner/repo (best-effort parse from repository_url)
-        # Only used to create lightweight relationships; if parsing fails, relationships omitted.
-        def parse_owner_repo(repo_url: str | None) -> str | None:
-            if not repo_url:
-                return None
-            s = str(repo_url).strip()
-            # Accept https://github.com/owner/repo or http://...; ignore extra segments.
-            marker = "github.com/"
-            idx = s.lower().find(marker)
-            if idx == -1:
-                return None
-            tail = s[idx + len(marker) :]
-            parts = [p for p in tail.split("/") if p]
-            if len(parts) < 2:
-                return None
-            return f"{parts[0]}/{parts[1]}".lower()
-
-        # -------- Projects endpoints --------
-        projects_index_href = "/apis/projects/index.json"
-
-        # per-project full object file (+ links + relationships)
-        for p in projects_sorted:
-            slug = p["slug"]
-            self_href = f"/apis/projects/by-slug/{slug}.json"
-            repo_key = parse_owner_repo(p.get("repository_url"))
-            related_pypi = repo_to_packages.get(repo_key, []) if repo_key else []
-
-            payload = {
-                **p,
-                "_links": links(
-                    link(self_href, "self"),
-                    link(projects_index_href, "collection"),
-                    link("/apis/projects/pages/1.json", "first"),
-                    link("/apis/openapi.yaml", "describedby", "text/yaml"),
-                ),
-                "_rels": {
-                    # relationships are refs only (no embedded objects)
-                    "pypi_packages": [
-                        ref_item(f"/apis/pypi/by-name/{name}.json", "related")
-                        for name in related_pypi
-                    ]
-                },
-            }
-            write_json(self.api_out / "projects" / "by-slug" / f"{slug}.json", payload)
 
-        # list refs for projects (refs-only, but with _links + optional rel hints)
-        project_refs = [
-            {
-                "ref": f"/apis/projects/by-slug/{p['slug']}.json",
-                "rel": "item",
-                # optional tiny hints; safe to remove
-                "name": p.get("name"),
-                "status": p.get("status"),
-            }
-            for p in projects_sorted
-        ]
+class SiteBuilderAPI(SiteBuilder):
+    def __init__(
+        self,
+        root_dir: str = ".",
+        context: Optional[BuildContext] = None,
+        jobs: int = 1,
+    ):
+        super().__init__(root_dir, context=context, jobs=jobs)
 
-        total_projects = len(project_refs)
-        total_project_pages = max(1, math.ceil(total_projects / PAGE_SIZE))
+    def _write_json(self, path: Path, payload) -> None:
+        self._write_output_bytes(path, orjson.dumps(payload, default=_default))
 
-        write_json(
-            self.api_out / "projects" / "index.json",
-            {
-                "refs": project_refs,  # still refs-only
-                "meta": {
-                    "type": "projects",
-                    "count": total_projects,
-                    "page_size": PAGE_SIZE,
-                    "pages": total_project_pages,
-                },
-                "_links": links(
-                    link(projects_index_href, "self"),
-                    link(f"/apis/projects/pages/1.json", "first"),
-                    link(f"/apis/projects/pages/{total_project_pages}.json", "last"),
-                    link("/apis/openapi.yaml", "describedby", "text/yaml"),
-                ),
-            },
-        )
+    def _write_json_stream(self, path: Path, payload) -> None:
+        # Index documents: refs[] is a JsonArray, encoded and written in chunks
+        self._write_output_chunks(path, iter_json(payload, default=_default))
 
-        for page, pages, total, chunk in paginate(project_refs, PAGE_SIZE):
-            page_href = f"/apis/projects/pages/{page}.json"
-            prev_href = f"/apis/projects/pages/{page-1}.json" if page > 1 else None
-            next_href = f"/apis/projects/pages/{page+1}.json" if page < pages else None
-
-            write_json(
-                self.api_out / "projects" / "pages" / f"{page}.json",
-                {
-                    "refs": chunk,
-                    "meta": {
-                        "type": "projects",
-                        "page": page,
-                        "page_size": PAGE_SIZE,
-                        "pages": pages,
-                        "total": total,
-                    },
-                    "_links": links(
-                        link(page_href, "self"),
-                        link(projects_index_href, "collection"),
-                        link(f"/apis/projects/pages/1.json", "first"),
-                        link(f"/apis/projects/pages/{pages}.json", "last"),
-                        link(prev_href, "prev") if prev_href else None,
-                        link(next_href, "next") if next_href else None,
-                        link("/apis/openapi.yaml", "describedby", "text/yaml"),
-                    ),
-                },
-            )
+    def build_static_api(self):
+        logger.info("-> Building Static API...")
 
-        # -------- PyPI endpoints --------
-        pypi_index_href = "/apis/pypi/index.json"
-
-        # also build inverse mapping: package_name -> github_repo -> maybe project ref
-        # Make lookup from repo_key -> project slug (best effort). If multiple, keep first stable.
-        repo_to_project_slug = {}
-        for p in projects_sorted:
-            repo_key = parse_owner_repo(p.get("repository_url"))
-            if repo_key and repo_key not in repo_to_project_slug:
-                repo_to_project_slug[repo_key] = p["slug"]
-
-        for pkg in packages_sorted:
-            name = pkg["package_name"]
-            self_href = f"/apis/pypi/by-name/{name}.json"
-            repo_key = (pkg.get("github_repo") or "").strip().lower() or None
-            related_project_slug = (
-                repo_to_project_slug.get(repo_key) if repo_key else None
-            )
+        # -------- base docs/apis endpoints --------
+        # 1) Identity (add _links)
+        identity_payload = {
+            **self.config.identity.model_dump(),
+            "_links": links(link("/apis/identity.json", "self"), described_by()),
+        }
+        self._write_json(self.api_out / "identity.json", identity_payload)
 
+        # 2) Config (add _links)
+        config_payload = {
+            **self.config.modes.model_dump(),
+            "_links": links(link("/apis/config.json", "self"), described_by()),
+        }
+        self._write_json(self.api_out / "config.json", config_payload)
+
+        # -------- registered collections --------
+        items = {r.name: r.load(self.config) for r in API_RESOURCES}
+        relations = ApiRelations(items, self.context.skill_index)
+
+        def build(resource: ApiResource) -> List[Dict[str, Any]]:
+            with stage(f"api {resource.name}", "api"):
+                return self.build_resource(resource, items[resource.name], relations)
+
+        # Collections are independent; each is generated exactly once
+        if self.jobs > 1:
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                payloads = list(pool.map(build, API_RESOURCES))
+        else:
+            payloads = [build(resource) for resource in API_RESOURCES]
+
+        with stage("api search", "api"):
+            self.build_search_index()
+
+        if self.config.build.api_bundles:
+            collections = {
+                resource.name: collection
+                for resource, collection in zip(API_RESOURCES, payloads)
+            }
+            self.build_bundles(identity_payload, config_payload, collections)
+
+    def build_resource(
+        self,
+        resource: ApiResource,
+        items: List[Dict[str, Any]],
+        relations: ApiRelations,
+    ) -> List[Dict[str, Any]]:
+        """
+        Writes one collection: a file per item, the refs index and the pages.
+        Returns the item payloads when bundles want them, else an empty list.
+        """
+        out = self.api_out / resource.name
+        keep = self.config.build.api_bundles
+        kept = []
+
+        # per-item full object file (+ links + relationships)
+        for item in items:
+            key = item[resource.key]
             payload = {
-                **pkg,
+                **item,
                 "_links": links(
-                    link(self_href, "self"),
-                    link(pypi_index_href, "collection"),
-                    link(f"/apis/pypi/pages/1.json", "first"),
-                    link("/apis/openapi.yaml", "describedby", "text/yaml"),
+                    link(resource.item_href(key), "self"),
+                    link(resource.index_href, "collection"),
+                    link(resource.page_href(1), "first"),
+                    described_by(),
+                ),
+                # relationships are refs only (no embedded objects)
+                "_rels": (
+                    resource.relations(item, relations) if resource.relations else {}
                 ),
-                "_rels": {
-                    "github_project": (
-                        [
-                            ref_item(
-                                f"/apis/projects/by-slug/{related_project_slug}.json",
-                                "related",
-                            )
-                        ]
-                        if related_project_slug
-                        else []
-                    )
-                },
-            }
-            write_json(self.api_out / "pypi" / "by-name" / f"{name}.json", payload)
-
-        pypi_refs = [
-            {
-                "ref": f"/apis/pypi/by-name/{p['package_name']}.json",
-                "rel": "item",
-                # optional tiny hints; safe to remove
-                "package_name": p.get("package_name"),
-                "version": p.get("version"),
             }
-            for p in packages_sorted
-        ]
+            self._write_json(out / resource.lookup / f"{key}.json", payload)
+            if keep:
+                kept.append(payload)
 
-        total_pypi = len(pypi_refs)
-        total_pypi_pages = max(1, math.ceil(total_pypi / PAGE_SIZE))
+        total = len(items)
+        total_pages = max(1, math.ceil(total / PAGE_SIZE))
 
-        write_json(
-            self.api_out / "pypi" / "index.json",
+        # list refs (refs-only, but with _links + optional rel hints)
+        self._write_json_stream(
+            out / "index.json",
             {
-                "refs": pypi_refs,
+                "refs": JsonArray(map(resource.ref, items)),
                 "meta": {
-                    "type": "pypi",
-                    "count": total_pypi,
+                    "type": resource.name,
+                    "count": total,
                     "page_size": PAGE_SIZE,
-                    "pages": total_pypi_pages,
+                    "pages": total_pages,
                 },
                 "_links": links(
-                    link(pypi_index_href, "self"),
-                    link(f"/apis/pypi/pages/1.json", "first"),
-                    link(f"/apis/pypi/pages/{total_pypi_pages}.json", "last"),
-                    link("/apis/openapi.yaml", "describedby", "text/yaml"),
+                    link(resource.index_href, "self"),
+                    link(resource.page_href(1), "first"),
+                    link(resource.page_href(total_pages), "last"),
+                    described_by(),
                 ),
             },
         )
 
-        for page, pages, total, chunk in paginate(pypi_refs, PAGE_SIZE):
-            page_href = f"/apis/pypi/pages/{page}.json"
-            prev_href = f"/apis/pypi/pages/{page-1}.json" if page > 1 else None
-            next_href = f"/apis/pypi/pages/{page+1}.json" if page < pages else None
-
-            write_json(
-                self.api_out / "pypi" / "pages" / f"{page}.json",
+        for page, pages, total, chunk in paginate(items, PAGE_SIZE):
+            self._write_json(
+                out / "pages" / f"{page}.json",
                 {
-                    "refs": chunk,
+                    "refs": [resource.ref(item) for item in chunk],
                     "meta": {
-                        "type": "pypi",
+                        "type": resource.name,
                         "page": page,
                         "page_size": PAGE_SIZE,
                         "pages": pages,
                         "total": total,
                     },
                     "_links": links(
-                        link(page_href, "self"),
-                        link(pypi_index_href, "collection"),
-                        link(f"/apis/pypi/pages/1.json", "first"),
-                        link(f"/apis/pypi/pages/{pages}.json", "last"),
-                        link(prev_href, "prev") if prev_href else None,
-                        link(next_href, "next") if next_href else None,
-                        link("/apis/openapi.yaml", "describedby", "text/yaml"),
-                    ),
-                },
-            )
-
-            # -------- Work Experience endpoints --------
-            exp_index_href = "/apis/experience/index.json"
-            exp_items = [e.model_dump() for e in self.config.work_experience]
-            exp_sorted = sorted(
-                exp_items,
-                key=lambda e: (e.get("start_date") or "", e.get("id") or ""),
-                reverse=True,
-            )
-
-            for e in exp_sorted:
-                eid = e["id"]
-                self_href = f"/apis/experience/by-id/{eid}.json"
-                payload = {
-                    **e,
-                    "_links": links(
-                        link(self_href, "self"),
-                        link(exp_index_href, "collection"),
-                        link("/apis/experience/pages/1.json", "first"),
-                        link("/apis/openapi.yaml", "describedby", "text/yaml"),
-                    ),
-                    "_rels": {},
-                }
-                write_json(
-                    self.api_out / "experience" / "by-id" / f"{eid}.json", payload
-                )
-
-            exp_refs = [
-                {
-                    "ref": f"/apis/experience/by-id/{e['id']}.json",
-                    "rel": "item",
-                    "organization": e.get("organization"),
-                    "title": e.get("title"),
-                    "end_date": e.get("end_date"),
-                }
-                for e in exp_sorted
-            ]
-
-            total_exp = len(exp_refs)
-            total_exp_pages = max(1, math.ceil(total_exp / PAGE_SIZE))
-
-            write_json(
-                self.api_out / "experience" / "index.json",
-                {
-                    "refs": exp_refs,
-                    "meta": {
-                        "type": "experience",
-                        "count": total_exp,
-                        "page_size": PAGE_SIZE,
-                        "pages": total_exp_pages,
-                    },
-                    "_links": links(
-                        link(exp_index_href, "self"),
-                        link("/apis/experience/pages/1.json", "first"),
-                        link(f"/apis/experience/pages/{total_exp_pages}.json", "last"),
-                        link("/apis/openapi.yaml", "describedby", "text/yaml"),
+                        link(resource.page_href(page), "self"),
+                        link(resource.index_href, "collection"),
+                        link(resource.page_href(1), "first"),
+                        link(resource.page_href(pages), "last"),
+                        (
+                            link(resource.page_href(page - 1), "prev")
+                            if page > 1
+                            else None
+                        ),
+                        (
+                            link(resource.page_href(page + 1), "next")
+                            if page < pages
+                            else None
+                        ),
+                        described_by(),
                     ),
                 },
             )
 
-            for page, pages, total, chunk in paginate(exp_refs, PAGE_SIZE):
-                page_href = f"/apis/experience/pages/{page}.json"
-                prev_href = (
-                    f"/apis/experience/pages/{page - 1}.json" if page > 1 else None
-                )
-                next_href = (
-                    f"/apis/experience/pages/{page + 1}.json" if page < pages else None
-                )
-
-                write_json(
-                    self.api_out / "experience" / "pages" / f"{page}.json",
+        if resource.facets:
+            self.build_facets(resource, items, relations)
+        return kept
+
+    def build_facets(
+        self,
+        resource: ApiResource,
+        items: List[Dict[str, Any]],
+        relations: ApiRelations,
+    ) -> None:
+        """
+        Writes a refs document per facet value (e.g. projects/by-tag/aws.json)
+        and facets.json with every value's count, so a filtered lookup is one
+        GET instead of a crawl of the by-key files.
+        """
+        out = self.api_out / resource.name
+        counts: Dict[str, List[Dict[str, Any]]] = {}
+
+        for facet, values_of in resource.facets.items():
+            # slug -> (value as first seen, matching items in collection order)
+            buckets: Dict[str, Tuple[str, List[Dict[str, Any]]]] = {}
+            for item in items:
+                seen = set()
+                for value in values_of(item, relations):
+                    slug = slugify(str(value)) if value else ""
+                    if not slug or slug in seen:
+                        continue
+                    seen.add(slug)
+                    buckets.setdefault(slug, (str(value), []))[1].append(item)
+
+            for slug, (value, members) in buckets.items():
+                self._write_json_stream(
+                    out / facet / f"{slug}.json",
                     {
-                        "refs": chunk,
+                        "refs": JsonArray(map(resource.ref, members)),
                         "meta": {
-                            "type": "experience",
-                            "page": page,
-                            "page_size": PAGE_SIZE,
-                            "pages": pages,
-                            "total": total,
+                            "type": resource.name,
+                            "facet": facet,
+                            "value": value,
+                            "count": len(members),
                         },
                         "_links": links(
-                            link(page_href, "self"),
-                            link(exp_index_href, "collection"),
-                            link("/apis/experience/pages/1.json", "first"),
-                            link(f"/apis/experience/pages/{pages}.json", "last"),
-                            link(prev_href, "prev") if prev_href else None,
-                            link(next_href, "next") if next_href else None,
-                            link("/apis/openapi.yaml", "describedby", "text/yaml"),
+                            link(resource.facet_href(facet, slug), "self"),
+                            link(resource.index_href, "collection"),
+                            link(resource.facets_href, "up"),
+                            described_by(),
                         ),
                     },
                 )
 
-            # -------- Resumes endpoints --------
-            res_index_href = "/apis/resumes/index.json"
-            res_items = [r.model_dump() for r in self.config.resumes]
-            res_sorted = sorted(
-                res_items,
-                key=lambda r: (
-                    r.get("status") != "active",
-                    r.get("valid_from") or "",
-                    r.get("id") or "",
+            counts[facet] = sorted(
+                (
+                    {
+                        "value": value,
+                        "count": len(members),
+                        "href": resource.facet_href(facet, slug),
+                    }
+                    for slug, (value, members) in buckets.items()
                 ),
-                reverse=True,
+                key=lambda entry: (-entry["count"], entry["value"].lower()),
             )
 
-            for r in res_sorted:
-                rid = r["id"]
-                self_href = f"/apis/resumes/by-id/{rid}.json"
-                payload = {
-                    **r,
-                    "_links": links(
-                        link(self_href, "self"),
-                        link(res_index_href, "collection"),
-                        link("/apis/resumes/pages/1.json", "first"),
-                        link("/apis/openapi.yaml", "describedby", "text/yaml"),
-                    ),
-                    "_rels": {},
-                }
-                write_json(self.api_out / "resumes" / "by-id" / f"{rid}.json", payload)
+        self._write_json(
+            out / "facets.json",
+            {
+                "facets": counts,
+                "meta": {"type": resource.name, "count": len(items)},
+                "_links": links(
+                    link(resource.facets_href, "self"),
+                    link(resource.index_href, "collection"),
+                    described_by(),
+                ),
+            },
+        )
 
-            res_refs = [
-                {
-                    "ref": f"/apis/resumes/by-id/{r['id']}.json",
-                    "rel": "item",
-                    "label": r.get("label"),
-                    "status": r.get("status"),
-                    "format": r.get("format"),
-                }
-                for r in res_sorted
-            ]
-
-            total_res = len(res_refs)
-            total_res_pages = max(1, math.ceil(total_res / PAGE_SIZE))
-
-            write_json(
-                self.api_out / "resumes" / "index.json",
-                {
-                    "refs": res_refs,
-                    "meta": {
-                        "type": "resumes",
-                        "count": total_res,
-                        "page_size": PAGE_SIZE,
-                        "pages": total_res_pages,
-                    },
-                    "_links": links(
-                        link(res_index_href, "self"),
-                        link("/apis/resumes/pages/1.json", "first"),
-                        link(f"/apis/resumes/pages/{total_res_pages}.json", "last"),
-                        link("/apis/openapi.yaml", "describedby", "text/yaml"),
-                    ),
-                },
+    def build_search_index(self) -> None:
+        """
+        Writes the sharded client-side search index and its loader (search.js)
+        under apis/search/. See search_index.py for the layout.
+        """
+        logger.info("-> Building search index...")
+        out = self.api_out / "search"
+        docs = collect_documents(self.config, self.context.skill_index)
+        shards = build_postings(docs)
+
+        for start in range(0, len(docs), DOC_SHARD_SIZE):
+            self._write_json(
+                out / "docs" / f"{start // DOC_SHARD_SIZE}.json",
+                [doc.record() for doc in docs[start : start + DOC_SHARD_SIZE]],
             )
+        for key, terms in shards.items():
+            self._write_json(out / "terms" / f"{key}.json", terms)
 
-            for page, pages, total, chunk in paginate(res_refs, PAGE_SIZE):
-                page_href = f"/apis/resumes/pages/{page}.json"
-                prev_href = f"/apis/resumes/pages/{page - 1}.json" if page > 1 else None
-                next_href = (
-                    f"/apis/resumes/pages/{page + 1}.json" if page < pages else None
-                )
+        self._write_json(
+            out / "index.json",
+            {
+                "version": SEARCH_VERSION,
+                "doc_count": len(docs),
+                "doc_shard_size": DOC_SHARD_SIZE,
+                "term_shard_prefix": TERM_SHARD_PREFIX,
+                "term_shards": sorted(shards),
+                "weights": WEIGHTS,
+                "stopwords": sorted(STOPWORDS),
+                "_links": links(
+                    link("/apis/search/index.json", "self"),
+                    link("/apis/search/search.js", "loader", "text/javascript"),
+                ),
+            },
+        )
+        self._write_output_bytes(out / "search.js", LOADER_SOURCE.read_bytes())
+
+    def build_bundles(
+        self,
+        identity: Dict[str, Any],
+        config: Dict[str, Any],
+        collections: Dict[str, list],
+    ) -> None:
+        """
+        Writes one bundle per collection and an all-in-one bundle, named by
+        content hash so they can be cached forever, each with .gz/.br
+        siblings. apis/bundles/index.json is the stable entry point that
+        points at the current hashed files.
+        """
+        logger.info("-> Building Static API bundles...")
+        bundles_dir = self.api_out / "bundles"
+        index: Dict[str, Any] = {}
+
+        for name, items in collections.items():
+            data = orjson.dumps(
+                {"type": name, "count": len(items), "items": items}, default=_default
+            )
+            index[name] = self._write_bundle(bundles_dir, name, data)
+            index[name]["count"] = len(items)
 
-                write_json(
-                    self.api_out / "resumes" / "pages" / f"{page}.json",
-                    {
-                        "refs": chunk,
-                        "meta": {
-                            "type": "resumes",
-                            "page": page,
-                            "page_size": PAGE_SIZE,
-                            "pages": pages,
-                            "total": total,
-                        },
-                        "_links": links(
-                            link(page_href, "self"),
-                            link(res_index_href, "collection"),
-                            link("/apis/resumes/pages/1.json", "first"),
-                            link(f"/apis/resumes/pages/{pages}.json", "last"),
-                            link(prev_href, "prev") if prev_href else None,
-                            link(next_href, "next") if next_href else None,
-                            link("/apis/openapi.yaml", "describedby", "text/yaml"),
-                        ),
-                    },
-                )
+        everything = {"identity": identity, "config": config, **collections}
+        data = orjson.dumps(everything, default=_default)
+        index["all"] = self._write_bundle(self.api_out, "bundle", data)
+
+        self._write_json(
+            bundles_dir / "index.json",
+            {
+                "bundles": index,
+                "_links": links(
+                    link("/apis/bundles/index.json", "self"), described_by()
+                ),
+            },
+        )
+
+    def _write_bundle(self, directory: Path, stem: str, data: bytes) -> Dict[str, Any]:
+        digest = hashlib.sha256(data).hexdigest()
+        path = directory / f"{stem}.{digest[:BUNDLE_HASH_LENGTH]}.json"
+        self._write_output_bytes(path, data)
+
+        siblings = [path.with_name(path.name + suffix) for suffix in SUFFIXES]
+        if all(sibling.exists() for sibling in siblings):
+            # Same name means same content: the variants are still current
+            self.written_files.extend(siblings)
+        else:
+            for suffix, compressed in compressed_variants(data).items():
+                self._write_output_bytes(path.with_name(path.name + suffix), compressed)
+
+        return {
+            "href": "/" + path.relative_to(self.docs_dir).as_posix(),
+            "sha256": digest,
+            "bytes": len(data),
+        }
@@ -0,0 +1,271 @@
+# src/github_is_my_cms/cache.py
+"""
+Pluggable key/value cache used by the data fetchers.
+
+Every entry carries its own TTL. Backends are size bounded with LRU
+eviction and write atomically:
+- DirectoryCache: one <key>.json file per entry (plus a small .meta.json)
+- SQLiteCache: a single SQLite database
+- MemoryCache: in-process only, for tests
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+from .atomic_write import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 24 * 60 * 60  # 24 hours
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    stored_at: float
+    ttl: float
+
+    @property
+    def expires_at(self) -> float:
+        return self.stored_at + self.ttl
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return (now if now is not None else time.time()) >= self.expires_at
+
+    def is_usable_stale(self, grace: float, now: Optional[float] = None) -> bool:
+        """True if expired but still inside the stale-while-revalidate window."""
+        now = now if now is not None else time.time()
+        return self.is_expired(now) and now < self.expires_at + grace
+
+
+class CacheBackend(ABC):
+    """Per-key entries with individual TTLs and size-bounded LRU eviction."""
+
+    def __init__(
+        self, default_ttl: float = DEFAULT_TTL, max_entries: Optional[int] = None
+    ):
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+
+    @abstractmethod
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """Returns the entry (expired or not) and marks it as recently used."""
+
+    @abstractmethod
+    def _store(self, key: str, entry: CacheEntry) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def keys_by_recency(self) -> List[str]:
+        """All keys, least recently used first."""
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the value if present and not expired."""
+        entry = self.get_entry(key)
+        if entry is None or entry.is_expired():
+            return None
+        return entry.value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        self._store(key, CacheEntry(value=value, stored_at=time.time(), ttl=ttl))
+        self._evict()
+
+    def _evict(self) -> None:
+        if self.max_entries is None:
+            return
+        keys = self.keys_by_recency()
+        for key in keys[: max(0, len(keys) - self.max_entries)]:
+            logger.debug(f"Cache: evicting '{key}'")
+            self.delete(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys_by_recency())
+
+
+class MemoryCache(CacheBackend):
+    """In-memory backend. Nothing persists; intended for tests."""
+
+    def __init__(
+        self, default_ttl: float = DEFAULT_TTL, max_entries: Optional[int] = None
+    ):
+        super().__init__(default_ttl, max_entries)
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def keys_by_recency(self) -> List[str]:
+        return list(self._entries)
+
+
+class DirectoryCache(CacheBackend):
+    """
+    One JSON file per key: <dir>/<key>.json holds the value as-is, and
+    <dir>/<key>.meta.json holds stored_at/ttl. The meta file's mtime is the
+    last access time used for LRU. A value file without meta (e.g. written by
+    an older version) is treated as stored at its mtime with the default TTL.
+    """
+
+    META_SUFFIX = ".meta.json"
+
+    def __init__(
+        self,
+        directory: Path,
+        default_ttl: float = DEFAULT_TTL,
+        max_entries: Optional[int] = None,
+    ):
+        super().__init__(default_ttl, max_entries)
+        self.directory = directory
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9._-]', '_', key)}.json"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.path_for(key).with_suffix(self.META_SUFFIX)
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        path = self.path_for(key)
+        if not path.exists():
+            return None
+        try:
+            value = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            logger.warning(f"Cache: entry '{key}' is corrupted; ignoring it.")
+            return None
+
+        meta_path = self._meta_path(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            entry = CacheEntry(
+                value=value, stored_at=meta["stored_at"], ttl=meta["ttl"]
+            )
+            self._touch(meta_path)
+        except (OSError, json.JSONDecodeError, KeyError):
+            entry = CacheEntry(
+                value=value, stored_at=path.stat().st_mtime, ttl=self.default_ttl
+            )
+        return entry
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        atomic_write_bytes(
+            self.path_for(key), json.dumps(entry.value, indent=2).encode("utf-8")
+        )
+        meta = {"key": key, "stored_at": entry.stored_at, "ttl": entry.ttl}
+        atomic_write_bytes(self._meta_path(key), json.dumps(meta).encode("utf-8"))
+        self._touch(self._meta_path(key))
+
+    @staticmethod
+    def _touch(meta_path: Path) -> None:
+        """Records an access for LRU (explicit timestamps; fs mtimes can be coarse)."""
+        now = time.time()
+        os.utime(meta_path, (now, now))
+
+    def delete(self, key: str) -> None:
+        self.path_for(key).unlink(missing_ok=True)
+        self._meta_path(key).unlink(missing_ok=True)
+
+    def keys_by_recency(self) -> List[str]:
+        entries = []
+        for meta_path in self.directory.glob(f"*{self.META_SUFFIX}"):
+            try:
+                key = json.loads(meta_path.read_text(encoding="utf-8"))["key"]
+                entries.append((meta_path.stat().st_mtime, key))
+            except (OSError, json.JSONDecodeError, KeyError):
+                continue
+        return [key for _, key in sorted(entries)]
+
+
+class SQLiteCache(CacheBackend):
+    """All entries in one SQLite database; each write is a single transaction."""
+
+    def __init__(
+        self,
+        path: Path,
+        default_ttl: float = DEFAULT_TTL,
+        max_entries: Optional[int] = None,
+    ):
+        super().__init__(default_ttl, max_entries)
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+            " stored_at REAL NOT NULL, ttl REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        row = self._conn.execute(
+            "SELECT value, stored_at, ttl FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        with self._conn:
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        return CacheEntry(value=json.loads(row[0]), stored_at=row[1], ttl=row[2])
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, stored_at, ttl, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(entry.value), entry.stored_at, entry.ttl, time.time()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._conn:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def keys_by_recency(self) -> List[str]:
+        rows = self._conn.execute("SELECT key FROM entries ORDER BY accessed_at, key")
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+BACKENDS = ("directory", "sqlite", "memory")
+
+
+def create_backend(
+    kind: str,
+    cache_dir: Path,
+    default_ttl: float = DEFAULT_TTL,
+    max_entries: Optional[int] = None,
+) -> CacheBackend:
+    """Builds a backend by name ("directory", "sqlite" or "memory")."""
+    if kind == "directory":
+        return DirectoryCache(cache_dir, default_ttl, max_entries)
+    if kind == "sqlite":
+        return SQLiteCache(cache_dir / "fetch_cache.sqlite3", default_ttl, max_entries)
+    if kind == "memory":
+        return MemoryCache(default_ttl, max_entries)
+    raise ValueError(f"Unknown cache backend: {kind}")
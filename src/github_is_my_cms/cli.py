@@ -12,12 +12,11 @@ from pathlib import Path
 from typing import List, Optional
 
 import github_is_my_cms.__about__ as __about__
-from github_is_my_cms.builder_api import SiteBuilderAPI
 from github_is_my_cms.logging_config import generate_config
 
-# Import the builder
-from .builder import SiteBuilder
-from .data_sources import DataUpdater
+# Build and data modules pull in pydantic, jinja2, httpx and bs4. They are
+# imported inside the command handlers so `--help`, `--version` and the
+# lightweight commands start fast (gimc runs from git hooks).
 
 # Versioning
 # TODO: ideally fetched from package metadata in production
@@ -41,30 +40,102 @@ def cmd_build(args: argparse.Namespace):
     """
     Handler for the 'build' subcommand.
     Compiles Markdown and HTML pages.
+    With --incremental, only outputs whose inputs changed are re-rendered.
     """
+    from .incremental import IncrementalBuild
+    from .profiling import Profiler
+
     logging.info("Starting build process...")
     try:
-        builder = SiteBuilder(root_dir=args.root)
-        api_builder = SiteBuilderAPI(root_dir=args.root)
-        builder.clean()
-        api_builder.build_static_api()
-        builder._map_relationships()
-        builder.build_markdown_pages()
-        builder.build_html_pages()
-        builder.build_skill_pages()
-        logging.info("Build completed successfully.")
+        build = IncrementalBuild(
+            root_dir=args.root, force=not args.incremental, jobs=args.jobs
+        )
+        if args.profile or args.profile_trace or args.profile_memory:
+            with Profiler(trace_memory=args.profile_memory) as profiler:
+                build.run()
+            print(profiler.format_summary())
+            if args.profile_trace:
+                profiler.write_chrome_trace(Path(args.profile_trace))
+                logging.info(f"Wrote Chrome trace to {args.profile_trace}")
+        else:
+            build.run()
+        logging.info(f"Build completed successfully ({build.stats}).")
     except Exception as e:
         logging.error(f"Build failed: {e}", exc_info=True)
         sys.exit(1)
 
 
+def cmd_compile_theme(args: argparse.Namespace):
+    """
+    Handler for the 'compile-theme' subcommand.
+    Precompiles the active theme's templates into Python modules under .cache/.
+    """
+    from .build_context import BuildContext
+
+    try:
+        target = BuildContext(root_dir=args.root).compile_theme()
+        logging.info(f"Theme compiled to {target}")
+    except Exception as e:
+        logging.error(f"Theme compilation failed: {e}", exc_info=True)
+        sys.exit(1)
+
+
+def cmd_watch(args: argparse.Namespace):
+    """
+    Handler for the 'watch' subcommand.
+    Serves docs/ with live reload and rebuilds changed outputs on every edit.
+    """
+    from .watch import watch
+
+    watch(
+        Path(args.root),
+        host=args.host,
+        port=args.port,
+        interval=args.interval,
+        jobs=args.jobs,
+    )
+
+
 def cmd_lint(args: argparse.Namespace):
     """
-    Placeholder: Validates content structure, links, and TOML data.
+    Validates the TOML data and checks every link in it.
+    Link results are cached in .cache/, so reruns only check new or expired links.
+    Exits non-zero if the data is invalid or any link is broken (a link that
+    stays rate limited is only reported as inconclusive).
     """
-    logging.warning("Command 'lint' is not yet implemented.")
-    logging.info(f"Would scan root: {args.root}")
-    # TODO: Implement quality checks defined in GHIP-001 "Quality Checks"
+    from .config import load_config
+    from .link_checker import LinkChecker, LinkReport, collect_links
+
+    try:
+        config = load_config(args.root)
+    except Exception as e:
+        logging.error(f"Invalid data: {e}")
+        sys.exit(1)
+
+    checker = LinkChecker.for_root(
+        Path(args.root),
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        timeout=args.timeout,
+        ttl=args.link_cache_ttl,
+    )
+    sources = collect_links(config)
+    results = checker.check(sources, refresh=args.refresh)
+    report = LinkReport(results=results, sources=sources)
+
+    for result in report.broken:
+        logging.error(
+            f"Broken link {result.url}: {result.describe()} "
+            f"(in {', '.join(report.sources[result.url])})"
+        )
+    for result in report.inconclusive:
+        logging.warning(
+            f"Could not check {result.url}: {result.describe()} "
+            f"(in {', '.join(report.sources[result.url])})"
+        )
+    logging.info(f"Link check: {report}")
+    if report.broken:
+        sys.exit(1)
 
 
 def cmd_translate(args: argparse.Namespace):
@@ -79,14 +150,20 @@ def cmd_update_data(args: argparse.Namespace):
     """
     Fetches fresh data from PyPI and updates the local TOML files.
     """
-    logging.info("Starting data update...")
+    from .data_sources import DataUpdater
 
-    if DataUpdater is None:
-        logging.error("DataUpdater module not found.")
-        sys.exit(1)
+    logging.info("Starting data update...")
 
     root_path = Path(args.root)
-    updater = DataUpdater(root_dir=root_path)
+    updater = DataUpdater(
+        root_dir=root_path,
+        concurrency=args.concurrency,
+        http_cache_ttl=args.http_cache_ttl,
+        cache_backend=args.cache_backend,
+        cache_max_entries=args.cache_max_entries,
+        stale_while_revalidate=args.stale_while_revalidate,
+        full_sync=args.full_sync,
+    )
 
     try:
         # 1. Update GitHub Projects (Source of Truth)
@@ -129,12 +206,95 @@ def main(argv: Optional[List[str]] = None):
     parser_build = subparsers.add_parser(
         "build", help="Compile TOML and Markdown into final docs/ artefacts."
     )
+    parser_build.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-render outputs whose inputs changed since the last build.",
+    )
+    parser_build.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes for template rendering.",
+    )
+    parser_build.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage and per-template timings, bytes written and peak memory.",
+    )
+    parser_build.add_argument(
+        "--profile-trace",
+        metavar="PATH",
+        help="Also write the profile as a Chrome trace-event JSON file.",
+    )
+    parser_build.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Profile with peak memory per stage (tracemalloc; slows the build).",
+    )
     parser_build.set_defaults(func=cmd_build)
 
-    # Command: lint (Placeholder)
+    # Command: compile-theme
+    parser_compile = subparsers.add_parser(
+        "compile-theme",
+        help="Precompile the active theme's templates to speed up cold builds.",
+    )
+    parser_compile.set_defaults(func=cmd_compile_theme)
+
+    # Command: watch
+    parser_watch = subparsers.add_parser(
+        "watch", help="Serve docs/ with live reload and rebuild on every change."
+    )
+    parser_watch.add_argument("--host", default="127.0.0.1", help="Bind host.")
+    parser_watch.add_argument(
+        "--port", type=int, default=8000, help="Port to serve on (0 = any free port)."
+    )
+    parser_watch.add_argument(
+        "--interval",
+        type=float,
+        default=0.25,
+        help="Seconds between polls of the input files.",
+    )
+    parser_watch.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes for template rendering.",
+    )
+    parser_watch.set_defaults(func=cmd_watch)
+
+    # Command: lint
     parser_lint = subparsers.add_parser(
         "lint", help="Validate links, content structure, and data integrity."
     )
+    parser_lint.add_argument(
+        "--concurrency",
+        type=int,
+        default=32,
+        help="Maximum number of link checks in flight.",
+    )
+    parser_lint.add_argument(
+        "--per-host",
+        type=int,
+        default=4,
+        help="Maximum number of concurrent requests to any one host.",
+    )
+    parser_lint.add_argument(
+        "--timeout", type=float, default=10.0, help="Seconds per request."
+    )
+    parser_lint.add_argument(
+        "--link-cache-ttl",
+        type=float,
+        default=7 * 24 * 60 * 60,
+        help="Seconds a working link is trusted before it is checked again.",
+    )
+    parser_lint.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached results and check every link.",
+    )
     parser_lint.set_defaults(func=cmd_lint)
 
     # Command: translate (Placeholder)
@@ -147,12 +307,50 @@ def main(argv: Optional[List[str]] = None):
     parser_update = subparsers.add_parser(
         "update-data", help="Refresh cached data from PyPI and GitHub APIs."
     )
+    parser_update.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Maximum number of concurrent PyPI requests.",
+    )
+    parser_update.add_argument(
+        "--http-cache-ttl",
+        type=float,
+        default=3600.0,
+        help="Seconds a cached PyPI response is served without revalidation.",
+    )
+    parser_update.add_argument(
+        "--cache-backend",
+        default="directory",
+        choices=["directory", "sqlite", "memory"],
+        help="Storage for cached GitHub and PyPI discovery results.",
+    )
+    parser_update.add_argument(
+        "--cache-max-entries",
+        type=int,
+        default=None,
+        help="Evict least recently used cache entries beyond this count.",
+    )
+    parser_update.add_argument(
+        "--stale-while-revalidate",
+        type=float,
+        default=0.0,
+        help="Seconds past expiry a cached entry is still served while refreshing.",
+    )
+    parser_update.add_argument(
+        "--full-sync",
+        action="store_true",
+        help="Fetch every GitHub repository instead of only those updated since "
+        "the last sync (also detects deleted repositories).",
+    )
     parser_update.set_defaults(func=cmd_update_data)
 
     # --- Execution Logic ---
 
     # Check for empty args (excluding script name) to default to help
-    if len(sys.argv) == 1:
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
         parser.print_help(sys.stderr)
         sys.exit(1)
 
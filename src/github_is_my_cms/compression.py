@@ -0,0 +1,36 @@
+# src/github_is_my_cms/compression.py
+"""
+Precompressed variants (.gz, .br) of generated files.
+
+Output is reproducible: gzip headers carry no mtime or filename, so the same
+input always yields the same bytes and unchanged files stay unchanged on disk.
+"""
+
+from __future__ import annotations
+
+import gzip
+from typing import Dict
+
+import brotli
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# File suffix -> HTTP Content-Encoding
+ENCODINGS = {".gz": "gzip", ".br": "br"}
+
+# Suffixes of the variants compressed_variants() produces
+SUFFIXES = tuple(ENCODINGS)
+
+
+def gzip_bytes(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def brotli_bytes(data: bytes) -> bytes:
+    return brotli.compress(data, quality=BROTLI_QUALITY)
+
+
+def compressed_variants(data: bytes) -> Dict[str, bytes]:
+    """File suffix -> compressed bytes for every encoding."""
+    return {".gz": gzip_bytes(data), ".br": brotli_bytes(data)}
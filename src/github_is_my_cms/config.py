@@ -6,15 +6,20 @@ Responsible for reading TOML files and instantiating the CMSConfig model.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import sys
 import tomllib
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
-from httpie.output.ui.rich_help import to_help_message
+import orjson
+import pydantic
 
+from . import models
+from .atomic_write import atomic_write_bytes
 from .models import CMSConfig
+from .profiling import stage
 
 logger = logging.getLogger(__name__)
 
@@ -78,16 +83,82 @@ def assign_groups(
     return projects_data
 
 
+# Bump to invalidate every existing snapshot
+SNAPSHOT_VERSION = 2
+
+DATA_FILES = (
+    "identity.toml",
+    "identity_graph.toml",
+    "skills.toml",
+    "projects.toml",
+    "pypi_projects.toml",
+    "work_experience.toml",
+    "resumes.toml",
+)
+
+
 class ConfigLoader:
     """
     Loads and merges data from multiple TOML sources as defined in GHIP-001.
+
+    The validated CMSConfig is also saved as a JSON snapshot in .cache/,
+    keyed by the hashes of the source files, the loader/model code and the
+    pydantic version. While none of those change, load() restores it with
+    CMSConfig.model_validate_json instead of re-parsing the TOML and re-running
+    the merge logic.
+
+    The snapshot is a plain working-tree file, so it is treated as untrusted
+    input, exactly like the TOML it stands in for: it is data, never code
+    (no pickle), and it goes through full model validation on every restore.
     """
 
-    def __init__(self, root_dir: Path):
+    def __init__(self, root_dir: Path, use_snapshot: bool = True):
         self.root_dir = root_dir
         # CHANGED: Data directory is now expected in the user's project root, not the package source
         self.data_dir = self.root_dir / "data"
         self.config_file = self.root_dir / "readme_cms.toml"
+        self.use_snapshot = use_snapshot
+        self.snapshot_file = self.root_dir / ".cache" / "config_snapshot.json"
+
+    def source_files(self) -> List[Path]:
+        """Every file whose content affects the loaded config."""
+        return [
+            self.config_file,
+            *(self.data_dir / name for name in DATA_FILES),
+            Path(__file__),
+            Path(models.__file__),
+        ]
+
+    def snapshot_key(self) -> str:
+        digest = hashlib.sha256(
+            f"v{SNAPSHOT_VERSION} pydantic {pydantic.VERSION}".encode("utf-8")
+        )
+        for path in self.source_files():
+            digest.update(path.name.encode("utf-8") + b"\0")
+            digest.update(path.read_bytes() if path.exists() else b"<missing>")
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _read_snapshot(self, key: str) -> Optional[CMSConfig]:
+        """The snapshot's config if it was written for `key`, else None."""
+        if not self.snapshot_file.exists():
+            return None
+        # "<key>\n<config JSON>": a stale key is rejected without parsing the rest
+        stored_key, _, data = self.snapshot_file.read_bytes().partition(b"\n")
+        if stored_key.decode("ascii", "replace") != key:
+            return None
+        try:
+            return CMSConfig.model_validate_json(data)
+        except pydantic.ValidationError as e:
+            # Damaged or edited by hand; rebuild it from the sources
+            logger.debug(f"Ignoring invalid config snapshot: {e}")
+            return None
+
+    def _write_snapshot(self, key: str, config: CMSConfig) -> None:
+        data = orjson.dumps(config.model_dump(mode="json"))
+        atomic_write_bytes(
+            self.snapshot_file, key.encode("ascii") + b"\n" + data, fsync=False
+        )
 
     def _load_toml_file(self, filepath: Path) -> Dict[str, Any]:
         """Helper to safely load a TOML file if it exists."""
@@ -99,11 +170,28 @@ class ConfigLoader:
             return tomllib.load(f)
 
     def load(self) -> CMSConfig:
+        """
+        Returns the validated CMSConfig, from the snapshot when it is current.
+        """
+        if not self.use_snapshot:
+            return self.load_sources()
+
+        key = self.snapshot_key()
+        config = self._read_snapshot(key)
+        if config is not None:
+            logger.debug("Loaded config from snapshot")
+            return config
+
+        config = self.load_sources()
+        self._write_snapshot(key, config)
+        return config
+
+    def load_sources(self) -> CMSConfig:
         """
         Aggregates all data sources into a single validated CMSConfig object.
         """
         # 1. Load Main Config (readme_cms.toml)
-        # Contains: modes, languages
+        # Contains: modes, languages, build options
         main_config = self._load_toml_file(self.config_file)
 
         # 2. Load Identity Data (identity.toml & identity_graph.toml)
@@ -137,7 +225,8 @@ class ConfigLoader:
         # Manually curated projects
         projects_data = self._load_toml_file(self.data_dir / "projects.toml")
         projects_list = projects_data.get("projects", [])
-        assign_groups(projects_list)
+        with stage("assign_groups"):
+            assign_groups(projects_list)
 
         # 4. Load PyPI Metadata (pypi_projects.toml)
         # Automated data from weekly workflow
@@ -179,15 +268,17 @@ class ConfigLoader:
             "projects": projects_list,
             "pypi_packages": pypi_list,
             "theme": main_config.get("theme", "default"),
+            "build": main_config.get("build", {}),
             "work_experience": experience_list,
             "resumes": resumes_list,
         }
 
         # 6. Validate and Return
         # This triggers all Pydantic validators, including "No Twitter/X".
-        return CMSConfig(**config_dict)
+        with stage("config validation"):
+            return CMSConfig(**config_dict)
 
 
-def load_config(root_path: str = ".") -> CMSConfig:
+def load_config(root_path: str = ".", use_snapshot: bool = True) -> CMSConfig:
     """Convenience entry point."""
-    return ConfigLoader(Path(root_path)).load()
+    return ConfigLoader(Path(root_path), use_snapshot=use_snapshot).load()
@@ -3,69 +3,136 @@ data_sources.py
 Handles fetching external data from PyPI and GitHub APIs to update local TOML caches.
 """
 
+import asyncio
 import json
 import logging
+import os
 import shutil
 import subprocess
+import threading
 import tomllib
 import urllib.error
 import urllib.request
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
 
 import httpx
 import tomli_w
 from bs4 import BeautifulSoup
 
+from .atomic_write import atomic_write_text
+from .cache import DEFAULT_TTL, CacheBackend, DirectoryCache, create_backend
 from .config import load_config  # Needed to get the username
+from .http_cache import HttpCache
+from .project_sync import ProjectMerger, SyncReport
 
 logger = logging.getLogger(__name__)
 
 
 class BaseFetcher:
-    """Base class for cached fetchers."""
+    """
+    Base class for cached fetchers.
+    Caching goes through a pluggable CacheBackend (a directory of JSON files by
+    default) with a per-entry TTL and an optional stale-while-revalidate window:
+    an expired entry inside the window is returned immediately while a
+    background thread refreshes it.
+    """
 
-    def __init__(self, cache_dir: Path, cache_filename: str):
+    def __init__(
+        self,
+        cache_dir: Path,
+        cache_filename: str,
+        cache: Optional[CacheBackend] = None,
+        ttl: float = DEFAULT_TTL,
+        stale_while_revalidate: float = 0.0,
+    ):
         self.cache_dir = cache_dir
-        self.cache_file = self.cache_dir / cache_filename
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_key = Path(cache_filename).stem
+        self.cache = cache if cache is not None else DirectoryCache(self.cache_dir)
+        # Where the entry lives when using the default DirectoryCache
+        self.cache_file = self.cache_dir / cache_filename
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self._revalidations: List[threading.Thread] = []
 
     def _is_cache_valid(self) -> bool:
-        """Returns True if cache exists and is less than 24 hours old."""
-        if not self.cache_file.exists():
-            return False
-        mtime = self.cache_file.stat().st_mtime
-        age = datetime.now().timestamp() - mtime
-        return age < (24 * 60 * 60)  # 24 hours
+        """Returns True if the cache entry exists and has not expired."""
+        entry = self.cache.get_entry(self.cache_key)
+        return entry is not None and not entry.is_expired()
+
+    def _cached(
+        self, fetch: Callable[[], Optional[Any]], key: Optional[str] = None
+    ) -> Optional[Any]:
+        """
+        Returns the cached value if fresh (or stale but revalidating), otherwise
+        calls fetch() and caches its result. fetch() returns None on failure,
+        which is never cached. `key` defaults to the fetcher's cache_key.
+        """
+        key = key or self.cache_key
+        entry = self.cache.get_entry(key)
+        if entry is not None:
+            if not entry.is_expired():
+                logger.info(f"{type(self).__name__}: Using cached data.")
+                return entry.value
+            if entry.is_usable_stale(self.stale_while_revalidate):
+                logger.info(f"{type(self).__name__}: Using stale data, revalidating.")
+                self._revalidate(fetch, key)
+                return entry.value
+
+        value = fetch()
+        if value is not None:
+            self.cache.set(key, value, ttl=self.ttl)
+        return value
+
+    def _revalidate(self, fetch: Callable[[], Optional[Any]], key: str) -> None:
+        def refresh() -> None:
+            value = fetch()
+            if value is not None:
+                self.cache.set(key, value, ttl=self.ttl)
+
+        # Not a daemon: the interpreter waits for the refresh before exiting
+        thread = threading.Thread(target=refresh, name=f"revalidate-{key}")
+        thread.start()
+        self._revalidations.append(thread)
+
+    def wait_for_revalidation(self) -> None:
+        for thread in self._revalidations:
+            thread.join()
+        self._revalidations.clear()
 
 
 class GitHubFetcher(BaseFetcher):
     """
     Fetches repository metadata using the 'gh' CLI tool.
-    Implements a 24-hour file-based cache.
+    Cached for 24 hours by default.
     """
 
-    def __init__(self, cache_dir: Path):
-        super().__init__(cache_dir, "github_repos.json")
+    def __init__(
+        self,
+        cache_dir: Path,
+        cache: Optional[CacheBackend] = None,
+        stale_while_revalidate: float = 0.0,
+    ):
+        super().__init__(
+            cache_dir,
+            "github_repos.json",
+            cache=cache,
+            stale_while_revalidate=stale_while_revalidate,
+        )
 
     def fetch_repos(self) -> List[Dict[str, Any]]:
         """
         Returns a list of public repositories.
         Uses cached data if fresh; otherwise calls 'gh repo list'.
         """
-        # 1. Check Cache
-        if self._is_cache_valid():
-            logger.info("GitHub: Using cached repository data.")
-            try:
-                return json.loads(self.cache_file.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                logger.warning("GitHub: Cache corrupted. Refetching.")
+        return self._cached(self._fetch_from_cli) or []
 
-        # 2. Fetch via GH CLI
+    def _fetch_from_cli(self) -> Optional[List[Dict[str, Any]]]:
         if not shutil.which("gh"):
             logger.error("GitHub: 'gh' CLI not found on PATH. Cannot sync projects.")
-            return []
+            return None
 
         logger.info("GitHub: Fetching fresh repository list...")
 
@@ -84,18 +151,144 @@ class GitHubFetcher(BaseFetcher):
 
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
-
-            # 3. Update Cache
-            self.cache_file.write_text(json.dumps(data, indent=2), encoding="utf-8")
-            return data
+            return json.loads(result.stdout)
 
         except subprocess.CalledProcessError as e:
             logger.error(f"GitHub: CLI command failed: {e.stderr}")
-            return []
+            return None
         except json.JSONDecodeError:
             logger.error("GitHub: Failed to parse CLI output.")
-            return []
+            return None
+
+
+class GitHubGraphQLFetcher:
+    """
+    Streams a user's or organization's public, non-fork repositories from the
+    GitHub GraphQL API, one cursor page at a time.
+
+    Repositories come newest-updated first, so a "since" sync stops paging at
+    the first repository not updated after the previous sync. Records are
+    yielded in the same shape as `gh repo list --json` output.
+    """
+
+    API_URL = "https://api.github.com/graphql"
+    QUERY = """
+    query($owner: String!, $first: Int!, $after: String) {
+      repositoryOwner(login: $owner) {
+        repositories(
+          first: $first
+          after: $after
+          privacy: PUBLIC
+          isFork: false
+          orderBy: {field: UPDATED_AT, direction: DESC}
+        ) {
+          pageInfo { hasNextPage endCursor }
+          nodes {
+            name
+            description
+            url
+            homepageUrl
+            isArchived
+            updatedAt
+            primaryLanguage { name }
+            repositoryTopics(first: 20) { nodes { topic { name } } }
+          }
+        }
+      }
+    }
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        api_url: Optional[str] = None,
+        page_size: int = 100,
+        timeout: float = 30.0,
+    ):
+        self.token = token if token is not None else self._discover_token()
+        self.api_url = api_url or self.API_URL
+        self.page_size = page_size
+        self.timeout = timeout
+        # Highest updatedAt seen by the last completed iter_repos()
+        self.last_updated_at: Optional[str] = None
+
+    @staticmethod
+    def _discover_token() -> Optional[str]:
+        for name in ("GITHUB_TOKEN", "GH_TOKEN"):
+            if os.environ.get(name):
+                return os.environ[name]
+        if not shutil.which("gh"):
+            return None
+        result = subprocess.run(
+            ["gh", "auth", "token"], capture_output=True, text=True, check=False
+        )
+        return result.stdout.strip() or None
+
+    @property
+    def available(self) -> bool:
+        return bool(self.token)
+
+    def iter_repos(
+        self, owner: str, since: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields repositories of `owner`. With `since` (an ISO-8601 updatedAt),
+        only repositories updated after it are fetched.
+        """
+        headers = {
+            "Authorization": f"bearer {self.token}",
+            "User-Agent": PyPIStatsFetcher.USER_AGENT,
+        }
+        self.last_updated_at = None
+        newest = since
+        cursor = None
+        with httpx.Client(headers=headers, timeout=self.timeout) as client:
+            while True:
+                page = self._fetch_page(client, owner, cursor)
+                if page is None:
+                    return
+                for node in page["nodes"]:
+                    if since is not None and node["updatedAt"] <= since:
+                        self.last_updated_at = newest
+                        return
+                    if newest is None or node["updatedAt"] > newest:
+                        newest = node["updatedAt"]
+                    yield self._normalize(node)
+                if not page["pageInfo"]["hasNextPage"]:
+                    break
+                cursor = page["pageInfo"]["endCursor"]
+        self.last_updated_at = newest
+
+    def _fetch_page(
+        self, client: httpx.Client, owner: str, cursor: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        variables = {"owner": owner, "first": self.page_size, "after": cursor}
+        response = client.post(
+            self.api_url, json={"query": self.QUERY, "variables": variables}
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get("errors"):
+            raise RuntimeError(f"GitHub GraphQL error: {payload['errors']}")
+        repository_owner = payload["data"]["repositoryOwner"]
+        if repository_owner is None:
+            logger.warning(f"GitHub: Owner '{owner}' not found.")
+            return None
+        return repository_owner["repositories"]
+
+    @staticmethod
+    def _normalize(node: Dict[str, Any]) -> Dict[str, Any]:
+        topics = (node.get("repositoryTopics") or {}).get("nodes") or []
+        return {
+            "name": node["name"],
+            "description": node.get("description"),
+            "url": node.get("url"),
+            "homepageUrl": node.get("homepageUrl"),
+            "isArchived": node.get("isArchived", False),
+            "updatedAt": node.get("updatedAt"),
+            "primaryLanguage": node.get("primaryLanguage"),
+            "repositoryTopics": [{"name": t["topic"]["name"]} for t in topics],
+        }
 
 
 class PyPIDiscoveryFetcher(BaseFetcher):
@@ -105,8 +298,22 @@ class PyPIDiscoveryFetcher(BaseFetcher):
 
     BASE_URL = "https://pypi.org/user"
 
-    def __init__(self, cache_dir: Path):
-        super().__init__(cache_dir, "pypi_discovery.json")
+    def __init__(
+        self,
+        cache_dir: Path,
+        cache: Optional[CacheBackend] = None,
+        stale_while_revalidate: float = 0.0,
+    ):
+        super().__init__(
+            cache_dir,
+            "pypi_discovery.json",
+            cache=cache,
+            stale_while_revalidate=stale_while_revalidate,
+        )
+
+    def user_cache_key(self, username: str) -> str:
+        """One cache entry per user, so switching users keeps both."""
+        return f"{self.cache_key}:{username}"
 
     def fetch_user_packages(self, username: str) -> List[str]:
         """
@@ -115,19 +322,13 @@ class PyPIDiscoveryFetcher(BaseFetcher):
         if not username:
             return []
 
-        # 1. Check Cache
-        if self._is_cache_valid():
-            try:
-                data = json.loads(self.cache_file.read_text(encoding="utf-8"))
-                if data.get("user") == username:
-                    logger.info(
-                        f"PyPI: Using cached package list for user '{username}'."
-                    )
-                    return data.get("packages", [])
-            except json.JSONDecodeError:
-                pass
+        data = self._cached(
+            lambda: self._discover(username), key=self.user_cache_key(username)
+        )
+        return data.get("packages", []) if data else []
 
-        # 2. Fetch via HTTPX + BS4
+    def _discover(self, username: str) -> Optional[Dict[str, Any]]:
+        # Fetch via HTTPX + BS4
         logger.info(
             f"PyPI: Discovering packages for user '{username}' via HTML scraping..."
         )
@@ -144,7 +345,7 @@ class PyPIDiscoveryFetcher(BaseFetcher):
 
                 if response.status_code == 404:
                     logger.warning(f"PyPI: User '{username}' not found.")
-                    return []
+                    return None
 
                 response.raise_for_status()
 
@@ -156,76 +357,165 @@ class PyPIDiscoveryFetcher(BaseFetcher):
                     list(set(s.get_text(strip=True) for s in snippets))
                 )
 
-            # 3. Save Cache
-            cache_payload = {
+            return {
                 "user": username,
                 "timestamp": datetime.now().isoformat(),
                 "packages": package_names,
             }
-            self.cache_file.write_text(
-                json.dumps(cache_payload, indent=2), encoding="utf-8"
-            )
-
-            return package_names
 
         except httpx.HTTPError as e:
             logger.error(f"PyPI Discovery HTTP error: {e}")
-            return []
+            return None
         except Exception as e:
             logger.error(f"PyPI Discovery failed: {e}")
-            return []
+            return None
 
 
 class PyPIStatsFetcher:
     """
     Fetches detailed metadata for a specific package from JSON API.
-    Does not cache individual files to avoid thousands of small files;
-    relies on upper layer to manage frequency or the global build cache.
+
+    fetch_many() fetches many packages concurrently over one pooled
+    httpx.AsyncClient, with a concurrency limit, per-request timeouts and
+    retry with exponential backoff. If an HttpCache is given, responses are
+    kept in one SQLite file: fresh entries skip the network entirely and
+    stale ones are revalidated with ETag/Last-Modified (304 Not Modified).
     """
 
     BASE_URL = "https://pypi.org/pypi/{package}/json"
+    USER_AGENT = "github-is-my-cms/0.1.0"
+    # Statuses worth retrying; anything else non-200 is treated as "no data"
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        concurrency: int = 16,
+        timeout: float = 10.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        cache: Optional[HttpCache] = None,
+    ):
+        self.base_url = base_url or self.BASE_URL
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache
 
     def fetch_details(self, package_name: str) -> Dict[str, Any]:
-        url = self.BASE_URL.format(package=package_name)
-        try:
-            req = urllib.request.Request(
-                url, headers={"User-Agent": "github-is-my-cms/0.1.0"}
-            )
-            with urllib.request.urlopen(req) as response:
-                if response.status != 200:
-                    return {}
-                data = json.loads(response.read().decode())
-                info = data.get("info", {})
+        """Details for one package, over the same client, timeout and cache."""
+        return self.fetch_many([package_name]).get(package_name, {})
 
-                # ADDED: Extract keywords. PyPI sends them as a string "tag1, tag2" or list.
-                raw_keywords = info.get("keywords", [])
-                tags = []
-                if isinstance(raw_keywords, str):
-                    # specific cleanup for PyPI keyword strings
-                    if raw_keywords:
-                        tags = [
-                            k.strip() for k in raw_keywords.replace(",", " ").split()
-                        ]
-                elif isinstance(raw_keywords, list):
-                    tags = raw_keywords
+    def fetch_many(self, package_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetches details for all packages concurrently.
+        Returns package_name -> details ({} for packages that could not be fetched).
+        """
+        if not package_names:
+            return {}
+        return asyncio.run(self._fetch_many_async(package_names))
+
+    async def _fetch_many_async(
+        self, package_names: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limits = httpx.Limits(
+            max_connections=self.concurrency,
+            max_keepalive_connections=self.concurrency,
+        )
 
-                return {
-                    "package_name": package_name,
-                    "version": info.get("version"),
-                    "summary": info.get("summary"),
-                    "docs_url": info.get("home_page") or info.get("project_url"),
-                    # Note: pypistats.org is required for real download counts.
-                    # Providing a placeholder or existing logic here.
-                    "last_updated": date.today().isoformat(),
-                    # Attempt to find GitHub repo in project_urls
-                    "github_repo": self._extract_github_repo(
-                        info.get("project_urls") or {}
-                    ),
-                    "tags": tags,
-                }
-        except urllib.error.URLError as e:
-            logger.warning(f"Failed to fetch details for {package_name}: {e}")
+        async with httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=limits,
+            headers={"User-Agent": self.USER_AGENT},
+        ) as client:
+
+            async def fetch_one(name: str) -> tuple[str, Dict[str, Any]]:
+                async with semaphore:
+                    return name, await self._fetch_details_async(client, name)
+
+            results = await asyncio.gather(*(fetch_one(n) for n in package_names))
+        return dict(results)
+
+    async def _fetch_details_async(
+        self, client: httpx.AsyncClient, package_name: str
+    ) -> Dict[str, Any]:
+        url = self.base_url.format(package=package_name)
+
+        cached = self.cache.get(url) if self.cache else None
+        headers: Dict[str, str] = {}
+        if cached:
+            if self.cache.is_fresh(cached):
+                return self._parse_body(package_name, cached.body)
+            headers = self.cache.conditional_headers(cached)
+
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            try:
+                response = await client.get(url, headers=headers)
+            except httpx.HTTPError as e:
+                if last_attempt:
+                    logger.warning(f"Failed to fetch details for {package_name}: {e}")
+                    return {}
+            else:
+                if response.status_code == 304 and cached:
+                    logger.debug(f"PyPI: {package_name} not modified.")
+                    self.cache.touch(url)
+                    return self._parse_body(package_name, cached.body)
+                if response.status_code == 200:
+                    details = self._parse_body(package_name, response.content)
+                    # Only a body that parsed is worth revalidating later
+                    if details and self.cache:
+                        self.cache.put(
+                            url,
+                            response.content,
+                            etag=response.headers.get("etag"),
+                            last_modified=response.headers.get("last-modified"),
+                        )
+                    return details
+                if response.status_code not in self.RETRY_STATUSES or last_attempt:
+                    logger.warning(
+                        f"PyPI: {package_name} returned status {response.status_code}"
+                    )
+                    return {}
+            await asyncio.sleep(self.backoff * (2**attempt))
+        return {}
+
+    def _parse_body(self, package_name: str, body: bytes) -> Dict[str, Any]:
+        """Details from a JSON response body ({} if the body is not valid JSON)."""
+        try:
+            data = json.loads(body)
+        except ValueError as e:
+            logger.warning(f"PyPI: {package_name} returned malformed JSON: {e}")
             return {}
+        return self._parse_details(package_name, data)
+
+    def _parse_details(self, package_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        info = data.get("info", {})
+
+        # ADDED: Extract keywords. PyPI sends them as a string "tag1, tag2" or list.
+        raw_keywords = info.get("keywords", [])
+        tags = []
+        if isinstance(raw_keywords, str):
+            # specific cleanup for PyPI keyword strings
+            if raw_keywords:
+                tags = [k.strip() for k in raw_keywords.replace(",", " ").split()]
+        elif isinstance(raw_keywords, list):
+            tags = raw_keywords
+
+        return {
+            "package_name": package_name,
+            "version": info.get("version"),
+            "summary": info.get("summary"),
+            "docs_url": info.get("home_page") or info.get("project_url"),
+            # Note: pypistats.org is required for real download counts.
+            # Providing a placeholder or existing logic here.
+            "last_updated": date.today().isoformat(),
+            # Attempt to find GitHub repo in project_urls
+            "github_repo": self._extract_github_repo(info.get("project_urls") or {}),
+            "tags": tags,
+        }
 
     def _extract_github_repo(self, urls: Dict[str, str]) -> Optional[str]:
         """Tries to find 'owner/repo' from project links."""
@@ -281,7 +571,18 @@ class DataUpdater:
     Orchestrates the update of local TOML files with remote data.
     """
 
-    def __init__(self, root_dir: Path):
+    def __init__(
+        self,
+        root_dir: Path,
+        concurrency: int = 16,
+        http_cache_ttl: float = 3600.0,
+        cache_backend: str = "directory",
+        cache_max_entries: Optional[int] = None,
+        stale_while_revalidate: float = 0.0,
+        full_sync: bool = False,
+        github_token: Optional[str] = None,
+        github_api_url: Optional[str] = None,
+    ):
         self.root_dir = root_dir
         self.data_dir = self.root_dir / "data"
         self.cache_dir = self.root_dir / ".cache"
@@ -291,10 +592,30 @@ class DataUpdater:
         # Cache location (hidden inside data or a temp dir)
         self.cache_dir = self.root_dir / ".cache"
 
-        # Initialize Fetchers
-        self.gh_fetcher = GitHubFetcher(self.cache_dir)
-        self.pypi_discovery = PyPIDiscoveryFetcher(self.cache_dir)
-        self.pypi_details = PyPIStatsFetcher()
+        # Initialize Fetchers (sharing one cache backend)
+        self.cache = create_backend(
+            cache_backend, self.cache_dir, max_entries=cache_max_entries
+        )
+        self.gh_fetcher = GitHubFetcher(
+            self.cache_dir,
+            cache=self.cache,
+            stale_while_revalidate=stale_while_revalidate,
+        )
+        self.gh_graphql = GitHubGraphQLFetcher(
+            token=github_token, api_url=github_api_url
+        )
+        # Last updatedAt merged from GitHub; later syncs only fetch newer repos
+        self.github_sync_file = self.cache_dir / "github_sync.json"
+        self.full_sync = full_sync
+        self.pypi_discovery = PyPIDiscoveryFetcher(
+            self.cache_dir,
+            cache=self.cache,
+            stale_while_revalidate=stale_while_revalidate,
+        )
+        self.pypi_details = PyPIStatsFetcher(
+            concurrency=concurrency,
+            cache=HttpCache(self.cache_dir / "http_cache.sqlite3", ttl=http_cache_ttl),
+        )
 
         # Load config to get usernames
         # Note: We do this here so the CLI doesn't have to pass the config obj
@@ -312,10 +633,12 @@ class DataUpdater:
         with open(path, "rb") as f:
             return tomllib.load(f)
 
-    def update_projects_from_github(self):
+    def update_projects_from_github(self) -> Optional[SyncReport]:
         """
-        Syncs projects.toml with GitHub.
+        Syncs projects.toml with GitHub in a single merge pass and writes the
+        file once, only if something changed.
         Preserves 'cms' directives and unknown non-GitHub projects.
+        Returns the added/updated/gone report, or None if the fetch failed.
         """
         logger.info("Syncing projects from GitHub...")
 
@@ -326,91 +649,54 @@ class DataUpdater:
         existing_data = self._load_toml(self.projects_file)
         existing_projects = existing_data.get("projects", [])
 
-        # Create a lookup for existing projects by slug
-        # We assume slug == repo name for GitHub projects
-        project_map = {p["slug"]: p for p in existing_projects}
-
-        # 2. Fetch Fresh Data
-        gh_repos = self.gh_fetcher.fetch_repos()
-        if not gh_repos:
-            logger.warning("No repositories found or fetch failed.")
-            return
-
-        active_slugs = set()
-
-        for repo in gh_repos:
-            # If a target user is set in config, strict filter, otherwise accept all found by 'gh'
-            # (assuming 'gh' is authenticated as the user)
-            # repo_owner = repo['name'].split('/')[0] if '/' in repo['name'] else ''
-            # Note: gh repo list usually returns 'owner/repo' in name field?
-            # Actually, standard json output name is just 'repo'. owner is separate.
-            # Let's trust the current 'gh repo list' context.
-
-            slug = repo["name"]
-            active_slugs.add(slug)
-
-            # Extract GitHub Data
-            description = repo.get("description") or ""
-            url = repo.get("url")
-            homepage = repo.get("homepageUrl")
-            topics = [t["name"] for t in (repo.get("repositoryTopics", []) or [])]
-            is_archived = repo.get("isArchived", False)
-
-            # Format is usually {"primaryLanguage": {"name": "Python"}} or null
-            prim_lang = repo.get("primaryLanguage", {}) or {}
-            language_name = prim_lang.get("name", "N/A")  # e.g. "Python" or None
-
-            status = "archived" if is_archived else "active"
-
-            # 3. Merge Strategy
-            if slug in project_map:
-                # Update existing entry
-                entry = project_map[slug]
-
-                # Overwrite synced fields
-                entry["description"] = description
-                entry["repository_url"] = url
-                # If homepage is set on GH, use it as 'url' (project link),
-                # otherwise fallback to repo url or keep existing.
-                if homepage:
-                    entry["url"] = homepage
-                elif "url" not in entry:
-                    entry["url"] = url
-
-                entry["tags"] = topics
-                entry["status"] = status
-                entry["primary_language"] = language_name
-
-                # CMS Directive Preservation:
-                # We simply DON'T touch the 'cms' key if it exists.
-                # If the user wants to add one, they do it manually in the TOML.
-            else:
-                # Create new entry
-                entry = {
-                    "slug": slug,
-                    "name": slug,  # Default name to slug
-                    "description": description,
-                    "url": homepage if homepage else url,
-                    "repository_url": url,
-                    "tags": topics,
-                    "status": status,
-                    # Initialize empty CMS directive container for future use
-                    "primary_language": language_name,
-                    "cms": {"suppress": False, "package_links": []},
-                }
-                project_map[slug] = entry
-
-            # Mark missing as gone
-            for slug, entry in project_map.items():
-                if slug not in active_slugs:
-                    if "github.com" in str(entry.get("repository_url", "")):
-                        entry["status"] = "gone"
+        # 2. Fetch Fresh Data (streamed page by page when using the GraphQL API)
+        use_graphql = bool(target_user) and self.gh_graphql.available
+        since = None
+        if use_graphql:
+            if not self.full_sync:
+                since = self._load_github_watermark(target_user)
+            if since:
+                logger.info(f"Fetching repositories updated since {since}...")
+            gh_repos = self.gh_graphql.iter_repos(target_user, since=since)
+        else:
+            gh_repos = self.gh_fetcher.fetch_repos()
 
-            sorted_projects = sorted(project_map.values(), key=lambda x: x["slug"])
-            with open(self.projects_file, "wb") as f:
-                tomli_w.dump({"projects": sorted_projects}, f)
+        # 3. Merge (a "since" sync only sees changed repos, so nothing is gone)
+        merger = ProjectMerger(existing_projects, mark_gone=since is None)
+        report = merger.merge(gh_repos)
 
-            logger.info(f"Synced {len(sorted_projects)} projects.")
+        if not merger.seen and not since:
+            logger.warning("No repositories found or fetch failed.")
+            return None
+
+        for kind in ("added", "updated", "gone"):
+            for slug in getattr(report, kind):
+                logger.info(f"  {kind}: {slug}")
+
+        if report.changed:
+            # Serialized up front, so a serialization error cannot truncate the file
+            atomic_write_text(
+                self.projects_file,
+                tomli_w.dumps({"projects": merger.projects}),
+                backup=True,
+            )
+        logger.info(f"Synced {len(merger.project_map)} projects ({report}).")
+
+        if use_graphql and self.gh_graphql.last_updated_at:
+            self._save_github_watermark(target_user, self.gh_graphql.last_updated_at)
+        return report
+
+    def _load_github_watermark(self, owner: str) -> Optional[str]:
+        if not self.github_sync_file.exists():
+            return None
+        state = json.loads(self.github_sync_file.read_text(encoding="utf-8"))
+        return state.get("updated_at") if state.get("owner") == owner else None
+
+    def _save_github_watermark(self, owner: str, updated_at: str) -> None:
+        atomic_write_text(
+            self.github_sync_file,
+            json.dumps({"owner": owner, "updated_at": updated_at}),
+        )
 
     def update_pypi_data(self):
         """
@@ -453,9 +739,10 @@ class DataUpdater:
         updated_list = []
         logger.info(f"Updating details for {len(pkg_map)} packages...")
 
+        details_by_name = self.pypi_details.fetch_many(list(pkg_map))
+
         for name, pkg_data in pkg_map.items():
-            logger.debug(f"Fetching details for {name}...")
-            details = self.pypi_details.fetch_details(name)
+            details = details_by_name.get(name)
             if details:
                 # Merge logic: Remote details overwrite cached details,
                 # but manual overrides in TOML (if any existed and we cared)
@@ -477,8 +764,9 @@ class DataUpdater:
         # 4. Sort and Save
         updated_list.sort(key=lambda x: x["package_name"].lower())
 
-        with open(self.pypi_file, "wb") as f:
-            tomli_w.dump({"packages": updated_list}, f)
+        atomic_write_text(
+            self.pypi_file, tomli_w.dumps({"packages": updated_list}), backup=True
+        )
 
         logger.info(
             f"Successfully updated {self.pypi_file} with {len(updated_list)} packages."
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import tomli_w
 
+from github_is_my_cms.atomic_write import atomic_write_text
 from github_is_my_cms.builder import SiteBuilder
 
 # Configure logging
@@ -162,8 +163,7 @@ def run_generation():
 
     output_path = Path("data/skills.new.toml")
 
-    with open(output_path, "wb") as f:
-        tomli_w.dump(toml_structure, f)
+    atomic_write_text(output_path, tomli_w.dumps(toml_structure))
 
     print(f"   ✅ Success. File written to {output_path}")
     print("   NEXT STEPS:")
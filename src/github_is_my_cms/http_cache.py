@@ -0,0 +1,99 @@
+# src/github_is_my_cms/http_cache.py
+"""
+Persistent HTTP response cache for the remote JSON APIs (PyPI).
+One SQLite file keyed by URL, instead of thousands of small files.
+
+Entries younger than the TTL are served without touching the network.
+Older entries are revalidated with If-None-Match / If-Modified-Since,
+so unchanged documents come back as a cheap 304.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class HttpCache:
+    """
+    URL -> (body, validators) store backed by a single SQLite database.
+    """
+
+    def __init__(self, path: Path, ttl: float = 3600.0):
+        self.path = path
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(SCHEMA)
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        row = self._conn.execute(
+            "SELECT url, body, etag, last_modified, fetched_at FROM responses WHERE url = ?",
+            (url,),
+        ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """True if the entry may be served without a network call."""
+        return entry.age() < self.ttl
+
+    def conditional_headers(self, entry: CachedResponse) -> Dict[str, str]:
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (url, body, etag, last_modified, fetched_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (url, body, etag, last_modified, time.time()),
+        )
+        self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Marks an entry as revalidated (after a 304 Not Modified)."""
+        self._conn.execute(
+            "UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url)
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
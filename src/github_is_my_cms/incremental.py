@@ -0,0 +1,313 @@
+# src/github_is_my_cms/incremental.py
+"""
+Incremental build support for the README CMS.
+
+Records a manifest of content hashes for every build input (data TOML,
+readme_cms.toml, theme templates, src/content, package files copied into the
+output such as static/search.js, and the package version) and, for each
+build unit, which inputs it depends on and which outputs it produced. On the
+next build only units whose inputs changed, or whose outputs went missing,
+are rendered.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+import orjson
+
+from .__about__ import __version__
+from .atomic_write import atomic_write_bytes
+from .build_context import BuildContext
+from .builder import SiteBuilder
+from .builder_api import SiteBuilderAPI
+from .output_writer import OutputWriter, WriteStats
+from .profiling import stage
+from .search_index import LOADER_SOURCE
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Build unit keys. Page units are "markdown:<template>" / "html:<template>".
+API_UNIT = "api"
+SKILLS_UNIT = "skills"
+SKILL_TEMPLATE = "skill_detail.html.j2"
+
+# Input key of the package version: an upgrade can change any generated file
+VERSION_INPUT = "<github-is-my-cms version>"
+
+PACKAGE_DIR = Path(__file__).parent
+
+
+def hash_file(path: Path) -> str:
+    """Returns the sha256 of a file, or an empty string if it does not exist."""
+    if not path.is_file():
+        return ""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _files_under(directory: Path) -> List[Path]:
+    if not directory.exists():
+        return []
+    return sorted(p for p in directory.rglob("*") if p.is_file())
+
+
+class BuildManifest:
+    """
+    Persisted dependency graph: unit -> {input path: hash} and unit -> outputs.
+    Paths are stored relative to the repository root.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.units: Dict[str, Dict[str, Any]] = {}
+
+    def load(self) -> "BuildManifest":
+        if not self.path.exists():
+            return self
+        try:
+            data = orjson.loads(self.path.read_bytes())
+        except orjson.JSONDecodeError:
+            logger.warning(f"Build manifest {self.path} is corrupted; ignoring it.")
+            return self
+        if data.get("version") == MANIFEST_VERSION:
+            self.units = data.get("units", {})
+        return self
+
+    def save(self) -> None:
+        payload = {"version": MANIFEST_VERSION, "units": self.units}
+        atomic_write_bytes(
+            self.path, orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+        )
+
+
+@dataclass
+class BuildPlan:
+    """The result of comparing the current inputs against the manifest."""
+
+    # unit key -> {relative input path: hash}
+    inputs: Dict[str, Dict[str, str]]
+    dirty: Set[str] = field(default_factory=set)
+    # units present in the manifest whose template no longer exists
+    removed: Set[str] = field(default_factory=set)
+
+    @property
+    def up_to_date(self) -> bool:
+        return not self.dirty and not self.removed
+
+
+class IncrementalPlanner:
+    """
+    Works out the build units and their inputs without loading the CMS config,
+    so a no-op rebuild costs only a handful of file hashes and stat calls.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.data_dir = self.root / "data"
+        self.config_file = self.root / "readme_cms.toml"
+        # Mirrors the (src-relative) layout used by SiteBuilder
+        self.content_dir = self.root / "src" / "content"
+        self.templates_dir = (
+            self.root / "src" / "github_is_my_cms" / "templates" / self._theme()
+        )
+
+    def _theme(self) -> str:
+        if not self.config_file.exists():
+            return "default"
+        with open(self.config_file, "rb") as f:
+            return tomllib.load(f).get("theme", "default")
+
+    def _rel(self, path: Path) -> str:
+        if path.is_relative_to(self.root):
+            return path.relative_to(self.root).as_posix()
+        # Shipped with the package rather than the site (e.g. static/search.js)
+        return "package:" + path.relative_to(PACKAGE_DIR).as_posix()
+
+    def unit_inputs(self) -> Dict[str, List[Path]]:
+        """Maps each build unit to the input files it depends on."""
+        data_inputs = sorted(self.data_dir.glob("*.toml")) + [self.config_file]
+
+        pages_dir = self.templates_dir / "pages"
+        # layouts/, components/ ... anything a page may extend or include
+        shared_templates = [
+            p
+            for p in _files_under(self.templates_dir)
+            if p.relative_to(self.templates_dir).parts[0] != "pages"
+        ]
+        page_inputs = data_inputs + shared_templates + _files_under(self.content_dir)
+
+        # The search loader is copied into docs/apis/search/
+        units: Dict[str, List[Path]] = {API_UNIT: data_inputs + [LOADER_SOURCE]}
+        for template_path in sorted(pages_dir.glob("*.md.j2")):
+            units[f"markdown:{template_path.name}"] = page_inputs + [template_path]
+        for template_path in sorted(pages_dir.glob("*.html.j2")):
+            if template_path.name == SKILL_TEMPLATE:
+                continue
+            units[f"html:{template_path.name}"] = page_inputs + [template_path]
+        units[SKILLS_UNIT] = page_inputs + [pages_dir / SKILL_TEMPLATE]
+        return units
+
+    def plan(self, manifest: BuildManifest, force: bool = False) -> BuildPlan:
+        hashes: Dict[Path, str] = {}
+        inputs: Dict[str, Dict[str, str]] = {}
+        for unit, paths in self.unit_inputs().items():
+            unit_hashes = {VERSION_INPUT: __version__}
+            for path in paths:
+                if path not in hashes:
+                    hashes[path] = hash_file(path)
+                unit_hashes[self._rel(path)] = hashes[path]
+            inputs[unit] = unit_hashes
+
+        plan = BuildPlan(inputs=inputs)
+        plan.removed = set(manifest.units) - set(inputs)
+
+        for unit, unit_hashes in inputs.items():
+            previous = manifest.units.get(unit)
+            if force or previous is None or previous.get("inputs") != unit_hashes:
+                plan.dirty.add(unit)
+                continue
+            if any(not (self.root / out).exists() for out in previous["outputs"]):
+                plan.dirty.add(unit)
+        return plan
+
+
+class IncrementalBuild:
+    """
+    Runs the build, rendering only the units the planner marks as dirty,
+    and records the resulting dependency graph in .cache/build_manifest.json.
+    """
+
+    def __init__(
+        self,
+        root_dir: str = ".",
+        force: bool = False,
+        jobs: int = 1,
+        context: Optional[BuildContext] = None,
+    ):
+        self.root = Path(root_dir)
+        self.force = force
+        self.jobs = jobs
+        # An already loaded context (e.g. kept warm by `gimc watch`)
+        self.context = context
+        self.manifest = BuildManifest(self.root / ".cache" / "build_manifest.json")
+        self.planner = IncrementalPlanner(self.root)
+        self.writer = OutputWriter()
+
+    @property
+    def stats(self) -> WriteStats:
+        """Written / unchanged / deleted file counts for this build."""
+        return self.writer.stats
+
+    def run(self) -> Set[str]:
+        """Builds the dirty units. Returns the set of unit keys that were rebuilt."""
+        self.manifest.load()
+        with stage("plan"):
+            plan = self.planner.plan(self.manifest, force=self.force)
+
+        if plan.up_to_date:
+            logger.info("Build is up to date; nothing to render.")
+            # Stray files in the output dirs still go, so the tree stays in sync
+            with stage("remove_orphans"):
+                site = SiteBuilder(context=self._context(), jobs=self.jobs)
+                site.remove_orphans(self._produced())
+            logger.info(f"Outputs: {self.stats}")
+            return set()
+
+        logger.info(f"Rebuilding {len(plan.dirty)} of {len(plan.inputs)} build units.")
+
+        for unit in plan.removed:
+            self._delete_outputs(self.manifest.units.pop(unit).get("outputs", []))
+
+        context = self._context()
+
+        if API_UNIT in plan.dirty:
+            api_builder = SiteBuilderAPI(context=context, jobs=self.jobs)
+            start = len(api_builder.written_files)
+            with stage("build_static_api"):
+                api_builder.build_static_api()
+            self._record(API_UNIT, plan, api_builder.written_files[start:])
+
+        page_units = plan.dirty - {API_UNIT}
+        if page_units:
+            self._build_pages(context, plan, page_units)
+
+        produced = self._produced()
+        site = SiteBuilder(context=context, jobs=self.jobs)
+        with stage("remove_orphans"):
+            site.remove_orphans(produced)
+        with stage("precompress"):
+            site.precompress(produced)
+
+        with stage("save manifest"):
+            self.manifest.save()
+        logger.info(f"Outputs: {self.stats}")
+        return plan.dirty
+
+    def _context(self) -> BuildContext:
+        """One config load and Jinja environment shared by every stage."""
+        if self.context is None:
+            self.context = BuildContext(root_dir=str(self.root), writer=self.writer)
+        self.context.writer = self.writer
+        return self.context
+
+    def _produced(self) -> List[Path]:
+        """Every output in the manifest; anything else in the output dirs is an orphan."""
+        return [
+            self.root / rel
+            for record in self.manifest.units.values()
+            for rel in record.get("outputs", [])
+        ]
+
+    def _build_pages(
+        self, context: BuildContext, plan: BuildPlan, page_units: Set[str]
+    ) -> None:
+        """Renders each page stage once for all of its dirty templates."""
+        templates: Dict[str, Set[str]] = {"markdown": set(), "html": set()}
+        for unit in page_units:
+            kind, _, template_name = unit.partition(":")
+            if kind in templates:
+                templates[kind].add(template_name)
+
+        builder = SiteBuilder(context=context, jobs=self.jobs)
+        try:
+            with stage("_map_relationships"):
+                builder._map_relationships()
+            if templates["markdown"]:
+                with stage("build_markdown_pages"):
+                    builder.build_markdown_pages(only=templates["markdown"])
+            if templates["html"]:
+                with stage("build_html_pages"):
+                    builder.build_html_pages(only=templates["html"])
+            if SKILLS_UNIT in page_units:
+                with stage("build_skill_pages"):
+                    builder.build_skill_pages()
+        finally:
+            builder.close()
+
+        for unit in page_units:
+            kind, _, template_name = unit.partition(":")
+            if unit == SKILLS_UNIT:
+                template_name = SKILL_TEMPLATE
+            outputs = builder.written_by_template.get(f"pages/{template_name}", [])
+            self._record(unit, plan, outputs)
+
+    def _record(self, unit: str, plan: BuildPlan, written: List[Path]) -> None:
+        outputs = sorted({p.relative_to(self.root).as_posix() for p in written})
+
+        # Anything this unit produced last time but not now is stale
+        previous = self.manifest.units.get(unit, {}).get("outputs", [])
+        self._delete_outputs(sorted(set(previous) - set(outputs)))
+
+        self.manifest.units[unit] = {"inputs": plan.inputs[unit], "outputs": outputs}
+
+    def _delete_outputs(self, outputs: List[str]) -> None:
+        for rel in outputs:
+            if self.writer.delete(self.root / rel):
+                logger.info(f"Removed stale output {rel}")
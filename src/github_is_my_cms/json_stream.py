@@ -0,0 +1,69 @@
+# src/github_is_my_cms/json_stream.py
+"""
+Chunked JSON encoding for large API documents.
+
+A payload is ordinary JSON data in which any list may be replaced by a
+JsonArray wrapping an iterable (typically a generator). iter_json() encodes
+the structure around it with orjson and the array one item at a time,
+yielding byte chunks of about CHUNK_SIZE, so writing an index of tens of
+thousands of refs never holds the whole list or the whole document in
+memory. The output is byte-identical to orjson.dumps() on the materialized
+payload.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import orjson
+
+CHUNK_SIZE = 64 * 1024
+
+Default = Optional[Callable[[Any], Any]]
+
+
+class JsonArray:
+    """A JSON array whose items are encoded lazily, in iteration order."""
+
+    def __init__(self, items: Iterable[Any]):
+        self.items = items
+
+
+def iter_json(
+    payload: Any, default: Default = None, chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Encodes `payload` as compact JSON, yielding chunks of ~chunk_size bytes."""
+    buffer = bytearray()
+    for piece in _encode(payload, default):
+        buffer += piece
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _encode(value: Any, default: Default) -> Iterator[bytes]:
+    if isinstance(value, JsonArray):
+        yield b"["
+        for i, item in enumerate(value.items):
+            if i:
+                yield b","
+            yield from _encode(item, default)
+        yield b"]"
+    elif isinstance(value, dict) and _is_streamed(value):
+        yield b"{"
+        for i, (key, item) in enumerate(value.items()):
+            yield (b"," if i else b"") + orjson.dumps(key) + b":"
+            yield from _encode(item, default)
+        yield b"}"
+    else:
+        yield orjson.dumps(value, default=default)
+
+
+def _is_streamed(value: dict) -> bool:
+    """Whether a JsonArray sits anywhere in this dict (plain dicts encode in one go)."""
+    return any(
+        isinstance(item, JsonArray) or (isinstance(item, dict) and _is_streamed(item))
+        for item in value.values()
+    )
@@ -0,0 +1,248 @@
+# src/github_is_my_cms/link_checker.py
+"""
+Concurrent link validation for `gimc lint`.
+
+Every URL in the data (profiles, resume and talk entries, projects and
+their package links, package docs, work experience links, resumes and the
+job hunting resume) is checked over one pooled httpx.AsyncClient: HEAD first,
+falling back to GET for servers that reject or mishandle HEAD. A global
+limit bounds the number of requests in flight and a per-host limit keeps
+any one server (usually github.com) from being hammered.
+
+Results are kept in .cache/link_cache.sqlite3 with a TTL, so repeated lint
+runs only go to the network for new or expired URLs. Broken links expire
+sooner than working ones, so a fix shows up on the next run. A host that is
+still rate limiting (429) after the retries says nothing about the link: the
+result is reported as inconclusive, not broken, and is not cached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import httpx
+
+from .cache import CacheBackend, SQLiteCache
+from .models import CMSConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 7 * 24 * 60 * 60  # working links: a week
+FAILURE_TTL = 60 * 60  # broken links: an hour
+
+CACHE_FILENAME = "link_cache.sqlite3"
+
+
+@dataclass
+class LinkResult:
+    url: str
+    ok: bool
+    status: Optional[int] = None
+    error: Optional[str] = None
+    # Served from the cache, not checked on this run
+    cached: bool = False
+    # Rate limited to the end: neither working nor broken
+    inconclusive: bool = False
+
+    def describe(self) -> str:
+        return f"HTTP {self.status}" if self.status is not None else str(self.error)
+
+
+@dataclass
+class LinkReport:
+    results: Dict[str, LinkResult] = field(default_factory=dict)
+    # url -> where it appears, e.g. "project alpha (repository_url)"
+    sources: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def broken(self) -> List[LinkResult]:
+        return [r for r in self.results.values() if not r.ok and not r.inconclusive]
+
+    @property
+    def inconclusive(self) -> List[LinkResult]:
+        return [r for r in self.results.values() if r.inconclusive]
+
+    def __str__(self) -> str:
+        cached = sum(1 for r in self.results.values() if r.cached)
+        return (
+            f"{len(self.results)} links, {len(self.broken)} broken, "
+            f"{len(self.inconclusive)} inconclusive, "
+            f"{len(self.results) - cached} checked, {cached} cached"
+        )
+
+
+def collect_links(config: CMSConfig) -> Dict[str, List[str]]:
+    """Every URL in the data, mapped to the places it appears (in data order)."""
+    links: Dict[str, List[str]] = defaultdict(list)
+
+    def add(url: Any, source: str) -> None:
+        if url:
+            links[str(url)].append(source)
+
+    identity = config.identity
+    for profile in identity.profiles:
+        add(profile.url, f"profile {profile.service} (url)")
+        for same_as in profile.same_as:
+            add(same_as, f"profile {profile.service} (same_as)")
+    for resume_entry in identity.resumes:
+        add(resume_entry.url, f"identity resume {resume_entry.label} (url)")
+    for talk in identity.talks:
+        add(talk.url, f"talk {talk.title} (url)")
+    add(config.modes.job_hunting.resume_url, "modes.job_hunting (resume_url)")
+    for project in config.projects:
+        add(project.url, f"project {project.slug} (url)")
+        add(project.repository_url, f"project {project.slug} (repository_url)")
+        for package_link in project.cms.package_links if project.cms else []:
+            add(package_link, f"project {project.slug} (package_links)")
+    for package in config.pypi_packages:
+        add(package.docs_url, f"package {package.package_name} (docs_url)")
+    for entry in config.work_experience:
+        for link in entry.links:
+            add(link.url, f"experience {entry.id} ({link.label})")
+    for resume in config.resumes:
+        add(resume.url, f"resume {resume.id} (url)")
+    return dict(links)
+
+
+class LinkChecker:
+    """
+    Checks URLs concurrently with per-host limits, HEAD-then-GET and retries
+    with exponential backoff, consulting and filling an optional cache.
+    """
+
+    USER_AGENT = "github-is-my-cms/0.1.0 (link check)"
+    # Statuses worth retrying; anything else is final
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    # Final statuses that say nothing about the link itself
+    INCONCLUSIVE_STATUSES = {429}
+
+    def __init__(
+        self,
+        cache: Optional[CacheBackend] = None,
+        concurrency: int = 32,
+        per_host: int = 4,
+        timeout: float = 10.0,
+        retries: int = 1,
+        backoff: float = 0.5,
+        ttl: float = DEFAULT_TTL,
+        failure_ttl: float = FAILURE_TTL,
+    ):
+        self.cache = cache
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.ttl = ttl
+        self.failure_ttl = min(failure_ttl, ttl)
+
+    @classmethod
+    def for_root(cls, root_dir: Path, **kwargs: Any) -> "LinkChecker":
+        """A checker caching its results under <root>/.cache/."""
+        cache = SQLiteCache(root_dir / ".cache" / CACHE_FILENAME)
+        return cls(cache=cache, **kwargs)
+
+    def check(
+        self, urls: Iterable[str], refresh: bool = False
+    ) -> Dict[str, LinkResult]:
+        """
+        url -> result, in the order given (duplicates checked once).
+        With refresh, cached results are ignored and every URL is checked.
+        """
+        urls = list(dict.fromkeys(urls))
+        results: Dict[str, LinkResult] = {}
+        pending: List[str] = []
+        for url in urls:
+            cached = None if refresh else self._cached(url)
+            if cached is None:
+                pending.append(url)
+            else:
+                results[url] = cached
+
+        if pending:
+            logger.info(
+                f"Checking {len(pending)} links ({len(results)} cached results)..."
+            )
+            for result in asyncio.run(self._check_all(pending)):
+                results[result.url] = result
+                if self.cache is not None and not result.inconclusive:
+                    self.cache.set(
+                        result.url,
+                        asdict(result),
+                        ttl=self.ttl if result.ok else self.failure_ttl,
+                    )
+        return {url: results[url] for url in urls}
+
+    def _cached(self, url: str) -> Optional[LinkResult]:
+        if self.cache is None:
+            return None
+        value = self.cache.get(url)
+        if value is None:
+            return None
+        return LinkResult(**{**value, "cached": True})
+
+    async def _check_all(self, urls: List[str]) -> List[LinkResult]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        hosts: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_host)
+        )
+        limits = httpx.Limits(
+            max_connections=self.concurrency,
+            max_keepalive_connections=self.concurrency,
+        )
+
+        async with httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=limits,
+            follow_redirects=True,
+            headers={"User-Agent": self.USER_AGENT},
+        ) as client:
+
+            async def check_one(url: str) -> LinkResult:
+                try:
+                    host = httpx.URL(url).host
+                except httpx.InvalidURL as e:
+                    return LinkResult(url, ok=False, error=f"invalid URL ({e})")
+                if not host:
+                    return LinkResult(url, ok=False, error="invalid URL (no host)")
+                # Host slot first, so a busy host does not hold global slots
+                async with hosts[host], semaphore:
+                    return await self._check_url(client, url)
+
+            return await asyncio.gather(*(check_one(url) for url in urls))
+
+    async def _check_url(self, client: httpx.AsyncClient, url: str) -> LinkResult:
+        for attempt in range(self.retries + 1):
+            last_attempt = attempt == self.retries
+            try:
+                status = await self._status(client, url)
+            except httpx.HTTPError as e:
+                if last_attempt:
+                    return LinkResult(url, ok=False, error=str(e) or type(e).__name__)
+            else:
+                if status not in self.RETRY_STATUSES or last_attempt:
+                    return LinkResult(
+                        url,
+                        ok=status < 400,
+                        status=status,
+                        inconclusive=status in self.INCONCLUSIVE_STATUSES,
+                    )
+            await asyncio.sleep(self.backoff * (2**attempt))
+        return LinkResult(url, ok=False, error="no attempts")
+
+    async def _status(self, client: httpx.AsyncClient, url: str) -> int:
+        """Final status after redirects: HEAD, then GET if HEAD did not succeed."""
+        try:
+            response = await client.head(url)
+            if response.status_code < 400:
+                return response.status_code
+        except httpx.HTTPError as e:
+            logger.debug(f"HEAD {url} failed ({e}); retrying with GET")
+        # Headers are enough; the body is never read
+        async with client.stream("GET", url) as response:
+            return response.status_code
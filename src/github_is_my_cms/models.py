@@ -309,6 +309,17 @@ class ModeConfig(BaseModel):
     self_promotion: SelfPromotionSettings = Field(default_factory=SelfPromotionSettings)
 
 
+class BuildSettings(BaseModel):
+    """
+    Output options from the [build] table of readme_cms.toml.
+    """
+
+    # Hashed, precompressed per-collection and all-in-one JSON under apis/
+    api_bundles: bool = False
+    # .gz/.br siblings of every text file under docs/ (see precompress.py)
+    precompress: bool = False
+
+
 class LanguageConfig(BaseModel):
     default: str = "en"
     supported: List[str] = ["en"]
@@ -329,6 +340,7 @@ class CMSConfig(BaseModel):
     projects: List[Project] = Field(default_factory=list)
     pypi_packages: List[PyPIPackage] = Field(default_factory=list)
     theme: Optional[str] = "default"
+    build: BuildSettings = Field(default_factory=BuildSettings)
 
     work_experience: List[WorkExperienceEntry] = Field(default_factory=list)
     resumes: List[ResumeArtifact] = Field(default_factory=list)
@@ -0,0 +1,95 @@
+# src/github_is_my_cms/output_writer.py
+"""
+Write layer for generated artifacts.
+A file is only rewritten when its bytes change, so unchanged outputs keep
+their mtimes and do not show up in git diffs or Pages uploads.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from .atomic_write import atomic_write_bytes, atomic_write_chunks
+from .profiling import add_bytes_written
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteStats:
+    written: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.written} written, {self.unchanged} unchanged, "
+            f"{self.deleted} deleted"
+        )
+
+
+class OutputWriter:
+    """
+    Compares new content against the existing file (size first, then bytes)
+    and writes only on change. Safe to share between writer threads.
+    """
+
+    def __init__(self) -> None:
+        self.stats = WriteStats()
+        self._lock = threading.Lock()
+
+    def write_bytes(self, path: Path, data: bytes) -> bool:
+        """Writes `data` to `path` unless it already holds it. True if written."""
+        if self._is_unchanged(path, data):
+            with self._lock:
+                self.stats.unchanged += 1
+            return False
+
+        # No fsync: outputs are regenerable, and thousands of syncs add up
+        atomic_write_bytes(path, data, fsync=False)
+        add_bytes_written(len(data))
+        with self._lock:
+            self.stats.written += 1
+        return True
+
+    def write_chunks(self, path: Path, chunks: Iterable[bytes]) -> bool:
+        """
+        Streams `chunks` to `path`, comparing against the existing file on the
+        way, so neither side is ever held in memory whole. True if written.
+        """
+        size = atomic_write_chunks(path, chunks, fsync=False, skip_unchanged=True)
+        if size < 0:
+            with self._lock:
+                self.stats.unchanged += 1
+            return False
+
+        add_bytes_written(size)
+        with self._lock:
+            self.stats.written += 1
+        return True
+
+    def write_text(self, path: Path, content: str) -> bool:
+        return self.write_bytes(path, content.encode("utf-8"))
+
+    def delete(self, path: Path) -> bool:
+        """Removes an output that is no longer produced. True if it existed."""
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        with self._lock:
+            self.stats.deleted += 1
+        return True
+
+    @staticmethod
+    def _is_unchanged(path: Path, data: bytes) -> bool:
+        try:
+            if path.stat().st_size != len(data):
+                return False
+            return path.read_bytes() == data
+        except FileNotFoundError:
+            return False
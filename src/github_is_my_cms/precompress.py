@@ -0,0 +1,213 @@
+# src/github_is_my_cms/precompress.py
+"""
+Post-build precompression of docs/ (`[build] precompress = true`).
+
+Every text output (HTML, Markdown, JSON, swagger assets ...) gets .gz and
+.br siblings, so nginx (gzip_static/brotli_static), a CDN or
+scripts/open_site.py can serve precompressed bytes instead of compressing
+per request. docs/precompressed.json lists each source with its
+hash and the variants that exist; it doubles as the change record, so only
+files whose content changed since the last run are compressed again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import orjson
+
+from .compression import ENCODINGS, SUFFIXES, compressed_variants
+from .output_writer import OutputWriter
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "precompressed.json"
+MANIFEST_VERSION = 2
+
+COMPRESSIBLE_SUFFIXES = {
+    ".html",
+    ".md",
+    ".json",
+    ".js",
+    ".css",
+    ".svg",
+    ".xml",
+    ".txt",
+    ".yaml",
+    ".map",
+}
+
+# Below this, headers and request overhead dominate; not worth a variant
+MIN_SIZE = 512
+
+
+@dataclass
+class PrecompressStats:
+    compressed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.compressed} compressed, {self.unchanged} unchanged, "
+            f"{self.removed} removed"
+        )
+
+
+def variant_path(path: Path, encoding: str) -> Path:
+    suffix = next(s for s, e in ENCODINGS.items() if e == encoding)
+    return path.with_name(path.name + suffix)
+
+
+class Precompressor:
+    """Keeps the compressed siblings of everything under docs/ in step with it."""
+
+    def __init__(
+        self,
+        docs_dir: Path,
+        writer: Optional[OutputWriter] = None,
+        jobs: int = 1,
+        produced: Iterable[Path] = (),
+    ):
+        """
+        Args:
+            docs_dir: The output directory to precompress.
+            writer: Shared build writer (skips unchanged variants, keeps stats).
+            jobs: Compression threads.
+            produced: The build's own outputs. Variants among them (e.g. the
+                API bundles') belong to their stage and are left alone.
+        """
+        self.docs_dir = docs_dir.absolute()
+        self.writer = writer if writer is not None else OutputWriter()
+        self.jobs = jobs
+        self.produced = {p.absolute() for p in produced}
+        self.manifest_file = self.docs_dir / MANIFEST_NAME
+        self.stats = PrecompressStats()
+
+    def _read_manifest(self) -> Dict[str, Any]:
+        try:
+            return orjson.loads(self.manifest_file.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return {}
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        manifest = self._read_manifest()
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest.get("files", {})
+
+    def sources(self) -> List[Path]:
+        """Files under docs/ that get precompressed variants."""
+        return sorted(
+            path
+            for path in self.docs_dir.rglob("*")
+            if path.suffix in COMPRESSIBLE_SUFFIXES
+            and path != self.manifest_file
+            and not self._has_own_variants(path)
+            and path.is_file()
+        )
+
+    def _has_own_variants(self, path: Path) -> bool:
+        return all(path.with_name(path.name + s) in self.produced for s in SUFFIXES)
+
+    def run(self) -> PrecompressStats:
+        previous = self._load_manifest()
+        files: Dict[str, Dict[str, Any]] = {}
+        pending: List[Path] = []
+
+        for path in self.sources():
+            rel = path.relative_to(self.docs_dir).as_posix()
+            entry = self._current_entry(path, previous.get(rel))
+            if entry is None:
+                pending.append(path)
+            else:
+                files[rel] = entry
+                self.stats.unchanged += 1
+
+        if pending:
+            logger.info(f"-> Precompressing {len(pending)} files...")
+            if self.jobs > 1 and len(pending) > 1:
+                # zlib and brotli release the GIL while compressing
+                with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                    entries = list(pool.map(self._compress, pending))
+            else:
+                entries = [self._compress(path) for path in pending]
+            for path, entry in zip(pending, entries):
+                rel = path.relative_to(self.docs_dir).as_posix()
+                files[rel] = entry
+                # A variant that no longer pays off must not be served stale
+                dropped = previous.get(rel, {}).get("variants", {}).keys()
+                self._remove_variants(path, dropped - entry["variants"].keys())
+            self.stats.compressed += len(pending)
+
+        # Sources deleted since the last run leave their variants behind
+        for rel in previous.keys() - files.keys():
+            self._remove_variants(self.docs_dir / rel, previous[rel]["variants"])
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "encodings": {encoding: suffix for suffix, encoding in ENCODINGS.items()},
+            "files": dict(sorted(files.items())),
+        }
+        self.writer.write_bytes(
+            self.manifest_file, orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+        )
+        logger.info(f"Precompression: {self.stats}")
+        return self.stats
+
+    def _current_entry(
+        self, path: Path, entry: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """The manifest entry if `path` and its variants are unchanged, else None."""
+        if entry is None:
+            return None
+        if not all(variant_path(path, e).exists() for e in entry["variants"]):
+            return None
+        stat = path.stat()
+        if stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]:
+            return entry
+        # Touched but maybe not changed (e.g. checked out again)
+        if _sha256(path.read_bytes()) != entry["sha256"]:
+            return None
+        return {**entry, "mtime_ns": stat.st_mtime_ns}
+
+    def _compress(self, path: Path) -> Dict[str, Any]:
+        data = path.read_bytes()
+        variants: Dict[str, int] = {}
+        if len(data) >= MIN_SIZE:
+            for suffix, compressed in compressed_variants(data).items():
+                # Incompressible (already small or dense): serve the original
+                if len(compressed) >= len(data):
+                    continue
+                self.writer.write_bytes(path.with_name(path.name + suffix), compressed)
+                variants[ENCODINGS[suffix]] = len(compressed)
+        stat = path.stat()
+        return {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": _sha256(data),
+            "variants": variants,
+        }
+
+    def clear(self) -> PrecompressStats:
+        """Removes every variant and the manifest (precompression turned off)."""
+        for rel, entry in self._read_manifest().get("files", {}).items():
+            self._remove_variants(self.docs_dir / rel, entry["variants"])
+        if self.writer.delete(self.manifest_file):
+            logger.info(f"Precompression off: {self.stats.removed} variants removed")
+        return self.stats
+
+    def _remove_variants(self, path: Path, encodings: Iterable[str]) -> None:
+        for encoding in encodings:
+            variant = variant_path(path, encoding)
+            if variant not in self.produced and self.writer.delete(variant):
+                self.stats.removed += 1
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
@@ -0,0 +1,202 @@
+# src/github_is_my_cms/profiling.py
+"""
+Opt-in build profiling (`gimc build --profile`).
+
+Code marks work with `with stage("name"):`. While no profiler is active this
+is a no-op. An active Profiler records every span (wall time, thread, bytes
+written and, with trace_memory, peak traced memory), prints a summary sorted
+by total time and can export a Chrome trace-event JSON file
+(chrome://tracing, Perfetto). Memory tracing uses tracemalloc, which slows
+allocation-heavy stages down several times, so it is off by default.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+_active: Optional["Profiler"] = None
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    start_ns: int
+    end_ns: int
+    thread_id: int
+    bytes_written: int = 0
+    peak_memory: int = 0
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+
+@dataclass
+class StageSummary:
+    name: str
+    category: str
+    calls: int = 0
+    total_ns: int = 0
+    bytes_written: int = 0
+    peak_memory: int = 0
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_ns / 1e6
+
+
+@dataclass
+class _OpenSpan:
+    span: Span
+    bytes_written: int = 0
+
+
+class Profiler:
+    """Collects spans for one build."""
+
+    def __init__(self, trace_memory: bool = False):
+        self.spans: List[Span] = []
+        self.trace_memory = trace_memory
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __enter__(self) -> "Profiler":
+        global _active
+        if self.trace_memory:
+            tracemalloc.start()
+        _active = self
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        global _active
+        _active = None
+        if self.trace_memory:
+            tracemalloc.stop()
+
+    def _stack(self) -> List[_OpenSpan]:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextlib.contextmanager
+    def stage(self, name: str, category: str = "stage") -> Iterator[None]:
+        stack = self._stack()
+        if self.trace_memory and not stack:
+            tracemalloc.reset_peak()
+        open_span = _OpenSpan(
+            Span(
+                name=name,
+                category=category,
+                start_ns=time.perf_counter_ns(),
+                end_ns=0,
+                thread_id=threading.get_ident(),
+            )
+        )
+        stack.append(open_span)
+        try:
+            yield
+        finally:
+            stack.pop()
+            span = open_span.span
+            span.end_ns = time.perf_counter_ns()
+            span.bytes_written = open_span.bytes_written
+            if self.trace_memory:
+                span.peak_memory = tracemalloc.get_traced_memory()[1]
+            if stack:
+                stack[-1].bytes_written += open_span.bytes_written
+            with self._lock:
+                self.spans.append(span)
+
+    def add_bytes(self, count: int) -> None:
+        stack = self._stack()
+        if stack:
+            stack[-1].bytes_written += count
+        else:
+            # Written from a worker thread: attribute it to an unscoped span
+            now = time.perf_counter_ns()
+            span = Span("write", "io", now, now, threading.get_ident(), count)
+            with self._lock:
+                self.spans.append(span)
+
+    def summary(self) -> List[StageSummary]:
+        """Spans aggregated by name, slowest total first."""
+        stages: Dict[str, StageSummary] = {}
+        for span in self.spans:
+            stage = stages.setdefault(span.name, StageSummary(span.name, span.category))
+            stage.calls += 1
+            stage.total_ns += span.duration_ns
+            stage.bytes_written += span.bytes_written
+            stage.peak_memory = max(stage.peak_memory, span.peak_memory)
+        return sorted(stages.values(), key=lambda s: s.total_ns, reverse=True)
+
+    def format_summary(self, limit: int = 40) -> str:
+        rows = [
+            f"{'stage':<48} {'calls':>6} {'total ms':>10} {'mean ms':>9} "
+            f"{'written':>10} {'peak MiB':>9}"
+        ]
+        for stage in self.summary()[:limit]:
+            peak = f"{stage.peak_memory / 2**20:.1f}" if self.trace_memory else "-"
+            rows.append(
+                f"{stage.name[:48]:<48} {stage.calls:>6} {stage.total_ms:>10.1f} "
+                f"{stage.total_ms / stage.calls:>9.2f} "
+                f"{_format_bytes(stage.bytes_written):>10} "
+                f"{peak:>9}"
+            )
+        return "\n".join(rows)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """The spans as Chrome trace-event "complete" (ph=X) events."""
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start_ns - self._origin_ns) / 1000,
+                "dur": span.duration_ns / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {
+                    "bytes_written": span.bytes_written,
+                    "peak_memory": span.peak_memory,
+                },
+            }
+            for span in sorted(self.spans, key=lambda s: s.start_ns)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+
+
+def _format_bytes(count: int) -> str:
+    if not count:
+        return "-"
+    if count < 1024:
+        return f"{count} B"
+    if count < 2**20:
+        return f"{count / 1024:.1f} KiB"
+    return f"{count / 2**20:.1f} MiB"
+
+
+def stage(name: str, category: str = "stage") -> contextlib.AbstractContextManager:
+    """Times a block under the active profiler; a no-op when not profiling."""
+    if _active is None:
+        return contextlib.nullcontext()
+    return _active.stage(name, category)
+
+
+def add_bytes_written(count: int) -> None:
+    if _active is not None:
+        _active.add_bytes(count)
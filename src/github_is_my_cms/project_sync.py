@@ -0,0 +1,140 @@
+# src/github_is_my_cms/project_sync.py
+"""
+Merge engine for syncing projects.toml with GitHub.
+
+Repositories are merged in a single pass over the (possibly streamed) list,
+missing ones are marked gone once at the end, and the outcome is reported as
+a diff so the caller writes projects.toml at most once.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Set
+
+logger = logging.getLogger(__name__)
+
+# Fields owned by GitHub; everything else in an entry (name, group, cms ...)
+# is curated by hand and never touched by a sync.
+SYNCED_FIELDS = (
+    "description",
+    "repository_url",
+    "url",
+    "tags",
+    "status",
+    "primary_language",
+)
+
+
+@dataclass
+class SyncReport:
+    """What a sync changed, by project slug."""
+
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    gone: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.gone)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "added": self.added,
+            "updated": self.updated,
+            "gone": self.gone,
+            "unchanged": self.unchanged,
+        }
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.added)} added, {len(self.updated)} updated, "
+            f"{len(self.gone)} gone, {self.unchanged} unchanged"
+        )
+
+
+def repo_fields(repo: Dict[str, Any]) -> Dict[str, Any]:
+    """The synced fields of a `gh repo list --json` style record."""
+    # Format is usually {"primaryLanguage": {"name": "Python"}} or null
+    language = repo.get("primaryLanguage") or {}
+    return {
+        "description": repo.get("description") or "",
+        "repository_url": repo.get("url"),
+        "homepage": repo.get("homepageUrl"),
+        "tags": [t["name"] for t in (repo.get("repositoryTopics") or [])],
+        "status": "archived" if repo.get("isArchived", False) else "active",
+        "primary_language": language.get("name", "N/A"),
+    }
+
+
+class ProjectMerger:
+    """
+    Merges GitHub repositories into the existing project entries.
+    Preserves 'cms' directives and unknown non-GitHub projects.
+    """
+
+    def __init__(self, existing: Iterable[Dict[str, Any]], mark_gone: bool = True):
+        # We assume slug == repo name for GitHub projects
+        self.project_map: Dict[str, Dict[str, Any]] = {p["slug"]: p for p in existing}
+        # A partial ("since") sync cannot tell a missing repo from an unchanged one
+        self.mark_gone = mark_gone
+        self.seen: Set[str] = set()
+        self.report = SyncReport()
+
+    @property
+    def projects(self) -> List[Dict[str, Any]]:
+        return sorted(self.project_map.values(), key=lambda x: x["slug"])
+
+    def merge(self, repos: Iterable[Dict[str, Any]]) -> SyncReport:
+        for repo in repos:
+            self._merge_repo(repo)
+        if self.mark_gone:
+            self._mark_gone()
+        return self.report
+
+    def _merge_repo(self, repo: Dict[str, Any]) -> None:
+        slug = repo["name"]
+        self.seen.add(slug)
+        fields = repo_fields(repo)
+        homepage = fields.pop("homepage")
+
+        entry = self.project_map.get(slug)
+        if entry is None:
+            self.project_map[slug] = {
+                "slug": slug,
+                "name": slug,  # Default name to slug
+                "description": fields["description"],
+                "url": homepage if homepage else fields["repository_url"],
+                "repository_url": fields["repository_url"],
+                "tags": fields["tags"],
+                "status": fields["status"],
+                "primary_language": fields["primary_language"],
+                # Initialize empty CMS directive container for future use
+                "cms": {"suppress": False, "package_links": []},
+            }
+            self.report.added.append(slug)
+            return
+
+        before = {key: entry.get(key) for key in SYNCED_FIELDS}
+        entry.update(fields)
+        # If homepage is set on GH, use it as 'url' (project link),
+        # otherwise fallback to repo url or keep existing.
+        if homepage:
+            entry["url"] = homepage
+        elif "url" not in entry:
+            entry["url"] = fields["repository_url"]
+
+        if before != {key: entry.get(key) for key in SYNCED_FIELDS}:
+            self.report.updated.append(slug)
+        else:
+            self.report.unchanged += 1
+
+    def _mark_gone(self) -> None:
+        for slug, entry in self.project_map.items():
+            if slug in self.seen or entry.get("status") == "gone":
+                continue
+            if "github.com" in str(entry.get("repository_url", "")):
+                entry["status"] = "gone"
+                self.report.gone.append(slug)
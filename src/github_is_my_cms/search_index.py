@@ -0,0 +1,190 @@
+# src/github_is_my_cms/search_index.py
+"""
+Prebuilt inverted index for client-side search (docs/apis/search/).
+
+Projects, PyPI packages, skills and work experience become small display
+records, sharded by id into docs/<n>.json. Their names, descriptions, tags,
+languages, skills and technologies are tokenized into weighted postings,
+sharded by the first two characters of each term into terms/<xx>.json.
+static/search.js fetches index.json once, then only the term shards a
+query's tokens start with and the doc shards of the top hits, so a query
+costs a couple of small requests and no full dataset download.
+
+The tokenizer must stay in step with the one in search.js.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .models import CMSConfig
+from .skill_index import SkillIndex
+
+SEARCH_VERSION = 1
+
+# Display records per docs/<n>.json shard
+DOC_SHARD_SIZE = 256
+
+# Leading term characters that pick a terms/<xx>.json shard
+TERM_SHARD_PREFIX = 2
+
+# Score contributed by a term, by the field it appears in
+WEIGHTS = {"title": 8, "keyword": 4, "text": 1}
+
+SUMMARY_LENGTH = 140
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or that the this to with".split()
+)
+
+LOADER_SOURCE = Path(__file__).parent / "static" / "search.js"
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercased ASCII word tokens, accents folded, stopwords and numbers dropped."""
+    if not text:
+        return []
+    folded = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return [
+        t
+        for t in _TOKEN.findall(folded.lower())
+        if t not in STOPWORDS and not t.isdigit()
+    ]
+
+
+def term_shard(term: str) -> str:
+    return term[:TERM_SHARD_PREFIX]
+
+
+@dataclass
+class SearchDocument:
+    type: str
+    title: str
+    url: str
+    summary: str = ""
+    # field name (a WEIGHTS key) -> texts to tokenize
+    fields: Dict[str, List[str]] = field(default_factory=dict)
+
+    def record(self) -> List[str]:
+        return [self.type, self.title, self.url, self.summary]
+
+
+def _summary(text: Optional[str]) -> str:
+    text = " ".join((text or "").split())
+    if len(text) <= SUMMARY_LENGTH:
+        return text
+    return text[: SUMMARY_LENGTH - 1].rstrip() + "…"
+
+
+def _skills_for(terms: Iterable[str], skill_index: SkillIndex) -> List[str]:
+    """Canonical skill slugs for tags and aliases, so "py" also finds "python"."""
+    return [
+        skill_index.skill_lookup_map[t.lower()]
+        for t in terms
+        if t.lower() in skill_index.skill_lookup_map
+    ]
+
+
+def collect_documents(
+    config: CMSConfig, skill_index: SkillIndex
+) -> List[SearchDocument]:
+    docs: List[SearchDocument] = []
+
+    for project in sorted(config.projects, key=lambda p: p.slug.lower()):
+        if project.cms and project.cms.suppress:
+            continue
+        keywords = list(project.tags) + [
+            project.primary_language or "",
+            project.group or "",
+        ]
+        docs.append(
+            SearchDocument(
+                type="project",
+                title=project.name,
+                url=str(project.url or project.repository_url or ""),
+                summary=_summary(project.description),
+                fields={
+                    "title": [project.name, project.slug],
+                    "keyword": keywords + _skills_for(keywords, skill_index),
+                    "text": [project.description or ""],
+                },
+            )
+        )
+
+    for package in sorted(config.pypi_packages, key=lambda p: p.package_name.lower()):
+        keywords = list(package.tags) + ["python"]
+        docs.append(
+            SearchDocument(
+                type="package",
+                title=package.package_name,
+                url=f"https://pypi.org/project/{package.package_name}/",
+                summary=_summary(package.summary),
+                fields={
+                    "title": [package.package_name],
+                    "keyword": keywords + _skills_for(keywords, skill_index),
+                    "text": [package.summary or ""],
+                },
+            )
+        )
+
+    for group in config.identity.skills:
+        for skill in group.skills:
+            slug = skill_index.skill_slugs[skill.name]
+            has_page = slug in skill_index.projects_by_skill_slug
+            docs.append(
+                SearchDocument(
+                    type="skill",
+                    title=skill.name,
+                    url=f"skills/{slug}.html" if has_page else "",
+                    summary=group.category,
+                    fields={
+                        "title": [skill.name],
+                        "keyword": list(skill.aliases) + [group.category],
+                    },
+                )
+            )
+
+    for entry in config.work_experience:
+        docs.append(
+            SearchDocument(
+                type="experience",
+                title=f"{entry.title}, {entry.organization}",
+                url="experience.html",
+                summary=_summary(entry.summary),
+                fields={
+                    "title": [entry.title, entry.organization],
+                    "keyword": list(entry.technologies),
+                    "text": [entry.summary or "", *entry.responsibilities],
+                },
+            )
+        )
+    return docs
+
+
+def build_postings(docs: List[SearchDocument]) -> Dict[str, Dict[str, List[int]]]:
+    """
+    shard -> term -> flat [doc id, score, doc id, score, ...], best first.
+    A term's score in a doc is its weighted count over the doc's fields.
+    """
+    scores: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+    for doc_id, doc in enumerate(docs):
+        for field_name, texts in doc.fields.items():
+            weight = WEIGHTS[field_name]
+            for text in texts:
+                for term in tokenize(text):
+                    scores[term][doc_id] += weight
+
+    shards: Dict[str, Dict[str, List[int]]] = defaultdict(dict)
+    for term in sorted(scores):
+        ranked: List[Tuple[int, int]] = sorted(
+            scores[term].items(), key=lambda hit: (-hit[1], hit[0])
+        )
+        shards[term_shard(term)][term] = [n for hit in ranked for n in hit]
+    return shards
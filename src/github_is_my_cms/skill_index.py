@@ -0,0 +1,132 @@
+# src/github_is_my_cms/skill_index.py
+"""
+Inverted index from normalized tags/languages/aliases to content items.
+Replaces the skills x items scan in SiteBuilder._map_relationships with
+dictionary lookups. Built once per config (see BuildContext.skill_index).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import defaultdict
+from typing import Any, Dict, List, Set, Union
+
+from .models import CMSConfig, Project, PyPIPackage
+
+logger = logging.getLogger(__name__)
+
+ContentItem = Union[Project, PyPIPackage]
+
+
+def slugify(text: str) -> str:
+    """
+    File name for a skill page or facet value. Case and punctuation variants
+    share a slug; "+" and "#" are spelled out so C, C++ and C# stay apart.
+    """
+    text = text.lower().replace("+", "plus").replace("#", "sharp")
+    return re.sub(r"[^a-z0-9]+", "-", text).strip("-")
+
+
+def item_terms(item: Any) -> Set[str]:
+    """
+    All normalized "tags" an item can be matched on.
+    Explicit tags, the primary language (GitHub) and an implicit "python" for PyPI.
+    """
+    terms = set()
+    if getattr(item, "tags", None):
+        terms.update(t.lower() for t in item.tags)
+    if getattr(item, "primary_language", None):
+        terms.add(item.primary_language.lower())
+    if hasattr(item, "package_name"):  # It's a PyPI package
+        terms.add("python")
+    return terms
+
+
+class SkillIndex:
+    """
+    Precomputed relationships between skills and projects/packages.
+
+    - items_by_term: normalized tag/language -> item positions
+    - items_by_related_skill: skill name (manual `related_skills`) -> item positions
+    - skill_slugs: skill name -> page slug, unique across skills
+    - skill_lookup_map: normalized skill name or alias -> canonical skill slug
+    - projects_by_skill: skill name -> matching items, in content order
+    - projects_by_skill_slug: the same, keyed by skill slug
+    """
+
+    def __init__(self, config: CMSConfig):
+        # Combine all searchable items; positions keep output order stable
+        self.items: List[ContentItem] = config.projects + config.pypi_packages
+
+        self.items_by_term: Dict[str, List[int]] = defaultdict(list)
+        self.items_by_related_skill: Dict[str, List[int]] = defaultdict(list)
+        for position, item in enumerate(self.items):
+            for term in item_terms(item):
+                self.items_by_term[term].append(position)
+            for skill_name in getattr(item, "related_skills", None) or []:
+                self.items_by_related_skill[skill_name].append(position)
+
+        self.skill_slugs: Dict[str, str] = {}
+        # Every slug in skill_slugs, kept alongside so clash checks are O(1)
+        self._taken_slugs: Set[str] = set()
+        # Maps "alias" -> "canonical_skill_slug"
+        # e.g. {"psql": "postgres", "postgresql": "postgres"}
+        self.skill_lookup_map: Dict[str, str] = {}
+        self.projects_by_skill: Dict[str, List[ContentItem]] = {}
+        self.projects_by_skill_slug: Dict[str, List[ContentItem]] = {}
+
+        for group in config.identity.skills:
+            for skill in group.skills:
+                skill_slug = self._page_slug(skill.name)
+                skill.page_slug = skill_slug
+
+                search_terms = {skill.name.lower()}
+                if skill.aliases:
+                    search_terms.update(t.lower() for t in skill.aliases)
+                for term in search_terms:
+                    self.skill_lookup_map[term] = skill_slug
+
+                positions: Set[int] = set()
+                for term in search_terms:
+                    positions.update(self.items_by_term.get(term, ()))
+                positions.update(self.items_by_related_skill.get(skill.name, ()))
+
+                if positions:
+                    matching_items = [self.items[i] for i in sorted(positions)]
+                    self.projects_by_skill[skill.name] = matching_items
+                    self.projects_by_skill_slug[skill_slug] = matching_items
+
+        logger.debug(
+            f"Skill index: {len(self.items_by_term)} terms, "
+            f"{len(self.projects_by_skill)} skills with items."
+        )
+
+    def _page_slug(self, skill_name: str) -> str:
+        """
+        The skill's slug, numbered if another skill already has it, so two
+        skills never render to the same docs/skills/<slug>.html.
+        """
+        if skill_name in self.skill_slugs:
+            return self.skill_slugs[skill_name]
+        base = slugify(skill_name) or "skill"
+        slug, n = base, 1
+        while slug in self._taken_slugs:
+            n += 1
+            slug = f"{base}-{n}"
+        self.skill_slugs[skill_name] = slug
+        self._taken_slugs.add(slug)
+        return slug
+
+    def items_for_term(self, term: str) -> List[ContentItem]:
+        """Items tagged with a tag, language, skill name or alias."""
+        slug = self.skill_lookup_map.get(term.lower())
+        if slug is not None:
+            return self.items_for_skill_slug(slug)
+        return [self.items[i] for i in self.items_by_term.get(term.lower(), ())]
+
+    def items_for_skill(self, skill_name: str) -> List[ContentItem]:
+        return self.projects_by_skill.get(skill_name, [])
+
+    def items_for_skill_slug(self, slug: str) -> List[ContentItem]:
+        return self.projects_by_skill_slug.get(slug, [])
@@ -0,0 +1,158 @@
+/*
+ * Client for the prebuilt search index in apis/search/ (see search_index.py).
+ *
+ * Drop-in:
+ *   <input type="search" data-gimc-search="#search-results">
+ *   <ol id="search-results"></ol>
+ *   <script src="apis/search/search.js" defer></script>
+ *
+ * Or from code: GimcSearch.search("python cli").then(function (hits) { ... });
+ *
+ * index.json is fetched once; a query then loads only the term shards its
+ * tokens start with and the doc shards of the hits it returns. Every token
+ * must match (as a whole term or a term prefix, at half weight).
+ */
+(function () {
+  "use strict";
+
+  var script = document.currentScript;
+  var base = new URL(".", script ? script.src : location.href);
+  var siteRoot = new URL("../../", base);
+  var cache = new Map();
+
+  function fetchJson(path) {
+    if (!cache.has(path)) {
+      cache.set(
+        path,
+        fetch(new URL(path, base)).then(function (response) {
+          if (!response.ok) throw new Error(path + ": HTTP " + response.status);
+          return response.json();
+        })
+      );
+    }
+    return cache.get(path);
+  }
+
+  // Must match search_index.tokenize
+  function tokenize(text, stopwords) {
+    var folded = String(text || "")
+      .normalize("NFKD")
+      .replace(/[^\x00-\x7f]/g, "")
+      .toLowerCase();
+    return (folded.match(/[a-z0-9]+/g) || []).filter(function (t) {
+      return !stopwords.has(t) && !/^[0-9]+$/.test(t);
+    });
+  }
+
+  function scoreToken(token, shard) {
+    var scores = new Map();
+    if (!shard) return scores;
+    Object.keys(shard).forEach(function (term) {
+      if (term.lastIndexOf(token, 0) !== 0) return;
+      var factor = term === token ? 1 : 0.5;
+      var postings = shard[term];
+      for (var i = 0; i < postings.length; i += 2) {
+        var doc = postings[i];
+        scores.set(doc, (scores.get(doc) || 0) + postings[i + 1] * factor);
+      }
+    });
+    return scores;
+  }
+
+  function search(query, limit) {
+    limit = limit || 20;
+    return fetchJson("index.json").then(function (index) {
+      var tokens = Array.from(new Set(tokenize(query, new Set(index.stopwords))));
+      if (!tokens.length) return [];
+
+      var available = new Set(index.term_shards);
+      var keys = Array.from(
+        new Set(tokens.map(function (t) { return t.slice(0, index.term_shard_prefix); }))
+      );
+      return Promise.all(
+        keys.map(function (key) {
+          return available.has(key) ? fetchJson("terms/" + key + ".json") : null;
+        })
+      ).then(function (shards) {
+        var byKey = new Map(keys.map(function (key, i) { return [key, shards[i]]; }));
+        var totals = null;
+        tokens.forEach(function (token) {
+          var scores = scoreToken(token, byKey.get(token.slice(0, index.term_shard_prefix)));
+          if (totals === null) {
+            totals = scores;
+            return;
+          }
+          var both = new Map();
+          totals.forEach(function (score, doc) {
+            if (scores.has(doc)) both.set(doc, score + scores.get(doc));
+          });
+          totals = both;
+        });
+
+        var hits = Array.from(totals.entries())
+          .sort(function (a, b) { return b[1] - a[1] || a[0] - b[0]; })
+          .slice(0, limit);
+        return resolve(index, hits);
+      });
+    });
+  }
+
+  function resolve(index, hits) {
+    var shardIds = Array.from(
+      new Set(hits.map(function (hit) { return Math.floor(hit[0] / index.doc_shard_size); }))
+    );
+    return Promise.all(
+      shardIds.map(function (n) { return fetchJson("docs/" + n + ".json"); })
+    ).then(function (shards) {
+      var docShards = new Map(shardIds.map(function (n, i) { return [n, shards[i]]; }));
+      return hits.map(function (hit) {
+        var record = docShards.get(Math.floor(hit[0] / index.doc_shard_size))[
+          hit[0] % index.doc_shard_size
+        ];
+        return {
+          type: record[0],
+          title: record[1],
+          url: record[2] ? new URL(record[2], siteRoot).href : "",
+          summary: record[3],
+          score: hit[1],
+        };
+      });
+    });
+  }
+
+  function wire(input) {
+    var target = document.querySelector(input.getAttribute("data-gimc-search"));
+    if (!target) return;
+    var latest = 0;
+    var timer = null;
+
+    function render(hits) {
+      target.textContent = "";
+      hits.forEach(function (hit) {
+        var item = document.createElement("li");
+        var title = document.createElement(hit.url ? "a" : "strong");
+        if (hit.url) title.href = hit.url;
+        title.textContent = hit.title;
+        var meta = document.createElement("small");
+        meta.textContent = " " + hit.type + (hit.summary ? " — " + hit.summary : "");
+        item.appendChild(title);
+        item.appendChild(meta);
+        target.appendChild(item);
+      });
+    }
+
+    input.addEventListener("input", function () {
+      clearTimeout(timer);
+      timer = setTimeout(function () {
+        var ticket = ++latest;
+        search(input.value).then(function (hits) {
+          // A slower, older query must not overwrite a newer one
+          if (ticket === latest) render(hits);
+        });
+      }, 80);
+    });
+  }
+
+  window.GimcSearch = { search: search, tokenize: tokenize };
+  document.querySelectorAll("input[data-gimc-search]").forEach(wire);
+})();
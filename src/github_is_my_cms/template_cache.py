@@ -0,0 +1,101 @@
+# src/github_is_my_cms/template_cache.py
+"""
+Compiled-template caching for the Jinja environment.
+
+- Every build keeps Jinja bytecode under .cache/jinja/. Jinja keys each
+  entry by template name and checks it against the source checksum, so an
+  edited template is simply recompiled.
+- `gimc compile-theme` precompiles a whole theme into Python modules under
+  .cache/compiled/<theme>/. Builds load these through a ModuleLoader for as
+  long as the recorded theme hash matches the templates on disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Optional
+
+from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    ModuleLoader,
+)
+
+from .atomic_write import atomic_write_text
+
+logger = logging.getLogger(__name__)
+
+HASH_FILE = "theme.sha256"
+
+
+def bytecode_cache(root: Path) -> FileSystemBytecodeCache:
+    directory = root / ".cache" / "jinja"
+    directory.mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(str(directory))
+
+
+def compiled_theme_dir(root: Path, theme: str) -> Path:
+    return root / ".cache" / "compiled" / theme
+
+
+def theme_hash(templates_dir: Path) -> str:
+    """Digest of every file (path and content) in a theme directory."""
+    digest = hashlib.sha256()
+    for path in sorted(p for p in templates_dir.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(templates_dir).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def theme_loader(root: Path, theme: str, templates_dir: Path) -> BaseLoader:
+    """
+    The precompiled theme if it is current, otherwise the template sources.
+    """
+    compiled = _current_compiled_theme(root, theme, templates_dir)
+    if compiled is not None:
+        logger.debug(f"Using precompiled theme from {compiled}")
+        return ModuleLoader(str(compiled))
+    return FileSystemLoader(templates_dir)
+
+
+def _current_compiled_theme(
+    root: Path, theme: str, templates_dir: Path
+) -> Optional[Path]:
+    compiled = compiled_theme_dir(root, theme)
+    hash_file = compiled / HASH_FILE
+    if not hash_file.exists():
+        return None
+    if hash_file.read_text(encoding="utf-8").strip() != theme_hash(templates_dir):
+        logger.info(f"Precompiled theme '{theme}' is out of date; using sources.")
+        return None
+    return compiled
+
+
+def compile_theme(
+    env: Environment, root: Path, theme: str, templates_dir: Path
+) -> Path:
+    """
+    Compiles every template of a theme into a directory of Python modules and
+    records the theme hash they were built from.
+    """
+    target = compiled_theme_dir(root, theme)
+    target.mkdir(parents=True, exist_ok=True)
+    for stale in target.glob("*.py"):
+        stale.unlink()
+
+    # Compile from sources, whatever loader the environment currently uses
+    source_env = env.overlay(loader=FileSystemLoader(templates_dir))
+    source_env.compile_templates(
+        str(target),
+        zip=None,
+        ignore_errors=False,
+        log_function=logger.debug,
+    )
+    atomic_write_text(target / HASH_FILE, theme_hash(templates_dir))
+    logger.info(f"Compiled theme '{theme}' into {target}")
+    return target
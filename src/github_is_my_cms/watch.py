@@ -0,0 +1,241 @@
+# src/github_is_my_cms/watch.py
+"""
+`gimc watch`: a development server with live incremental rebuilds.
+
+Polls the build inputs (data/*.toml, readme_cms.toml, src/content and the
+theme directory), keeps the loaded CMSConfig and Jinja environment warm
+between rebuilds, re-renders only the affected build units and tells open
+browser tabs to reload over Server-Sent Events.
+"""
+
+from __future__ import annotations
+
+import http.server
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+from jinja2 import FileSystemLoader
+
+from .build_context import BuildContext
+from .incremental import IncrementalBuild, IncrementalPlanner
+
+logger = logging.getLogger(__name__)
+
+RELOAD_PATH = "/__livereload"
+
+RELOAD_SCRIPT = f"""<script>
+new EventSource("{RELOAD_PATH}").onmessage = function () {{ location.reload(); }};
+</script>
+"""
+
+# path -> (mtime_ns, size)
+Snapshot = Dict[Path, Tuple[int, int]]
+
+
+class InputWatcher:
+    """Detects changed build inputs by polling file stats."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.snapshot: Snapshot = self.scan()
+
+    def watched_files(self) -> Set[Path]:
+        planner = IncrementalPlanner(self.root)
+        files = {planner.config_file, *planner.data_dir.glob("*.toml")}
+        for directory in (planner.content_dir, planner.templates_dir):
+            if directory.exists():
+                files.update(p for p in directory.rglob("*") if p.is_file())
+        return files
+
+    def scan(self) -> Snapshot:
+        snapshot: Snapshot = {}
+        for path in self.watched_files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def changes(self) -> Set[Path]:
+        """Files added, removed or modified since the previous call."""
+        current = self.scan()
+        changed = {
+            path
+            for path in current.keys() | self.snapshot.keys()
+            if current.get(path) != self.snapshot.get(path)
+        }
+        self.snapshot = current
+        return changed
+
+
+class ReloadBroadcaster:
+    """Wakes every connected live-reload stream when a rebuild finishes."""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._condition = threading.Condition()
+
+    def notify(self) -> None:
+        with self._condition:
+            self.version += 1
+            self._condition.notify_all()
+
+    def wait(self, seen: int, timeout: float) -> int:
+        with self._condition:
+            self._condition.wait_for(lambda: self.version != seen, timeout=timeout)
+            return self.version
+
+
+class LiveRebuilder:
+    """
+    Rebuilds changed outputs while keeping the BuildContext between runs.
+    The config is only reloaded when data or readme_cms.toml changes.
+    """
+
+    def __init__(self, root: Path, jobs: int = 1):
+        self.root = root
+        self.jobs = jobs
+        self.watcher = InputWatcher(root)
+        self.context: Optional[BuildContext] = None
+
+    def build(self, changed: Set[Path] = frozenset()) -> Set[str]:
+        if self.context is None or self._invalidates_context(changed):
+            self.context = BuildContext(root_dir=str(self.root))
+        else:
+            # A kept context would otherwise stamp every page with its load time
+            self.context.refresh_generation()
+        return IncrementalBuild(
+            root_dir=str(self.root), jobs=self.jobs, context=self.context
+        ).run()
+
+    def poll(self) -> Set[str]:
+        """Rebuilds if any input changed. Returns the rebuilt units."""
+        changed = self.watcher.changes()
+        if not changed:
+            return set()
+        for path in sorted(changed):
+            logger.info(f"Changed: {path.relative_to(self.root).as_posix()}")
+        return self.build(changed)
+
+    def _invalidates_context(self, changed: Set[Path]) -> bool:
+        assert self.context is not None
+        planner = IncrementalPlanner(self.root)
+        if any(p == planner.config_file or p.parent == planner.data_dir for p in changed):
+            return True
+        # A precompiled theme would keep serving the old templates
+        return not isinstance(self.context.env.loader, FileSystemLoader)
+
+
+class LiveReloadHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that injects the reload script into HTML pages."""
+
+    broadcaster: ReloadBroadcaster
+
+    def do_GET(self) -> None:
+        if self.path == RELOAD_PATH:
+            self._stream_reloads()
+            return
+
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            path = path / "index.html"
+        if path.suffix == ".html" and path.is_file():
+            self._send_html(path)
+            return
+        super().do_GET()
+
+    def _send_html(self, path: Path) -> None:
+        html = path.read_text(encoding="utf-8")
+        if "</body>" in html:
+            html = html.replace("</body>", RELOAD_SCRIPT + "</body>", 1)
+        else:
+            html += RELOAD_SCRIPT
+        body = html.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _stream_reloads(self) -> None:
+        # Taken before the headers go out, so no reload after connecting is missed
+        seen = self.broadcaster.version
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        try:
+            while True:
+                version = self.broadcaster.wait(seen, timeout=15.0)
+                if version == seen:
+                    self.wfile.write(b": keep-alive\n\n")
+                else:
+                    seen = version
+                    self.wfile.write(b"data: reload\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format % args)
+
+
+def serve(
+    directory: Path, broadcaster: ReloadBroadcaster, host: str, port: int
+) -> http.server.ThreadingHTTPServer:
+    """Starts the live-reload file server on a background thread."""
+    handler = type(
+        "BoundLiveReloadHandler",
+        (LiveReloadHandler,),
+        {"broadcaster": broadcaster},
+    )
+    httpd = http.server.ThreadingHTTPServer(
+        (host, port),
+        lambda *a, **kw: handler(*a, directory=str(directory), **kw),
+    )
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def watch(
+    root: Path,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    interval: float = 0.25,
+    jobs: int = 1,
+) -> None:
+    """Builds once, serves docs/ and rebuilds on every input change until Ctrl+C."""
+    rebuilder = LiveRebuilder(root, jobs=jobs)
+    rebuilder.build()
+
+    broadcaster = ReloadBroadcaster()
+    httpd = serve(root / "docs", broadcaster, host, port)
+    bound_host, bound_port = httpd.server_address[:2]
+    logger.info(f"Serving {root / 'docs'} at http://{bound_host}:{bound_port}/")
+    logger.info("Watching for changes (Ctrl+C to stop)...")
+
+    try:
+        while True:
+            time.sleep(interval)
+            try:
+                started = time.perf_counter()
+                rebuilt = rebuilder.poll()
+            except Exception as e:
+                # Keep serving the last good build; the next edit retries
+                logger.error(f"Rebuild failed: {e}", exc_info=True)
+                continue
+            if rebuilt:
+                elapsed = (time.perf_counter() - started) * 1000
+                logger.info(f"Rebuilt {sorted(rebuilt)} in {elapsed:.0f} ms")
+                broadcaster.notify()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
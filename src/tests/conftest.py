@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pytest
+
+
+@dataclass
+class StubRequest:
+    method: str
+    path: str
+    headers: Dict[str, str]
+    body: bytes = b""
+
+
+@dataclass
+class StubResponse:
+    status: int = 200
+    body: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def json(cls, payload: Any, status: int = 200) -> "StubResponse":
+        return cls(
+            status=status,
+            body=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+
+
+Responder = Callable[[StubRequest], StubResponse]
+
+
+class StubServer:
+    """A local, keep-alive capable HTTP server whose responses come from a callable."""
+
+    def __init__(self, respond: Responder):
+        self.respond = respond
+        self.requests: List[StubRequest] = []
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                request = StubRequest(
+                    method=self.command,
+                    path=self.path,
+                    headers={k.lower(): v for k, v in self.headers.items()},
+                    body=self.rfile.read(length) if length else b"",
+                )
+                with server._lock:
+                    server.requests.append(request)
+                response = server.respond(request)
+                self.send_response(response.status)
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                body = b"" if self.command == "HEAD" else response.body
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_HEAD = do_POST = _handle
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return None
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def stub_server() -> Iterator[Callable[[Responder], StubServer]]:
+    """Factory fixture: stub_server(respond) -> running StubServer, stopped at teardown."""
+    servers: List[StubServer] = []
+
+    def start(respond: Responder) -> StubServer:
+        server = StubServer(respond).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+class StubPyPI:
+    """
+    Serves /pypi/<name>/json for a dict of packages, with ETags and 304s,
+    optionally failing first.
+    """
+
+    def __init__(self) -> None:
+        self.packages: Dict[str, Dict[str, Any]] = {}
+        # package name -> number of 503 responses to send before succeeding
+        self.failures: Dict[str, int] = {}
+        self.server: Optional[StubServer] = None
+
+    def add(self, name: str, **info: Any) -> None:
+        self.packages[name] = {"info": {"version": "1.0.0", **info}}
+
+    def respond(self, request: StubRequest) -> StubResponse:
+        parts = [p for p in request.path.split("/") if p]
+        if len(parts) != 3 or parts[0] != "pypi" or parts[2] != "json":
+            return StubResponse(status=404)
+        name = parts[1]
+        if self.failures.get(name):
+            self.failures[name] -= 1
+            return StubResponse(status=503)
+        if name not in self.packages:
+            return StubResponse(status=404)
+        response = StubResponse.json(self.packages[name])
+        etag = '"' + hashlib.sha256(response.body).hexdigest()[:16] + '"'
+        if request.headers.get("if-none-match") == etag:
+            return StubResponse(status=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return response
+
+    @property
+    def url_template(self) -> str:
+        assert self.server is not None
+        return self.server.base_url + "/pypi/{package}/json"
+
+    @property
+    def request_paths(self) -> List[str]:
+        assert self.server is not None
+        return [r.path for r in self.server.requests]
+
+    @property
+    def not_modified_count(self) -> int:
+        assert self.server is not None
+        return sum(1 for r in self.server.requests if "if-none-match" in r.headers)
+
+
+@pytest.fixture
+def stub_pypi(stub_server: Callable[[Responder], StubServer]) -> StubPyPI:
+    """A local stand-in for the PyPI JSON API, for offline tests and benchmarks."""
+    pypi = StubPyPI()
+    pypi.server = stub_server(pypi.respond)
+    return pypi
+
+
+class StubGitHub:
+    """
+    Serves POST /graphql for repositoryOwner.repositories: cursor pagination
+    over `repos`, newest updatedAt first, like the real API.
+    """
+
+    def __init__(self, owner: str) -> None:
+        self.owner = owner
+        self.repos: List[Dict[str, Any]] = []
+        self.server: Optional[StubServer] = None
+
+    def add(self, name: str, updated_at: str, **fields: Any) -> None:
+        self.repos = [r for r in self.repos if r["name"] != name]
+        self.repos.append(
+            {
+                "name": name,
+                "description": fields.get("description", ""),
+                "url": f"https://github.com/{self.owner}/{name}",
+                "homepageUrl": fields.get("homepage"),
+                "isArchived": fields.get("archived", False),
+                "updatedAt": updated_at,
+                "primaryLanguage": {"name": fields.get("language", "Python")},
+                "repositoryTopics": {
+                    "nodes": [{"topic": {"name": t}} for t in fields.get("topics", [])]
+                },
+            }
+        )
+
+    def respond(self, request: StubRequest) -> StubResponse:
+        if request.method != "POST" or request.path != "/graphql":
+            return StubResponse(status=404)
+        if not request.headers.get("authorization", "").startswith("bearer "):
+            return StubResponse(status=401)
+        variables = json.loads(request.body)["variables"]
+        if variables["owner"] != self.owner:
+            return StubResponse.json({"data": {"repositoryOwner": None}})
+
+        ordered = sorted(self.repos, key=lambda r: r["updatedAt"], reverse=True)
+        start = int(variables["after"] or 0)
+        end = start + variables["first"]
+        page = {
+            "pageInfo": {"hasNextPage": end < len(ordered), "endCursor": str(end)},
+            "nodes": ordered[start:end],
+        }
+        return StubResponse.json({"data": {"repositoryOwner": {"repositories": page}}})
+
+    @property
+    def api_url(self) -> str:
+        assert self.server is not None
+        return self.server.base_url + "/graphql"
+
+    @property
+    def page_requests(self) -> int:
+        assert self.server is not None
+        return len(self.server.requests)
+
+
+@pytest.fixture
+def stub_github(stub_server: Callable[[Responder], StubServer]) -> StubGitHub:
+    """A local stand-in for the GitHub GraphQL API."""
+    github = StubGitHub(owner="octo")
+    github.server = stub_server(github.respond)
+    return github
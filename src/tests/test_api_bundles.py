@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from textwrap import dedent
+
+from github_is_my_cms.builder_api import SiteBuilderAPI
+
+
+def _write_text(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(dedent(content), encoding="utf-8")
+
+
+def _write_site(root: Path, description: str) -> None:
+    _write_text(
+        root / "readme_cms.toml",
+        """
+        [build]
+        api_bundles = true
+        """,
+    )
+    _write_text(
+        root / "data" / "identity.toml",
+        """
+        name = "Example Person"
+        tagline = "Example Tagline"
+        """,
+    )
+    _write_text(
+        root / "data" / "projects.toml",
+        f"""
+        [[projects]]
+        slug = "project-one"
+        name = "Project One"
+        description = "{description}"
+        repository_url = "https://github.com/example/project-one"
+
+        [[projects]]
+        slug = "project-two"
+        name = "Project Two"
+        description = "Second"
+        """,
+    )
+    _write_text(
+        root / "data" / "pypi_projects.toml",
+        """
+        [[packages]]
+        package_name = "project-one"
+        version = "1.0.0"
+        github_repo = "example/project-one"
+        """,
+    )
+
+
+def _build(root: Path) -> dict:
+    SiteBuilderAPI(str(root)).build_static_api()
+    return json.loads((root / "docs" / "apis" / "bundles" / "index.json").read_text())
+
+
+def test_bundles_match_per_entity_files_and_are_precompressed(tmp_path: Path) -> None:
+    _write_site(tmp_path, "First")
+    index = _build(tmp_path)["bundles"]
+    docs = tmp_path / "docs"
+
+    projects = docs / index["projects"]["href"].lstrip("/")
+    data = projects.read_bytes()
+    assert index["projects"]["count"] == 2
+    assert index["projects"]["sha256"] == hashlib.sha256(data).hexdigest()
+    assert index["projects"]["sha256"][:12] in projects.name
+    assert gzip.decompress(projects.with_name(projects.name + ".gz").read_bytes()) == data
+
+    per_entity = json.loads(
+        (docs / "apis" / "projects" / "by-slug" / "project-one.json").read_text()
+    )
+    assert json.loads(data)["items"][0] == per_entity
+
+    everything = json.loads((docs / index["all"]["href"].lstrip("/")).read_bytes())
+    assert everything["identity"]["name"] == "Example Person"
+    assert [p["package_name"] for p in everything["pypi"]] == ["project-one"]
+
+
+def test_changed_content_gets_a_new_bundle_name(tmp_path: Path) -> None:
+    _write_site(tmp_path, "First")
+    before = _build(tmp_path)["bundles"]
+    again = _build(tmp_path)["bundles"]
+    _write_site(tmp_path, "Changed")
+    after = _build(tmp_path)["bundles"]
+
+    assert again == before
+    assert after["projects"]["href"] != before["projects"]["href"]
+    assert after["pypi"]["href"] == before["pypi"]["href"]
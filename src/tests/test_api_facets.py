@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from textwrap import dedent
+
+from github_is_my_cms.builder_api import SiteBuilderAPI
+
+
+def _write_text(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(dedent(content), encoding="utf-8")
+
+
+def _write_site(root: Path) -> None:
+    _write_text(root / "readme_cms.toml", "")
+    _write_text(
+        root / "data" / "identity.toml",
+        """
+        name = "Example Person"
+        tagline = "Example Tagline"
+        """,
+    )
+    _write_text(
+        root / "data" / "skills.toml",
+        """
+        [[skills]]
+        category = "Backend"
+
+        [[skills.skills]]
+        name = "Python for Serverless"
+        aliases = ["py"]
+        """,
+    )
+    _write_text(
+        root / "data" / "projects.toml",
+        """
+        [[projects]]
+        slug = "alpha"
+        name = "Alpha"
+        description = "Alpha project"
+        tags = ["py", "CLI"]
+        primary_language = "C#"
+
+        [[projects]]
+        slug = "beta"
+        name = "Beta"
+        description = "Beta project"
+        tags = ["cli"]
+        primary_language = "C++"
+        status = "archived"
+
+        [[projects]]
+        slug = "gamma"
+        name = "Gamma"
+        description = "Gamma project"
+        tags = ["py"]
+        primary_language = "C#"
+        """,
+    )
+
+
+def _read(root: Path, rel: str) -> dict:
+    return json.loads((root / "docs" / "apis" / rel).read_text(encoding="utf-8"))
+
+
+def _slugs(document: dict) -> list:
+    return [Path(ref["ref"]).stem for ref in document["refs"]]
+
+
+def test_facet_documents_list_matching_projects(tmp_path: Path) -> None:
+    _write_site(tmp_path)
+    SiteBuilderAPI(str(tmp_path)).build_static_api()
+
+    cli = _read(tmp_path, "projects/by-tag/cli.json")
+    assert _slugs(cli) == ["alpha", "beta"]
+    assert cli["meta"] == {
+        "type": "projects",
+        "facet": "by-tag",
+        "value": "CLI",
+        "count": 2,
+    }
+    assert cli["refs"][1]["status"] == "archived"
+
+    # C# and C++ must not share a file
+    assert _slugs(_read(tmp_path, "projects/by-language/csharp.json")) == [
+        "alpha",
+        "gamma",
+    ]
+    assert _slugs(_read(tmp_path, "projects/by-language/cplusplus.json")) == ["beta"]
+    assert _slugs(_read(tmp_path, "projects/by-status/archived.json")) == ["beta"]
+
+    # Tagged with an alias, found under the skill
+    skill = _read(tmp_path, "projects/by-skill/python-for-serverless.json")
+    assert _slugs(skill) == ["alpha", "gamma"]
+
+
+def test_facets_index_counts_values(tmp_path: Path) -> None:
+    _write_site(tmp_path)
+    SiteBuilderAPI(str(tmp_path)).build_static_api()
+
+    facets = _read(tmp_path, "projects/facets.json")
+    assert facets["meta"] == {"type": "projects", "count": 3}
+    assert facets["facets"]["by-language"] == [
+        {"value": "C#", "count": 2, "href": "/apis/projects/by-language/csharp.json"},
+        {
+            "value": "C++",
+            "count": 1,
+            "href": "/apis/projects/by-language/cplusplus.json",
+        },
+    ]
+    assert [(f["value"], f["count"]) for f in facets["facets"]["by-status"]] == [
+        ("active", 2),
+        ("archived", 1),
+    ]
+    for entries in facets["facets"].values():
+        for entry in entries:
+            assert (tmp_path / "docs" / entry["href"].lstrip("/")).exists()
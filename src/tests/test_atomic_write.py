@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+
+from github_is_my_cms.atomic_write import (
+    NEW_FILE_MODE,
+    atomic_write_text,
+    backup_path,
+)
+
+
+def test_atomic_write_rotates_backup_and_leaves_no_temp_files(tmp_path: Path) -> None:
+    target = tmp_path / "data" / "projects.toml"
+
+    atomic_write_text(target, "version = 1\n", backup=True)
+    os.chmod(target, 0o640)
+    atomic_write_text(target, "version = 2\n", backup=True)
+
+    assert target.read_text(encoding="utf-8") == "version = 2\n"
+    assert backup_path(target).read_text(encoding="utf-8") == "version = 1\n"
+    # the replaced file keeps its permissions
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+    assert sorted(p.name for p in target.parent.iterdir()) == [
+        "projects.toml",
+        "projects.toml.bak",
+    ]
+
+
+def test_atomic_write_gives_new_files_a_normal_mode(tmp_path: Path) -> None:
+    target = tmp_path / "index.html"
+
+    atomic_write_text(target, "<h1>hi</h1>", fsync=False)
+
+    # not the 0600 of the underlying temp file
+    assert stat.S_IMODE(target.stat().st_mode) == NEW_FILE_MODE == 0o644
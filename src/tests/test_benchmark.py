@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCHMARK_SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "benchmark.py"
+
+
+def test_benchmark_runs_with_no_arguments(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spec = importlib.util.spec_from_file_location("benchmark", BENCHMARK_SCRIPT)
+    benchmark = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, "benchmark", benchmark)
+    spec.loader.exec_module(benchmark)
+    results = tmp_path / "results.jsonl"
+    monkeypatch.setattr(benchmark, "DEFAULT_RESULTS", results)
+    # As launched from a shell: `python -m scripts.benchmark`
+    monkeypatch.setattr(sys, "argv", [str(BENCHMARK_SCRIPT)])
+
+    assert benchmark.main() == 0
+
+    record = json.loads(results.read_text(encoding="utf-8"))
+    assert record["scale"] == "small"
+    assert set(record["timings"]) >= {"cmd_build", "cmd_build_incremental_noop"}
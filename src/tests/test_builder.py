@@ -98,3 +98,71 @@ def test_builder_maps_skill_relationships(tmp_path: Path) -> None:
         "PyPIPackage",
     }
     assert builder.skill_lookup_map["py"] == "python"
+
+
+def test_skills_with_clashing_names_get_their_own_pages(tmp_path: Path) -> None:
+    _write_builder_fixture(tmp_path)
+    _write_text(
+        tmp_path / "data" / "skills.toml",
+        """
+        [[skills]]
+        category = "Languages"
+        [[skills.skills]]
+        name = "C#"
+        [[skills.skills]]
+        name = "C++"
+        [[skills.skills]]
+        name = "C--"
+        aliases = ["cminus"]
+        [[skills.skills]]
+        name = "C"
+        aliases = ["cminus"]
+        """,
+    )
+    _write_text(
+        tmp_path / "data" / "projects.toml",
+        """
+        [[projects]]
+        slug = "sharp"
+        name = "Sharp"
+        description = "Example project"
+        primary_language = "C#"
+
+        [[projects]]
+        slug = "plus"
+        name = "Plus"
+        description = "Example project"
+        primary_language = "C++"
+
+        [[projects]]
+        slug = "minus"
+        name = "Minus"
+        description = "Example project"
+        tags = ["cminus"]
+        """,
+    )
+    template = (
+        tmp_path / "src/github_is_my_cms/templates/default/pages/skill_detail.html.j2"
+    )
+    template.parent.mkdir(parents=True, exist_ok=True)
+    _write_text(
+        template,
+        "{{ skill_name }}:{% for p in skill_projects %} {{ p.slug }}{% endfor %}",
+    )
+    skills_dir = tmp_path / "docs" / "skills"
+
+    builder = SiteBuilder(str(tmp_path))
+    builder.build_skill_pages()
+
+    assert {p.name: p.read_text() for p in skills_dir.iterdir()} == {
+        "csharp.html": "C#: sharp",
+        "cplusplus.html": "C++: plus",
+        # "C--" and "C" both slug to "c"; the later skill is numbered
+        "c.html": "C--: minus",
+        "c-2.html": "C: minus",
+    }
+    assert builder.context.writer.stats.written == 4
+
+    again = SiteBuilder(str(tmp_path))
+    again.build_skill_pages()
+    assert again.context.writer.stats.written == 0
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+from collections import Counter
+from pathlib import Path
+from textwrap import dedent
+
+from github_is_my_cms.builder_api import SiteBuilderAPI
+
+
+def _write_text(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(dedent(content), encoding="utf-8")
+
+
+def _write_site(root: Path, packages: int) -> None:
+    _write_text(root / "readme_cms.toml", "")
+    _write_text(
+        root / "data" / "identity.toml",
+        """
+        name = "Example Person"
+        tagline = "Example Tagline"
+        """,
+    )
+    _write_text(
+        root / "data" / "projects.toml",
+        """
+        [[projects]]
+        slug = "tool"
+        name = "Tool"
+        description = "A tool"
+        repository_url = "https://github.com/example/tool"
+        """,
+    )
+    _write_text(
+        root / "data" / "pypi_projects.toml",
+        "".join(
+            f'[[packages]]\npackage_name = "pkg-{i:03}"\nversion = "1.0"\n'
+            f'github_repo = "{"example/tool" if i == 0 else "example/other"}"\n'
+            for i in range(packages)
+        ),
+    )
+    _write_text(
+        root / "data" / "work_experience.toml",
+        """
+        [[experience]]
+        id = "acme"
+        organization = "Acme"
+        title = "Engineer"
+        start_date = "2020"
+        end_date = "present"
+        """,
+    )
+
+
+def _read(root: Path, rel: str) -> dict:
+    return json.loads((root / "docs" / "apis" / rel).read_text(encoding="utf-8"))
+
+
+def test_every_endpoint_is_generated_once(tmp_path: Path) -> None:
+    # 120 packages span three PyPI pages
+    _write_site(tmp_path, packages=120)
+    builder = SiteBuilderAPI(str(tmp_path))
+    builder.build_static_api()
+
+    writes = Counter(p.relative_to(tmp_path).as_posix() for p in builder.written_files)
+    assert set(writes.values()) == {1}
+    assert "docs/apis/experience/by-id/acme.json" in writes
+    assert "docs/apis/pypi/pages/3.json" in writes
+
+    page = _read(tmp_path, "pypi/pages/3.json")
+    assert page["meta"] == {
+        "type": "pypi",
+        "page": 3,
+        "page_size": 50,
+        "pages": 3,
+        "total": 120,
+    }
+    assert [l["rel"] for l in page["_links"]] == [
+        "self",
+        "collection",
+        "first",
+        "last",
+        "prev",
+        "describedby",
+    ]
+
+
+def test_relationships_link_projects_and_packages(tmp_path: Path) -> None:
+    _write_site(tmp_path, packages=2)
+    SiteBuilderAPI(str(tmp_path)).build_static_api()
+
+    project = _read(tmp_path, "projects/by-slug/tool.json")
+    package = _read(tmp_path, "pypi/by-name/pkg-000.json")
+    other = _read(tmp_path, "pypi/by-name/pkg-001.json")
+
+    assert project["_rels"] == {
+        "pypi_packages": [{"ref": "/apis/pypi/by-name/pkg-000.json", "rel": "related"}]
+    }
+    assert package["_rels"]["github_project"][0]["ref"] == (
+        "/apis/projects/by-slug/tool.json"
+    )
+    assert other["_rels"] == {"github_project": []}
+    assert _read(tmp_path, "experience/index.json")["refs"] == [
+        {
+            "ref": "/apis/experience/by-id/acme.json",
+            "rel": "item",
+            "organization": "Acme",
+            "title": "Engineer",
+            "end_date": "present",
+        }
+    ]
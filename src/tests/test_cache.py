@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+
+import pytest
+
+from github_is_my_cms.cache import (
+    CacheBackend,
+    DirectoryCache,
+    MemoryCache,
+    create_backend,
+)
+from github_is_my_cms.data_sources import BaseFetcher
+
+
+@pytest.mark.parametrize("kind", ["directory", "sqlite", "memory"])
+def test_backends_expire_per_entry_and_evict_least_recently_used(
+    tmp_path: Path, kind: str
+) -> None:
+    cache = create_backend(kind, tmp_path, max_entries=2)
+
+    cache.set("short", {"v": 1}, ttl=0)
+    cache.set("long", [1, 2, 3], ttl=3600)
+
+    assert cache.get("short") is None
+    assert cache.get_entry("short") is not None  # expired, but still stored
+    assert cache.get("long") == [1, 2, 3]
+
+    # "short" is now the least recently used entry
+    time.sleep(0.01)
+    cache.set("third", "x")
+
+    assert cache.get_entry("short") is None
+    assert sorted(cache) == ["long", "third"]
+
+
+def test_directory_cache_reads_legacy_files_without_metadata(tmp_path: Path) -> None:
+    (tmp_path / "github_repos.json").write_text(
+        json.dumps([{"name": "repo"}]), encoding="utf-8"
+    )
+
+    cache = DirectoryCache(tmp_path)
+
+    assert cache.get("github_repos") == [{"name": "repo"}]
+
+    cache.set("github_repos", [])
+
+    assert (tmp_path / "github_repos.meta.json").exists()
+    # atomic writes leave no temp files behind
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "github_repos.json",
+        "github_repos.meta.json",
+    ]
+
+
+class CountingFetcher(BaseFetcher):
+    def __init__(self, cache: CacheBackend, stale_while_revalidate: float) -> None:
+        super().__init__(
+            Path("unused"),
+            "counting.json",
+            cache=cache,
+            ttl=0,
+            stale_while_revalidate=stale_while_revalidate,
+        )
+        self.calls: List[int] = []
+
+    def fetch(self) -> Optional[Any]:
+        return self._cached(self._fetch_now)
+
+    def _fetch_now(self) -> int:
+        self.calls.append(len(self.calls) + 1)
+        return len(self.calls)
+
+
+def test_fetcher_serves_stale_while_revalidating(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    cache = MemoryCache()
+    fetcher = CountingFetcher(cache, stale_while_revalidate=3600)
+
+    assert fetcher.fetch() == 1
+    # Expired (ttl=0) but inside the window: old value now, refresh behind it
+    assert fetcher.fetch() == 1
+    fetcher.wait_for_revalidation()
+
+    assert cache.get_entry("counting").value == 2
+    assert fetcher.calls == [1, 2]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import github_is_my_cms
+
+# Cumulative import time budget for github_is_my_cms.cli, in microseconds.
+# It imports in ~50 ms when heavy modules are deferred and ~800 ms when not.
+IMPORT_BUDGET_US = 250_000
+
+HEAVY_MODULES = ("pydantic", "jinja2", "httpx", "bs4", "httpie", "orjson")
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    src_dir = Path(github_is_my_cms.__file__).resolve().parents[1]
+    env = {**os.environ, "PYTHONPATH": str(src_dir)}
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def test_cli_import_defers_heavy_modules() -> None:
+    result = _run_python(
+        "-c",
+        "import sys, github_is_my_cms.cli; print(' '.join(sys.modules))",
+    )
+    loaded = {name.split(".")[0] for name in result.stdout.split()}
+
+    assert loaded.isdisjoint(HEAVY_MODULES)
+
+
+def test_cli_import_time_is_within_budget() -> None:
+    result = _run_python("-X", "importtime", "-c", "import github_is_my_cms.cli")
+    cumulative = [
+        int(line.split("|")[1])
+        for line in result.stderr.splitlines()
+        if line.rstrip().endswith("| github_is_my_cms.cli")
+    ]
+
+    assert cumulative and cumulative[0] < IMPORT_BUDGET_US
+
+
+def test_version_runs_without_loading_the_build_stack() -> None:
+    result = _run_python(
+        "-c",
+        "import sys\n"
+        "from github_is_my_cms.cli import main\n"
+        "try:\n"
+        "    main(['--version'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('jinja2' in sys.modules)",
+    )
+
+    assert result.stdout.strip().endswith("False")
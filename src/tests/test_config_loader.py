@@ -133,3 +133,41 @@ def test_config_loader_converts_legacy_resumes(tmp_path: Path) -> None:
     assert config.resumes[0].id == "legacy-0"
     assert config.resumes[0].label == "Legacy Resume"
     assert config.resumes[0].format.value == "other"
+
+
+def test_config_loader_reuses_snapshot_until_a_source_changes(tmp_path: Path) -> None:
+    _write_minimal_config(tmp_path)
+    loader = ConfigLoader(tmp_path)
+
+    validated = loader.load()
+    key = loader.snapshot_key()
+    restored = ConfigLoader(tmp_path).load()
+
+    assert loader.snapshot_file.exists()
+    assert restored == validated
+    assert restored.projects[0].group == "Cli"
+
+    _write_text(
+        tmp_path / "data" / "projects.toml",
+        """
+        [[projects]]
+        slug = "project-two"
+        name = "Project Two"
+        description = "Replacement"
+        """,
+    )
+
+    assert loader.snapshot_key() != key
+    assert ConfigLoader(tmp_path).load().projects[0].slug == "project-two"
+    assert ConfigLoader(tmp_path, use_snapshot=False).load() == loader.load()
+
+
+def test_config_loader_rejects_a_tampered_snapshot(tmp_path: Path) -> None:
+    _write_minimal_config(tmp_path)
+    loader = ConfigLoader(tmp_path)
+    validated = loader.load()
+
+    key, _, _ = loader.snapshot_file.read_bytes().partition(b"\n")
+    loader.snapshot_file.write_bytes(key + b'\n{"identity": {"name": 1}}')
+
+    assert ConfigLoader(tmp_path).load() == validated
@@ -1,31 +1,26 @@
 from __future__ import annotations
 
 import json
+import tomllib
 from pathlib import Path
-from typing import Any, Dict, List
-
-import pytest
+from typing import Any, Callable, Dict
 
 from github_is_my_cms.data_sources import (
+    DataUpdater,
     GitHubFetcher,
+    GitHubGraphQLFetcher,
     PyPIDiscoveryFetcher,
     PyPIStatsFetcher,
 )
-
-
-class FakeResponse:
-    def __init__(self, payload: Dict[str, Any], status: int = 200):
-        self._payload = payload
-        self.status = status
-
-    def read(self) -> bytes:
-        return json.dumps(self._payload).encode("utf-8")
-
-    def __enter__(self) -> "FakeResponse":
-        return self
-
-    def __exit__(self, exc_type, exc, tb) -> None:
-        return None
+from github_is_my_cms.http_cache import HttpCache
+from tests.conftest import (
+    Responder,
+    StubGitHub,
+    StubPyPI,
+    StubRequest,
+    StubResponse,
+    StubServer,
+)
 
 
 def test_github_fetcher_uses_cache(tmp_path: Path) -> None:
@@ -38,36 +33,191 @@ def test_github_fetcher_uses_cache(tmp_path: Path) -> None:
     assert fetcher.fetch_repos() == payload
 
 
-def test_pypi_discovery_fetcher_uses_cache(tmp_path: Path) -> None:
+def test_pypi_discovery_fetcher_caches_each_user(tmp_path: Path) -> None:
     cache_dir = tmp_path / "cache"
     fetcher = PyPIDiscoveryFetcher(cache_dir)
-    payload = {"user": "tester", "packages": ["alpha", "bravo"]}
-
-    fetcher.cache_file.write_text(json.dumps(payload), encoding="utf-8")
+    for user, packages in (("tester", ["alpha", "bravo"]), ("other", ["charlie"])):
+        fetcher.cache.set(
+            fetcher.user_cache_key(user), {"user": user, "packages": packages}
+        )
 
+    # Switching users serves each from its own entry; neither is refetched
     assert fetcher.fetch_user_packages("tester") == ["alpha", "bravo"]
-
-
-def test_pypi_stats_fetcher_parses_keywords_and_repo(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    fetcher = PyPIStatsFetcher()
-    payload = {
-        "info": {
-            "version": "1.2.3",
-            "summary": "Demo package",
-            "home_page": "https://example.com",
-            "project_urls": {"Source": "https://github.com/example/demo"},
-            "keywords": "tag1, tag2",
-        }
-    }
-
-    def fake_urlopen(request: Any) -> FakeResponse:
-        return FakeResponse(payload)
-
-    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    assert fetcher.fetch_user_packages("other") == ["charlie"]
+    assert PyPIDiscoveryFetcher(cache_dir).fetch_user_packages("tester") == [
+        "alpha",
+        "bravo",
+    ]
+
+
+def test_pypi_stats_fetcher_parses_keywords_and_repo(stub_pypi: StubPyPI) -> None:
+    stub_pypi.add(
+        "demo",
+        version="1.2.3",
+        summary="Demo package",
+        home_page="https://example.com",
+        project_urls={"Source": "https://github.com/example/demo"},
+        keywords="tag1, tag2",
+    )
+    fetcher = PyPIStatsFetcher(base_url=stub_pypi.url_template, timeout=5.0)
 
     details = fetcher.fetch_details("demo")
 
     assert details["github_repo"] == "example/demo"
     assert details["tags"] == ["tag1", "tag2"]
+
+
+def test_pypi_stats_fetcher_fetch_many_concurrently(stub_pypi: StubPyPI) -> None:
+    names = [f"pkg-{i}" for i in range(200)]
+    for name in names:
+        stub_pypi.add(name, summary=f"Summary of {name}", keywords="cli, tools")
+
+    fetcher = PyPIStatsFetcher(base_url=stub_pypi.url_template, concurrency=20)
+    details = fetcher.fetch_many(names + ["missing"])
+
+    assert details["missing"] == {}
+    assert len([d for d in details.values() if d]) == 200
+    assert details["pkg-7"]["summary"] == "Summary of pkg-7"
+    assert details["pkg-7"]["tags"] == ["cli", "tools"]
+
+
+def test_pypi_stats_fetcher_retries_transient_errors(stub_pypi: StubPyPI) -> None:
+    stub_pypi.add("flaky", summary="Eventually works")
+    stub_pypi.add("broken")
+    stub_pypi.failures["flaky"] = 2
+    stub_pypi.failures["broken"] = 10
+
+    fetcher = PyPIStatsFetcher(base_url=stub_pypi.url_template, retries=2, backoff=0.01)
+    details = fetcher.fetch_many(["flaky", "broken"])
+
+    assert details["flaky"]["summary"] == "Eventually works"
+    assert details["broken"] == {}
+    assert stub_pypi.request_paths.count("/pypi/flaky/json") == 3
+
+
+def test_pypi_stats_fetcher_http_cache_revalidates_and_serves_fresh(
+    tmp_path: Path, stub_pypi: StubPyPI
+) -> None:
+    stub_pypi.add("cached", summary="Cached package")
+    url = stub_pypi.url_template
+
+    # TTL of zero: every run revalidates, unchanged documents come back as 304
+    stale_cache = HttpCache(tmp_path / "http.sqlite3", ttl=0)
+    fetcher = PyPIStatsFetcher(base_url=url, cache=stale_cache)
+    first = fetcher.fetch_many(["cached"])
+    second = fetcher.fetch_many(["cached"])
+    stale_cache.close()
+
+    assert first == second
+    assert stub_pypi.not_modified_count == 1
+
+    # Within the TTL the cache answers without any network call
+    fresh_cache = HttpCache(tmp_path / "http.sqlite3", ttl=3600)
+    third = PyPIStatsFetcher(base_url=url, cache=fresh_cache).fetch_many(["cached"])
+    fresh_cache.close()
+
+    assert third["cached"]["summary"] == "Cached package"
+    assert len(stub_pypi.request_paths) == 2
+
+
+def test_pypi_stats_fetcher_skips_and_does_not_cache_malformed_json(
+    tmp_path: Path, stub_server: Callable[[Responder], StubServer]
+) -> None:
+    def respond(request: StubRequest) -> StubResponse:
+        if request.path == "/pypi/truncated/json":
+            return StubResponse(body=b'{"info": {"summ', headers={"ETag": '"t"'})
+        return StubResponse.json({"info": {"summary": "Fine"}})
+
+    server = stub_server(respond)
+    cache = HttpCache(tmp_path / "http.sqlite3", ttl=0)
+    fetcher = PyPIStatsFetcher(
+        base_url=f"{server.base_url}/pypi/{{package}}/json", cache=cache
+    )
+
+    # One bad package does not abort the rest of the run
+    details = fetcher.fetch_many(["truncated", "fine"])
+
+    assert details["truncated"] == {}
+    assert details["fine"]["summary"] == "Fine"
+    assert cache.get(f"{server.base_url}/pypi/truncated/json") is None
+    cache.close()
+
+
+def test_github_graphql_fetcher_streams_every_page(stub_github: StubGitHub) -> None:
+    for i in range(250):
+        stub_github.add(f"repo-{i:03}", f"2024-01-01T00:{i // 60:02}:{i % 60:02}Z")
+    stub_github.add("topical", "2025-06-01T00:00:00Z", topics=["cli", "toml"])
+    fetcher = GitHubGraphQLFetcher(
+        token="test-token", api_url=stub_github.api_url, page_size=100
+    )
+
+    repos = fetcher.iter_repos("octo")
+    first = next(repos)
+    rest = list(repos)
+
+    assert first["name"] == "topical"
+    assert first["repositoryTopics"] == [{"name": "cli"}, {"name": "toml"}]
+    assert len(rest) == 250
+    assert stub_github.page_requests == 3
+    assert fetcher.last_updated_at == "2025-06-01T00:00:00Z"
+
+
+def test_update_projects_since_last_sync_fetches_only_changed_repos(
+    tmp_path: Path, stub_github: StubGitHub
+) -> None:
+    (tmp_path / "data").mkdir()
+    (tmp_path / "readme_cms.toml").write_text(
+        '[mode]\ncurrent = "project_promotion"\n', encoding="utf-8"
+    )
+    (tmp_path / "data" / "identity.toml").write_text(
+        'name = "Octo"\ntagline = "Cat"\ngithub_username = "octo"\n',
+        encoding="utf-8",
+    )
+    for i in range(5):
+        stub_github.add(f"repo-{i}", f"2024-01-0{i + 1}T00:00:00Z")
+
+    def sync() -> Dict[str, Dict[str, Any]]:
+        updater = DataUpdater(
+            tmp_path, github_token="test-token", github_api_url=stub_github.api_url
+        )
+        updater.gh_graphql.page_size = 2
+        updater.update_projects_from_github()
+        with open(tmp_path / "data" / "projects.toml", "rb") as f:
+            return {p["slug"]: p for p in tomllib.load(f)["projects"]}
+
+    assert len(sync()) == 5
+    full_sync_requests = stub_github.page_requests
+
+    stub_github.add("repo-1", "2024-02-01T00:00:00Z", description="Renamed")
+    projects = sync()
+
+    # Only the first page (newest first) is needed to find the one change
+    assert stub_github.page_requests == full_sync_requests + 1
+    assert projects["repo-1"]["description"] == "Renamed"
+    assert {p["status"] for p in projects.values()} == {"active"}
+
+
+def test_update_projects_skips_write_when_nothing_changed(
+    tmp_path: Path, stub_github: StubGitHub
+) -> None:
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "identity.toml").write_text(
+        'name = "Octo"\ntagline = "Cat"\ngithub_username = "octo"\n',
+        encoding="utf-8",
+    )
+    stub_github.add("only", "2024-01-01T00:00:00Z")
+    updater = DataUpdater(
+        tmp_path,
+        github_token="test-token",
+        github_api_url=stub_github.api_url,
+        full_sync=True,
+    )
+
+    first = updater.update_projects_from_github()
+    projects_file = tmp_path / "data" / "projects.toml"
+    written = projects_file.stat().st_mtime_ns
+    second = updater.update_projects_from_github()
+
+    assert first is not None and first.added == ["only"]
+    assert second is not None and not second.changed
+    assert projects_file.stat().st_mtime_ns == written
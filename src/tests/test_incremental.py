@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from textwrap import dedent
+
+from github_is_my_cms.incremental import VERSION_INPUT, IncrementalBuild
+
+
+def _write_text(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(dedent(content), encoding="utf-8")
+
+
+def _write_site_fixture(root: Path) -> None:
+    data_dir = root / "data"
+    templates_dir = root / "src" / "github_is_my_cms" / "templates" / "default"
+
+    _write_text(
+        root / "readme_cms.toml",
+        """
+        [mode]
+        current = "project_promotion"
+        """,
+    )
+    _write_text(
+        data_dir / "identity.toml",
+        """
+        name = "Example Person"
+        tagline = "Example Tagline"
+        """,
+    )
+    _write_text(
+        data_dir / "skills.toml",
+        """
+        [[skills]]
+        category = "Languages"
+        [[skills.skills]]
+        name = "Python"
+        """,
+    )
+    _write_text(
+        data_dir / "projects.toml",
+        """
+        [[projects]]
+        slug = "project-one"
+        name = "Project One"
+        description = "Example project"
+        tags = ["python"]
+        """,
+    )
+
+    _write_text(
+        templates_dir / "layouts" / "master.md.j2", "{% block body %}{% endblock %}\n"
+    )
+    _write_text(
+        templates_dir / "pages" / "README.en.md.j2",
+        """
+        {% extends "layouts/master.md.j2" %}
+        {% block body %}# {{ identity.name }}{% endblock %}
+        """,
+    )
+    _write_text(
+        templates_dir / "pages" / "index.html.j2", "<h1>{{ identity.name }}</h1>\n"
+    )
+    _write_text(
+        templates_dir / "pages" / "skill_detail.html.j2",
+        "{{ skill_name }}: {{ skill_projects | length }}\n",
+    )
+
+
+def test_incremental_build_skips_when_nothing_changed(tmp_path: Path) -> None:
+    _write_site_fixture(tmp_path)
+
+    first = IncrementalBuild(str(tmp_path)).run()
+    second = IncrementalBuild(str(tmp_path)).run()
+
+    assert first == {
+        "api",
+        "markdown:README.en.md.j2",
+        "html:index.html.j2",
+        "skills",
+    }
+    assert second == set()
+    assert (tmp_path / "docs" / "md" / "README.en.md").exists()
+    assert (tmp_path / "docs" / "skills" / "python.html").exists()
+    assert (
+        tmp_path / "docs" / "apis" / "projects" / "by-slug" / "project-one.json"
+    ).exists()
+
+
+def test_incremental_build_rebuilds_only_affected_units(tmp_path: Path) -> None:
+    _write_site_fixture(tmp_path)
+    IncrementalBuild(str(tmp_path)).run()
+
+    index_template = (
+        tmp_path
+        / "src"
+        / "github_is_my_cms"
+        / "templates"
+        / "default"
+        / "pages"
+        / "index.html.j2"
+    )
+    index_template.write_text("<h2>{{ identity.name }}</h2>\n", encoding="utf-8")
+
+    assert IncrementalBuild(str(tmp_path)).run() == {"html:index.html.j2"}
+    assert (tmp_path / "docs" / "index.html").read_text(
+        encoding="utf-8"
+    ) == "<h2>Example Person</h2>"
+
+    (tmp_path / "docs" / "md" / "README.en.md").unlink()
+    assert IncrementalBuild(str(tmp_path)).run() == {"markdown:README.en.md.j2"}
+
+
+def _edit_manifest_inputs(root: Path, unit: str, key: str, value: str) -> None:
+    manifest_file = root / ".cache" / "build_manifest.json"
+    manifest = json.loads(manifest_file.read_bytes())
+    manifest["units"][unit]["inputs"][key] = value
+    manifest_file.write_text(json.dumps(manifest), encoding="utf-8")
+
+
+def test_package_loader_and_version_are_build_inputs(tmp_path: Path) -> None:
+    _write_site_fixture(tmp_path)
+    IncrementalBuild(str(tmp_path)).run()
+
+    # As if static/search.js had been different when the site was last built
+    _edit_manifest_inputs(tmp_path, "api", "package:static/search.js", "stale")
+    assert IncrementalBuild(str(tmp_path)).run() == {"api"}
+
+    # As if the site had been built by another release
+    for unit in ("api", "skills"):
+        _edit_manifest_inputs(tmp_path, unit, VERSION_INPUT, "0.0.0")
+    assert IncrementalBuild(str(tmp_path)).run() == {"api", "skills"}
+
+
+def test_incremental_build_removes_outputs_of_deleted_entities(tmp_path: Path) -> None:
+    _write_site_fixture(tmp_path)
+    IncrementalBuild(str(tmp_path)).run()
+
+    _write_text(
+        tmp_path / "data" / "projects.toml",
+        """
+        [[projects]]
+        slug = "project-two"
+        name = "Project Two"
+        description = "Replacement project"
+        """,
+    )
+
+    rebuilt = IncrementalBuild(str(tmp_path)).run()
+
+    assert "api" in rebuilt
+    by_slug = tmp_path / "docs" / "apis" / "projects" / "by-slug"
+    assert (by_slug / "project-two.json").exists()
+    assert not (by_slug / "project-one.json").exists()
+
+
+def test_parallel_build_matches_serial_build(tmp_path: Path) -> None:
+    serial, parallel = tmp_path / "serial", tmp_path / "parallel"
+    _write_site_fixture(serial)
+    _write_site_fixture(parallel)
+
+    IncrementalBuild(str(serial), jobs=1).run()
+    IncrementalBuild(str(parallel), jobs=2).run()
+
+    def outputs(root: Path) -> dict[str, bytes]:
+        docs = root / "docs"
+        return {
+            p.relative_to(docs).as_posix(): p.read_bytes()
+            for p in docs.rglob("*")
+            if p.is_file() and p.suffix != ".json"
+        }
+
+    assert outputs(parallel) == outputs(serial)
+    assert "skills/python.html" in outputs(parallel)
+
+
+def test_full_rebuild_reports_unchanged_html_outputs(tmp_path: Path) -> None:
+    _write_site_fixture(tmp_path)
+    IncrementalBuild(str(tmp_path)).run()
+
+    rebuild = IncrementalBuild(str(tmp_path), force=True)
+    rebuild.run()
+
+    # HTML pages are byte-identical between runs and are not rewritten
+    assert rebuild.stats.unchanged >= 2
+    assert rebuild.stats.deleted == 0
+
+
+def test_up_to_date_build_still_removes_orphans(tmp_path: Path) -> None:
+    _write_site_fixture(tmp_path)
+    docs = tmp_path / "docs"
+    IncrementalBuild(str(tmp_path)).run()
+    _write_text(docs / "skills" / "stray.html", "stray")
+    _write_text(docs / "apis" / "stray.json", "{}")
+
+    noop = IncrementalBuild(str(tmp_path))
+    rebuilt = noop.run()
+
+    assert rebuilt == set()
+    assert not (docs / "skills" / "stray.html").exists()
+    assert not (docs / "apis" / "stray.json").exists()
+    assert (docs / "skills" / "python.html").exists()
+    assert noop.stats.deleted == 2
+
+
+def test_build_removes_orphans_but_keeps_hand_maintained_files(tmp_path: Path) -> None:
+    _write_site_fixture(tmp_path)
+    docs = tmp_path / "docs"
+    _write_text(docs / "skills" / "retired-skill.html", "old")
+    _write_text(docs / "apis" / "legacy" / "index.json", "{}")
+    _write_text(docs / "google-site-verification.html", "keep")
+    _write_text(docs / "swagger" / "index.html", "keep")
+
+    build = IncrementalBuild(str(tmp_path), force=True)
+    build.run()
+
+    assert not (docs / "skills" / "retired-skill.html").exists()
+    assert not (docs / "apis" / "legacy").exists()
+    assert (docs / "google-site-verification.html").exists()
+    assert (docs / "swagger" / "index.html").exists()
+    assert (docs / "skills" / "python.html").exists()
+    assert build.stats.deleted == 2
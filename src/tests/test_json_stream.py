@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import orjson
+
+from github_is_my_cms.json_stream import JsonArray, iter_json
+from github_is_my_cms.output_writer import OutputWriter
+
+
+def _refs(count: int):
+    return (
+        {"ref": f"/apis/projects/by-slug/p{i}.json", "rel": "item"}
+        for i in range(count)
+    )
+
+
+def test_streamed_document_matches_orjson(tmp_path: Path) -> None:
+    payload = {
+        "refs": JsonArray(_refs(2000)),
+        "meta": {"type": "projects", "count": 2000, "nested": {"empty": JsonArray([])}},
+        "_links": [{"rel": "self", "href": "/apis/projects/index.json"}],
+    }
+    chunks = list(iter_json(payload, chunk_size=4096))
+
+    expected = orjson.dumps(
+        {
+            "refs": list(_refs(2000)),
+            "meta": {"type": "projects", "count": 2000, "nested": {"empty": []}},
+            "_links": [{"rel": "self", "href": "/apis/projects/index.json"}],
+        }
+    )
+    assert b"".join(chunks) == expected
+    assert len(chunks) > 10
+    assert max(len(c) for c in chunks[:-1]) < 4096 + 200
+
+
+def test_write_chunks_compares_while_streaming(tmp_path: Path) -> None:
+    target = tmp_path / "apis" / "projects" / "index.json"
+    writer = OutputWriter()
+
+    assert writer.write_chunks(
+        target, iter_json({"refs": JsonArray(_refs(500))}, chunk_size=512)
+    )
+    os.utime(target, (0, 0))
+    assert not writer.write_chunks(
+        target, iter_json({"refs": JsonArray(_refs(500))}, chunk_size=100)
+    )
+    assert target.stat().st_mtime == 0
+
+    # a prefix of the old content is a change, not a match
+    assert writer.write_chunks(target, iter_json({"refs": JsonArray(_refs(499))}))
+    assert orjson.loads(target.read_bytes())["refs"][-1]["ref"].endswith("p498.json")
+    assert (writer.stats.written, writer.stats.unchanged) == (2, 1)
+    assert sorted(p.name for p in target.parent.iterdir()) == ["index.json"]
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from github_is_my_cms.cache import SQLiteCache
+from github_is_my_cms.link_checker import LinkChecker, LinkReport, collect_links
+from github_is_my_cms.models import (
+    CMSConfig,
+    CMSDirective,
+    Identity,
+    JobHuntingSettings,
+    LabeledLink,
+    ModeConfig,
+    Project,
+    PyPIPackage,
+    ResumeArtifact,
+    ResumeEntry,
+    SocialProfile,
+    TalkEntry,
+    WorkExperienceEntry,
+)
+from tests.conftest import Responder, StubRequest, StubResponse, StubServer
+
+
+def _respond(request: StubRequest) -> StubResponse:
+    if request.path.startswith("/no-head"):
+        # Servers that reject HEAD but serve the page
+        return StubResponse(status=405 if request.method == "HEAD" else 200)
+    if request.path.startswith("/moved"):
+        return StubResponse(status=301, headers={"Location": "/ok"})
+    if request.path.startswith("/missing"):
+        return StubResponse(status=404)
+    if request.path.startswith("/busy"):
+        return StubResponse(status=429)
+    return StubResponse(status=200, body=b"page")
+
+
+def test_head_falls_back_to_get_and_redirects_are_followed(
+    stub_server: Callable[[Responder], StubServer],
+) -> None:
+    server = stub_server(_respond)
+    base = server.base_url
+    urls = [f"{base}/ok", f"{base}/no-head", f"{base}/moved", f"{base}/missing"]
+
+    results = LinkChecker().check(urls)
+
+    assert {url: r.ok for url, r in results.items()} == {
+        f"{base}/ok": True,
+        f"{base}/no-head": True,
+        f"{base}/moved": True,
+        f"{base}/missing": False,
+    }
+    assert results[f"{base}/missing"].describe() == "HTTP 404"
+    assert [r.method for r in server.requests if r.path == "/no-head"] == [
+        "HEAD",
+        "GET",
+    ]
+
+
+def test_rate_limited_links_are_inconclusive_and_not_cached(
+    tmp_path: Path, stub_server: Callable[[Responder], StubServer]
+) -> None:
+    server = stub_server(_respond)
+    base = server.base_url
+    urls = [f"{base}/busy", f"{base}/missing"]
+    cache = SQLiteCache(tmp_path / "link_cache.sqlite3")
+    checker = LinkChecker(cache=cache, retries=1, backoff=0)
+
+    report = LinkReport(results=checker.check(urls))
+
+    assert [r.url for r in report.inconclusive] == [f"{base}/busy"]
+    assert [r.url for r in report.broken] == [f"{base}/missing"]
+    assert cache.get(f"{base}/busy") is None
+    assert cache.get(f"{base}/missing") is not None
+
+
+def test_unparseable_urls_are_reported_broken(
+    stub_server: Callable[[Responder], StubServer],
+) -> None:
+    server = stub_server(_respond)
+    urls = ["https://[::1", "/relative/page", "example.com/x", f"{server.base_url}/ok"]
+
+    report = LinkReport(results=LinkChecker().check(urls))
+
+    assert [r.url for r in report.broken] == urls[:3]
+    assert report.results["/relative/page"].describe() == "invalid URL (no host)"
+    assert report.results[f"{server.base_url}/ok"].ok
+
+
+def test_requests_per_host_are_limited(
+    stub_server: Callable[[Responder], StubServer],
+) -> None:
+    lock = threading.Lock()
+    in_flight = [0, 0]  # current, peak
+
+    def slow(request: StubRequest) -> StubResponse:
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return StubResponse(status=200)
+
+    server = stub_server(slow)
+    urls = [f"{server.base_url}/page/{i}" for i in range(12)]
+
+    results = LinkChecker(concurrency=32, per_host=3).check(urls)
+
+    assert all(r.ok for r in results.values())
+    assert in_flight[1] <= 3
+
+
+def test_cached_results_skip_the_network_until_they_expire(
+    tmp_path: Path, stub_server: Callable[[Responder], StubServer]
+) -> None:
+    server = stub_server(_respond)
+    base = server.base_url
+    cache = SQLiteCache(tmp_path / "link_cache.sqlite3")
+
+    LinkChecker(cache=cache).check([f"{base}/ok", f"{base}/missing"])
+    first = len(server.requests)
+    again = LinkChecker(cache=cache).check(
+        [f"{base}/ok", f"{base}/missing", f"{base}/new"]
+    )
+
+    assert [r.path for r in server.requests[first:]] == ["/new"]
+    assert again[f"{base}/ok"].cached and not again[f"{base}/new"].cached
+    assert not again[f"{base}/missing"].ok
+
+    # Broken links expire sooner, so only the 404 is checked again
+    cache.set(f"{base}/missing", cache.get(f"{base}/missing"), ttl=0)
+    second = len(server.requests)
+    LinkChecker(cache=cache).check([f"{base}/ok", f"{base}/missing"])
+    assert {r.path for r in server.requests[second:]} == {"/missing"}
+
+
+def test_links_are_collected_from_every_model() -> None:
+    config = CMSConfig(
+        identity=Identity(
+            name="Example Person",
+            tagline="Example Tagline",
+            profiles=[
+                SocialProfile(
+                    service="github",
+                    handle="example",
+                    url="https://github.com/example",
+                    same_as=["https://example.com/"],
+                )
+            ],
+            resumes=[ResumeEntry(label="2015", url="https://example.com/2015/")],
+            talks=[TalkEntry(title="Intro", url="https://talks.example/intro")],
+        ),
+        modes=ModeConfig(
+            job_hunting=JobHuntingSettings(resume_url="https://example.com/hire/")
+        ),
+        projects=[
+            Project(
+                slug="tool",
+                name="Tool",
+                description="A tool",
+                url="https://example.com/",
+                repository_url="https://github.com/example/tool",
+                cms=CMSDirective(package_links=["https://pypi.org/project/tool/"]),
+            )
+        ],
+        pypi_packages=[
+            PyPIPackage(package_name="tool", docs_url="https://tool.readthedocs.io/")
+        ],
+        work_experience=[
+            WorkExperienceEntry(
+                id="acme",
+                organization="Acme",
+                title="Engineer",
+                start_date="2020",
+                end_date="present",
+                links=[LabeledLink(label="site", url="https://acme.example/")],
+            )
+        ],
+        resumes=[ResumeArtifact(id="cv", label="CV", url="https://example.com/cv.pdf")],
+    )
+
+    assert collect_links(config) == {
+        "https://github.com/example": ["profile github (url)"],
+        "https://example.com/": ["profile github (same_as)", "project tool (url)"],
+        "https://example.com/2015/": ["identity resume 2015 (url)"],
+        "https://talks.example/intro": ["talk Intro (url)"],
+        "https://example.com/hire/": ["modes.job_hunting (resume_url)"],
+        "https://github.com/example/tool": ["project tool (repository_url)"],
+        "https://pypi.org/project/tool/": ["project tool (package_links)"],
+        "https://tool.readthedocs.io/": ["package tool (docs_url)"],
+        "https://acme.example/": ["experience acme (site)"],
+        "https://example.com/cv.pdf": ["resume cv (url)"],
+    }
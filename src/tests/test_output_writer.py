@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from github_is_my_cms.output_writer import OutputWriter
+
+
+def test_output_writer_skips_identical_content(tmp_path: Path) -> None:
+    target = tmp_path / "apis" / "identity.json"
+    writer = OutputWriter()
+
+    assert writer.write_text(target, '{"name": "a"}')
+    os.utime(target, (0, 0))
+
+    assert not writer.write_text(target, '{"name": "a"}')
+    assert target.stat().st_mtime == 0
+
+    # same size, different bytes
+    assert writer.write_text(target, '{"name": "b"}')
+    assert target.read_text(encoding="utf-8") == '{"name": "b"}'
+
+    assert writer.delete(target)
+    assert not writer.delete(target)
+    assert (writer.stats.written, writer.stats.unchanged, writer.stats.deleted) == (
+        2,
+        1,
+        1,
+    )
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+from github_is_my_cms.precompress import Precompressor
+
+
+def _page(text: str) -> str:
+    return f"<html><body>{text * 200}</body></html>"
+
+
+def test_only_changed_files_are_compressed_again(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    (docs / "apis").mkdir(parents=True)
+    (docs / "index.html").write_text(_page("home "), encoding="utf-8")
+    (docs / "about.html").write_text(_page("about "), encoding="utf-8")
+    (docs / "apis" / "identity.json").write_text(
+        json.dumps({"name": "x" * 1000}), encoding="utf-8"
+    )
+    (docs / "tiny.html").write_text("<p>hi</p>", encoding="utf-8")
+
+    first = Precompressor(docs).run()
+    second = Precompressor(docs).run()
+    (docs / "about.html").write_text(_page("changed "), encoding="utf-8")
+    third = Precompressor(docs).run()
+
+    assert (first.compressed, second.compressed, third.compressed) == (4, 0, 1)
+    assert gzip.decompress((docs / "about.html.gz").read_bytes()) == _page(
+        "changed "
+    ).encode("utf-8")
+    assert (docs / "apis" / "identity.json.gz").exists()
+
+    manifest = json.loads((docs / "precompressed.json").read_text())
+    assert manifest["files"]["tiny.html"]["variants"] == {}
+    assert not (docs / "tiny.html.gz").exists()
+
+
+def test_variants_of_removed_files_are_deleted(tmp_path: Path) -> None:
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "index.html").write_text(_page("home "), encoding="utf-8")
+    (docs / "old.html").write_text(_page("old "), encoding="utf-8")
+    Precompressor(docs).run()
+
+    (docs / "old.html").unlink()
+    stats = Precompressor(docs).run()
+
+    assert stats.removed >= 1
+    assert not list(docs.glob("old.html.*"))
+    assert (docs / "index.html.gz").exists()
+
+    Precompressor(docs).clear()
+    assert sorted(p.name for p in docs.iterdir()) == ["index.html"]
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from github_is_my_cms.incremental import IncrementalBuild
+from github_is_my_cms.profiling import Profiler, stage
+from tests.test_incremental import _write_site_fixture
+
+
+def test_profiled_build_reports_stages_templates_and_bytes(tmp_path: Path) -> None:
+    _write_site_fixture(tmp_path)
+
+    with Profiler(trace_memory=True) as profiler:
+        IncrementalBuild(str(tmp_path)).run()
+
+    summary = {s.name: s for s in profiler.summary()}
+    assert {"config load", "plan", "build_static_api", "build_skill_pages"} <= set(
+        summary
+    )
+    assert summary["render pages/index.html.j2"].calls == 1
+    assert summary["render pages/index.html.j2"].category == "template"
+    assert summary["build_html_pages"].bytes_written == len(
+        (tmp_path / "docs" / "index.html").read_bytes()
+    )
+    assert summary["build_skill_pages"].peak_memory > 0
+    totals = [s.total_ns for s in profiler.summary()]
+    assert totals == sorted(totals, reverse=True)
+    assert "render pages/index.html.j2" in profiler.format_summary()
+
+    trace_path = tmp_path / "trace.json"
+    profiler.write_chrome_trace(trace_path)
+    events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+    assert {e["ph"] for e in events} == {"X"}
+    assert len(events) == len(profiler.spans)
+
+
+def test_stage_is_a_no_op_without_an_active_profiler() -> None:
+    profiler = Profiler()
+    with stage("ignored"):
+        pass
+    with profiler:
+        with stage("recorded"):
+            pass
+
+    assert [s.name for s in profiler.spans] == ["recorded"]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from github_is_my_cms.project_sync import ProjectMerger
+
+
+def _repo(name: str, **fields: Any) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "description": fields.get("description", ""),
+        "url": f"https://github.com/octo/{name}",
+        "homepageUrl": fields.get("homepage"),
+        "isArchived": fields.get("archived", False),
+        "primaryLanguage": {"name": "Python"},
+        "repositoryTopics": [{"name": t} for t in fields.get("topics", [])],
+    }
+
+
+def _existing(slug: str, **fields: Any) -> Dict[str, Any]:
+    return {
+        "slug": slug,
+        "name": fields.get("name", slug),
+        "description": "",
+        "url": f"https://github.com/octo/{slug}",
+        "repository_url": f"https://github.com/octo/{slug}",
+        "tags": [],
+        "status": "active",
+        "primary_language": "Python",
+        **fields,
+    }
+
+
+def test_merger_reports_added_updated_gone_and_keeps_curated_fields() -> None:
+    existing = [
+        _existing("same"),
+        _existing("edited", name="Curated Name", cms={"suppress": True}),
+        _existing("deleted"),
+        {"slug": "elsewhere", "name": "Hosted elsewhere", "description": ""},
+    ]
+    merger = ProjectMerger(existing)
+
+    report = merger.merge(
+        iter([_repo("same"), _repo("edited", archived=True), _repo("brand-new")])
+    )
+
+    assert (report.added, report.updated, report.gone) == (
+        ["brand-new"],
+        ["edited"],
+        ["deleted"],
+    )
+    assert report.unchanged == 1
+    projects = {p["slug"]: p for p in merger.projects}
+    assert [p["slug"] for p in merger.projects] == sorted(projects)
+    assert projects["edited"]["status"] == "archived"
+    assert projects["edited"]["name"] == "Curated Name"
+    assert projects["edited"]["cms"] == {"suppress": True}
+    assert "status" not in projects["elsewhere"]
+
+
+def test_partial_merge_does_not_mark_missing_repos_gone() -> None:
+    merger = ProjectMerger([_existing("untouched")], mark_gone=False)
+
+    report = merger.merge([_repo("untouched", description="New text")])
+    report_without_changes = ProjectMerger(merger.projects, mark_gone=False).merge([])
+
+    assert report.updated == ["untouched"]
+    assert not report_without_changes.changed
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from textwrap import dedent
+
+from github_is_my_cms.builder_api import SiteBuilderAPI
+from github_is_my_cms.search_index import tokenize
+
+
+def _write_text(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(dedent(content), encoding="utf-8")
+
+
+def _write_site(root: Path) -> None:
+    _write_text(root / "readme_cms.toml", "")
+    _write_text(
+        root / "data" / "identity.toml",
+        """
+        name = "Example Person"
+        tagline = "Example Tagline"
+        """,
+    )
+    _write_text(
+        root / "data" / "skills.toml",
+        """
+        [[skills]]
+        category = "Languages"
+        [[skills.skills]]
+        name = "Python"
+        aliases = ["py"]
+        """,
+    )
+    _write_text(
+        root / "data" / "projects.toml",
+        """
+        [[projects]]
+        slug = "cafe-tool"
+        name = "Café Tool"
+        description = "Brews the coffee for the team"
+        url = "https://example.com/cafe"
+        tags = ["py"]
+
+        [[projects]]
+        slug = "secret"
+        name = "Secret"
+        description = "Hidden coffee"
+        cms = { suppress = true }
+        """,
+    )
+
+
+def _search_file(root: Path, rel: str):
+    return json.loads((root / "docs" / "apis" / "search" / rel).read_text("utf-8"))
+
+
+def test_tokenize_folds_accents_and_drops_noise() -> None:
+    assert tokenize("Café-Tool 2024: the AWS/Lambda API") == [
+        "cafe",
+        "tool",
+        "aws",
+        "lambda",
+        "api",
+    ]
+
+
+def test_search_index_is_sharded_by_term_prefix(tmp_path: Path) -> None:
+    _write_site(tmp_path)
+    SiteBuilderAPI(str(tmp_path)).build_static_api()
+
+    index = _search_file(tmp_path, "index.json")
+    assert index["doc_count"] == 2  # the project and the skill; suppressed left out
+    assert "co" in index["term_shards"]
+    assert (tmp_path / "docs" / "apis" / "search" / "search.js").exists()
+
+    docs = _search_file(tmp_path, "docs/0.json")
+    project_id = next(i for i, d in enumerate(docs) if d[0] == "project")
+    assert docs[project_id][1:3] == ["Café Tool", "https://example.com/cafe"]
+
+    coffee = _search_file(tmp_path, "terms/co.json")["coffee"]
+    assert coffee == [project_id, 1]
+    # the "py" tag is indexed under its canonical skill too
+    python = _search_file(tmp_path, "terms/py.json")["python"]
+    assert project_id in python[::2]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from github_is_my_cms.models import (
+    CMSConfig,
+    Identity,
+    Project,
+    PyPIPackage,
+    Skill,
+    SkillGroup,
+)
+from github_is_my_cms.skill_index import SkillIndex
+
+
+def _config() -> CMSConfig:
+    return CMSConfig(
+        identity=Identity(
+            name="Example",
+            tagline="Example",
+            skills=[
+                SkillGroup(
+                    category="Languages",
+                    skills=[
+                        Skill(name="Python", aliases=["py"]),
+                        Skill(name="Postgres", aliases=["psql", "PostgreSQL"]),
+                        Skill(name="Unused"),
+                    ],
+                )
+            ],
+        ),
+        projects=[
+            Project(slug="a", name="A", description="", tags=["PSQL"]),
+            Project(slug="b", name="B", description="", primary_language="Python"),
+            Project(
+                slug="c",
+                name="C",
+                description="",
+                tags=["py"],
+                related_skills=["Postgres"],
+            ),
+        ],
+        pypi_packages=[PyPIPackage(package_name="pkg")],
+    )
+
+
+def test_skill_index_matches_tags_languages_aliases_in_content_order() -> None:
+    config = _config()
+    index = SkillIndex(config)
+
+    python_items = index.projects_by_skill["Python"]
+    postgres_items = index.projects_by_skill["Postgres"]
+
+    assert [getattr(i, "slug", None) for i in python_items] == ["b", "c", None]
+    assert [i.slug for i in postgres_items] == ["a", "c"]
+    assert "Unused" not in index.projects_by_skill
+    assert config.identity.skills[0].skills[1].page_slug == "postgres"
+
+
+def test_skill_index_lookups_by_alias_and_slug() -> None:
+    index = SkillIndex(_config())
+
+    assert index.skill_lookup_map["postgresql"] == "postgres"
+    assert index.items_for_term("PSQL") == index.items_for_skill("Postgres")
+    assert index.items_for_skill_slug("python") == index.items_for_skill("Python")
+    assert index.items_for_term("nothing") == []
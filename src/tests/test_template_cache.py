@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from jinja2 import FileSystemLoader, ModuleLoader
+
+from github_is_my_cms.build_context import BuildContext
+from tests.test_incremental import _write_site_fixture
+
+
+def test_compiled_theme_is_used_until_a_template_changes(tmp_path: Path) -> None:
+    _write_site_fixture(tmp_path)
+    from_sources = BuildContext(str(tmp_path))
+    expected = from_sources.env.get_template("pages/index.html.j2").render()
+
+    from_sources.compile_theme()
+    compiled = BuildContext(str(tmp_path))
+
+    assert isinstance(compiled.env.loader, ModuleLoader)
+    assert compiled.env.get_template("pages/index.html.j2").render() == expected
+    assert any((tmp_path / ".cache" / "jinja").iterdir())
+
+    page = from_sources.templates_dir / "pages" / "index.html.j2"
+    page.write_text("<h2>{{ identity.name }}</h2>\n", encoding="utf-8")
+    stale = BuildContext(str(tmp_path))
+
+    assert isinstance(stale.env.loader, FileSystemLoader)
+    assert stale.env.get_template("pages/index.html.j2").render() == (
+        "<h2>Example Person</h2>"
+    )
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from github_is_my_cms.watch import (
+    RELOAD_PATH,
+    LiveRebuilder,
+    ReloadBroadcaster,
+    serve,
+)
+from tests.test_incremental import _write_site_fixture
+
+
+def test_live_rebuilder_rerenders_only_changed_units(tmp_path: Path) -> None:
+    _write_site_fixture(tmp_path)
+    rebuilder = LiveRebuilder(tmp_path)
+    rebuilder.build()
+    context = rebuilder.context
+
+    assert rebuilder.poll() == set()
+
+    page = context.templates_dir / "pages" / "index.html.j2"
+    page.write_text("<h2>{{ identity.name }}</h2>\n", encoding="utf-8")
+
+    assert rebuilder.poll() == {"html:index.html.j2"}
+    # Template edits keep the loaded config and environment
+    assert rebuilder.context is context
+    assert (tmp_path / "docs" / "index.html").read_text(encoding="utf-8") == (
+        "<h2>Example Person</h2>"
+    )
+
+    identity = tmp_path / "data" / "identity.toml"
+    identity.write_text(
+        'name = "Renamed Person"\ntagline = "Example Tagline"\n', encoding="utf-8"
+    )
+
+    assert "html:index.html.j2" in rebuilder.poll()
+    assert rebuilder.context is not context
+    assert "Renamed Person" in (tmp_path / "docs" / "index.html").read_text(
+        encoding="utf-8"
+    )
+
+
+def test_live_rebuilds_stamp_pages_with_the_rebuild_time(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_site_fixture(tmp_path)
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "0")
+    rebuilder = LiveRebuilder(tmp_path)
+    rebuilder.build()
+    page = rebuilder.context.templates_dir / "pages" / "index.html.j2"
+
+    # 2001-09-09, well clear of 1970 in any timezone
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1000000000")
+    page.write_text("<p>{{ generation.generated_at.year }}</p>\n", encoding="utf-8")
+    rebuilder.poll()
+
+    assert (tmp_path / "docs" / "index.html").read_text(encoding="utf-8") == (
+        "<p>2001</p>"
+    )
+
+
+def test_dev_server_injects_reload_script_and_streams_reloads(tmp_path: Path) -> None:
+    (tmp_path / "index.html").write_text("<body>hi</body>", encoding="utf-8")
+    broadcaster = ReloadBroadcaster()
+    httpd = serve(tmp_path, broadcaster, "127.0.0.1", 0)
+    base_url = "http://{}:{}".format(*httpd.server_address[:2])
+    try:
+        with urllib.request.urlopen(base_url + "/", timeout=5) as response:
+            page = response.read().decode("utf-8")
+        assert RELOAD_PATH in page
+        assert page.endswith("</body>")
+
+        with urllib.request.urlopen(base_url + RELOAD_PATH, timeout=5) as stream:
+            broadcaster.notify()
+            assert stream.readline() == b"data: reload\n"
+    finally:
+        httpd.shutdown()
+        httpd.server_close()